@@ -1,9 +1,47 @@
+# Imported first, so that (if enabled) all following imports are measured
+from . import profiling
+
+if profiling.IS_ENABLED:
+    profiling.start()
+
 from mutwo import cdd_events  # to activate monkey-patch
 from mutwo import cdd_parameters
 cdd_parameters.CDDNotationIndicatorCollection
 
 from . import configurations
+
+from mutwo import cdd_utilities
+
+cdd_utilities.configurations.ARTIFACT_STORE_PATH = (
+    f"{configurations.PATH.BUILDS.PICKLED}/artifacts.sqlite"
+)
+cdd_utilities.configurations.ARTIFACT_STORE_MAXIMA_SIZE_IN_BYTES = (
+    configurations.ARTIFACT_STORE_MAXIMA_SIZE_IN_BYTES
+)
+
+from mutwo import cdd_converters
+
+if configurations.USE_BUILD_CACHE:
+    cdd_converters.configurations.BUILD_CACHE_DIRECTORY_PATH = (
+        configurations.PATH.BUILDS.CACHE
+    )
+    cdd_converters.configurations.SYNTHESIS_CACHE_DIRECTORY_PATH = (
+        configurations.PATH.BUILDS.CACHE.SYNTHESES
+    )
+
+cdd_converters.configurations.CSOUND_ORCHESTRA_CACHE_DIRECTORY_PATH = (
+    configurations.PATH.BUILDS.CACHE.CSOUND_ORCHESTRAS
+)
+cdd_converters.configurations.IS_PREVIEW = configurations.PREVIEW
+cdd_converters.configurations.CSOUND_BACKEND = configurations.CSOUND_BACKEND
+cdd_converters.configurations.SYNTHESIS_JOB_COUNT = configurations.SYNTHESIS_JOB_COUNT
+cdd_converters.configurations.ISIS_BATCH_MAXIMA_DURATION = (
+    configurations.ISIS_BATCH_MAXIMA_DURATION
+)
+cdd_converters.configurations.IS_CSOUND_TELEMETRY_ENABLED = profiling.IS_ENABLED
+
 from . import constants
+from . import stages
 from . import chapters
 from . import utilities
 
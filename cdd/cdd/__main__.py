@@ -1,13 +1,35 @@
+import argparse
+import dataclasses
+import multiprocessing
 import os
+import sys
+import tempfile
+import time
+import traceback
 import typing
 import warnings
 
 import natsort
 from PyPDF2 import PdfFileMerger
 
+from mutwo import cdd_converters
+from mutwo import cdd_utilities
+
 import cdd
 
 
+@dataclasses.dataclass(frozen=True)
+class RenderJobResult(object):
+    chapter_name: str
+    render_method: str
+    exit_status: int
+    log_path: str
+    duration_in_seconds: float
+    # Only filled if profiling is enabled
+    measurement_tuple: tuple[cdd.profiling.Measurement, ...] = ()
+    csound_render_metrics_tuple: tuple[cdd_converters.CsoundRenderMetrics, ...] = ()
+
+
 def chapter_name_to_chapter(chapter_name: str) -> typing.Optional[cdd.chapters.Chapter]:
     try:
         return getattr(cdd.content, str(chapter_name)).CHAPTER
@@ -16,24 +38,270 @@ def chapter_name_to_chapter(chapter_name: str) -> typing.Optional[cdd.chapters.C
         return None
 
 
-def render(render_method_list):
-    for chapter_to_render_name in cdd.configurations.CHAPTER_TO_RENDER_TUPLE:
+def get_render_job_directory_path(chapter_name: str, render_method: str) -> str:
+    return f"{cdd.configurations.PATH.BUILDS.JOBS}/{chapter_name}_{render_method}"
+
+
+def render_job(
+    job: tuple[str, str, typing.Optional[tuple[str, ...]]]
+) -> RenderJobResult:
+    """Render one (chapter, render method, stage names) job in the current process.
+
+    All output (including output of external programs like csound or
+    lilypond) is redirected to a log file inside the jobs own directory.
+    Temporary files are saved in the scratch space of the jobs process,
+    which is removed once the job is done.
+    """
+
+    chapter_name, render_method, stage_name_tuple = job
+    job_directory_path = get_render_job_directory_path(chapter_name, render_method)
+    os.makedirs(job_directory_path, exist_ok=True)
+    log_path = f"{job_directory_path}/log.txt"
+
+    os.environ["TMPDIR"] = tempfile.tempdir = cdd_utilities.get_scratch_space().path
+
+    measurement_count = len(cdd.profiling.get_measurement_tuple())
+    csound_render_metrics_count = len(cdd_converters.get_csound_render_metrics_tuple())
+    start_time = time.time()
+    with open(log_path, "w") as log_file:
+        sys.stdout.flush()
+        sys.stderr.flush()
+        os.dup2(log_file.fileno(), sys.stdout.fileno())
+        os.dup2(log_file.fileno(), sys.stderr.fileno())
+        exit_status = 0
+        try:
+            if chapter := chapter_name_to_chapter(chapter_name):
+                with cdd.profiling.measure(
+                    f"{chapter_name}.{render_method}", "render_method"
+                ):
+                    getattr(chapter, render_method)(stage_name_tuple)
+            else:
+                exit_status = 1
+        except Exception:
+            traceback.print_exc()
+            exit_status = 1
+        finally:
+            sys.stdout.flush()
+            sys.stderr.flush()
+
+    return RenderJobResult(
+        chapter_name,
+        render_method,
+        exit_status,
+        log_path,
+        time.time() - start_time,
+        cdd.profiling.get_measurement_tuple()[measurement_count:],
+        cdd_converters.get_csound_render_metrics_tuple()[csound_render_metrics_count:],
+    )
+
+
+def get_csound_render_report() -> dict[str, typing.Any]:
+    """Summarize metrics of all csound renders of this run per orchestra."""
+
+    csound_orchestra_name_to_csound_render_metrics_list = {}
+    for csound_render_metrics in cdd_converters.get_csound_render_metrics_tuple():
+        csound_orchestra_name_to_csound_render_metrics_list.setdefault(
+            csound_render_metrics.csound_orchestra_name, []
+        ).append(csound_render_metrics)
+
+    csound_orchestra_name_to_summary = {}
+    for (
+        csound_orchestra_name,
+        csound_render_metrics_list,
+    ) in csound_orchestra_name_to_csound_render_metrics_list.items():
+        duration = sum(
+            csound_render_metrics.duration_in_seconds
+            for csound_render_metrics in csound_render_metrics_list
+        )
+        audio_duration = sum(
+            csound_render_metrics.audio_duration_in_seconds
+            for csound_render_metrics in csound_render_metrics_list
+        )
+        csound_orchestra_name_to_summary[csound_orchestra_name] = {
+            "render_count": len(csound_render_metrics_list),
+            "failed_render_count": sum(
+                csound_render_metrics.exit_status != 0
+                for csound_render_metrics in csound_render_metrics_list
+            ),
+            "duration_in_seconds": duration,
+            "audio_duration_in_seconds": audio_duration,
+            "realtime_factor": audio_duration / duration if duration else 0,
+            "maxima_resident_set_size_in_bytes": max(
+                csound_render_metrics.maxima_resident_set_size_in_bytes or 0
+                for csound_render_metrics in csound_render_metrics_list
+            ),
+        }
+
+    return {
+        # Slowest orchestras first
+        "orchestras": dict(
+            sorted(
+                csound_orchestra_name_to_summary.items(),
+                key=lambda name_and_summary: name_and_summary[1]["duration_in_seconds"],
+                reverse=True,
+            )
+        ),
+        "renders": [
+            dataclasses.asdict(csound_render_metrics)
+            for csound_render_metrics in cdd_converters.get_csound_render_metrics_tuple()
+        ],
+    }
+
+
+def render_parallel(
+    render_method_list: list[str],
+    job_count: int,
+    chapter_name_tuple: tuple[str, ...],
+    stage_name_tuple: typing.Optional[tuple[str, ...]] = None,
+) -> tuple[RenderJobResult, ...]:
+    job_list = [
+        (chapter_to_render_name, render_method, stage_name_tuple)
+        for chapter_to_render_name in chapter_name_tuple
+        for render_method in render_method_list
+    ]
+    # 'maxtasksperchild=1': Each job runs in a fresh process, so that
+    # global state (monkey patches, counters, temporary file locations)
+    # never leaks from one job into another one.
+    with multiprocessing.Pool(job_count, maxtasksperchild=1) as pool:
+        render_job_result_list = []
+        for render_job_result in pool.imap_unordered(render_job, job_list):
+            print(
+                f"{render_job_result.chapter_name}.{render_job_result.render_method}:",
+                "OK" if render_job_result.exit_status == 0 else "FAILED",
+                f"({round(render_job_result.duration_in_seconds, 2)}s,",
+                f"log: {render_job_result.log_path})",
+            )
+            render_job_result_list.append(render_job_result)
+            cdd.profiling.add_measurement_sequence(render_job_result.measurement_tuple)
+            cdd_converters.add_csound_render_metrics_sequence(
+                render_job_result.csound_render_metrics_tuple
+            )
+    return tuple(render_job_result_list)
+
+
+def render(
+    render_method_list,
+    job_count: int = 1,
+    chapter_name_tuple: typing.Optional[tuple[str, ...]] = None,
+    stage_name_tuple: typing.Optional[tuple[str, ...]] = None,
+):
+    if chapter_name_tuple is None:
+        chapter_name_tuple = cdd.configurations.CHAPTER_TO_RENDER_TUPLE
+
+    if job_count > 1:
+        return render_parallel(
+            render_method_list, job_count, chapter_name_tuple, stage_name_tuple
+        )
+
+    for chapter_to_render_name in chapter_name_tuple:
         chapter = chapter_name_to_chapter(chapter_to_render_name)
         print('chapter_to_render_name:', chapter_to_render_name)
         if chapter:
             for render_method in render_method_list:
                 print(render_method)
-                getattr(chapter, render_method)()
+                with cdd.profiling.measure(
+                    f"{chapter_to_render_name}.{render_method}", "render_method"
+                ):
+                    getattr(chapter, render_method)(stage_name_tuple)
+
+
+def print_stage_graph(
+    render_method_list,
+    chapter_name_tuple: tuple[str, ...],
+    stage_name_tuple: typing.Optional[tuple[str, ...]] = None,
+):
+    """Print which stages would be rendered (without rendering them)."""
+
+    for chapter_to_render_name in chapter_name_tuple:
+        chapter = chapter_name_to_chapter(chapter_to_render_name)
+        if chapter:
+            print(chapter_to_render_name)
+            for render_method in render_method_list:
+                print(f"    {render_method}")
+                stage_tuple = chapter.get_stage_tuple(render_method)
+                selected_stage_tuple = cdd.stages.select_stage_tuple(
+                    stage_tuple, stage_name_tuple
+                )
+                for stage in stage_tuple:
+                    print(
+                        "        [x]" if stage in selected_stage_tuple else "        [ ]",
+                        stage.name,
+                        *(
+                            ("<-", ", ".join(stage.dependency_name_tuple))
+                            if stage.dependency_name_tuple
+                            else ()
+                        ),
+                    )
 
 
-def concatenate_part_books():
+def get_stage_name_tuple(
+    render_method_list, chapter_name_tuple: tuple[str, ...]
+) -> tuple[str, ...]:
+    """Get names of all stages of the given chapters and render methods."""
+
+    stage_name_list = []
+    for chapter_to_render_name in chapter_name_tuple:
+        chapter = chapter_name_to_chapter(chapter_to_render_name)
+        if chapter:
+            for render_method in render_method_list:
+                for stage in chapter.get_stage_tuple(render_method):
+                    if stage.name not in stage_name_list:
+                        stage_name_list.append(stage.name)
+    return tuple(stage_name_list)
+
+
+def get_part_book_path(instrument_name: str) -> str:
+    return f"{cdd.configurations.PATH.BUILDS.SCORES}/cdd_{instrument_name}_part_book.pdf"
+
+
+def concatenate_part_book(
+    instrument_name_and_score_tuple: tuple[str, tuple[str, ...]]
+) -> tuple[str, bool]:
+    """Concatenate the scores of one instrument to its part book.
+
+    The part book is only concatenated again if the list of scores
+    or the content of any score changed since the last time (the
+    hashes of all scores are saved in the build cache).
+
+    :return: Path of the part book and if it had to be concatenated.
+    """
+
+    instrument_name, score_tuple = instrument_name_and_score_tuple
+    path = get_part_book_path(instrument_name)
+
+    if cdd.configurations.USE_BUILD_CACHE:
+        build_cache = cdd_utilities.BuildCache(cdd.configurations.PATH.BUILDS.CACHE)
+        build_key = cdd_utilities.get_stable_hash(
+            tuple((score, cdd_utilities.get_file_hash(score)) for score in score_tuple)
+        )
+        if build_cache.is_up_to_date(path, build_key):
+            return path, False
+    else:
+        build_cache = None
+
+    # Bookmarks aren't needed in part books and importing them
+    # means parsing the outline of each document.
+    merger = PdfFileMerger()
+    for pdf in score_tuple:
+        merger.append(pdf, import_bookmarks=False)
+    merger.write(path)
+    merger.close()
+
+    if build_cache:
+        build_cache.register(path, build_key)
+    return path, True
+
+
+def concatenate_part_books(
+    chapter_name_tuple: typing.Optional[tuple[str, ...]] = None, job_count: int = 1
+) -> tuple[str, ...]:
     instrument_name_to_score_list = {
         instrument_name: []
         for instrument_name in cdd.constants.INSTRUMENT_NAME_TO_SHORT_INSTRUMENT_NAME.keys()
     }
-    for chapter_to_render_name in natsort.natsorted(
-        cdd.configurations.CHAPTER_TO_RENDER_TUPLE
-    ):
+    if chapter_name_tuple is None:
+        chapter_name_tuple = cdd.configurations.CHAPTER_TO_RENDER_TUPLE
+    for chapter_to_render_name in natsort.natsorted(chapter_name_tuple):
         chapter = chapter_name_to_chapter(chapter_to_render_name)
         if chapter:
             for instrument_name in instrument_name_to_score_list.keys():
@@ -41,24 +309,143 @@ def concatenate_part_books():
                 if os.path.exists(notation_path):
                     instrument_name_to_score_list[instrument_name].append(notation_path)
 
-    part_book_path_list = []
-    for instrument_name, score_list in instrument_name_to_score_list.items():
-        if score_list:
-            path = f"{cdd.configurations.PATH.BUILDS.SCORES}/cdd_{instrument_name}_part_book.pdf"
-            merger = PdfFileMerger()
-            for pdf in score_list:
-                merger.append(pdf)
-            merger.write(path)
-            merger.close()
-            part_book_path_list.append(path)
+    instrument_name_and_score_tuple_list = [
+        (instrument_name, tuple(score_list))
+        for instrument_name, score_list in instrument_name_to_score_list.items()
+        if score_list
+    ]
+    # Each part book is concatenated in its own process, so that
+    # only the documents of one instrument are open at the same time.
+    if job_count > 1:
+        with multiprocessing.Pool(job_count) as pool:
+            part_book_path_and_is_concatenated_list = pool.map(
+                concatenate_part_book, instrument_name_and_score_tuple_list
+            )
+    else:
+        part_book_path_and_is_concatenated_list = list(
+            map(concatenate_part_book, instrument_name_and_score_tuple_list)
+        )
+
+    for path, is_concatenated in part_book_path_and_is_concatenated_list:
+        print(f"{path}:", "concatenated" if is_concatenated else "up-to-date")
+
+    return tuple(path for path, _ in part_book_path_and_is_concatenated_list)
 
 
-def main():
+def get_argument_parser() -> argparse.ArgumentParser:
+    argument_parser = argparse.ArgumentParser(
+        prog="cdd",
+        description=(
+            "Render notations and sounds of cdd chapters. Arguments "
+            "which aren't given default to 'cdd.configurations'."
+        ),
+    )
+    argument_parser.add_argument(
+        "chapter",
+        nargs="*",
+        help="chapters to render (default: CHAPTER_TO_RENDER_TUPLE)",
+    )
+    argument_parser.add_argument(
+        "-n", "--notation", action="store_true", help="render notations"
+    )
+    argument_parser.add_argument(
+        "-s", "--sound", action="store_true", help="render sounds"
+    )
+    argument_parser.add_argument(
+        "-t",
+        "--stage",
+        action="append",
+        dest="stage_list",
+        metavar="STAGE",
+        help=(
+            "only render the given stage; can be repeated "
+            "(default: all default stages, see '--dry-run')"
+        ),
+    )
+    argument_parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=None,
+        help="how many jobs run in parallel (default: RENDER_JOB_COUNT)",
+    )
+    argument_parser.add_argument(
+        "--stage-jobs",
+        type=int,
+        default=None,
+        help=(
+            "how many stages of one chapter run in parallel "
+            "(default: STAGE_JOB_COUNT)"
+        ),
+    )
+    argument_parser.add_argument(
+        "-p",
+        "--preview",
+        action="store_true",
+        default=None,
+        help=(
+            "render sounds faster with reduced quality to "
+            f"'{cdd.configurations.PATH.BUILDS.PREVIEW}' (default: PREVIEW)"
+        ),
+    )
+    argument_parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="print the stages which would be rendered and exit",
+    )
+    return argument_parser
+
+
+def main(argument_list: typing.Optional[list[str]] = None):
     import logging
     import warnings
 
+    argument_parser = get_argument_parser()
+    arguments = argument_parser.parse_args(argument_list)
+
+    chapter_name_tuple = (
+        tuple(arguments.chapter)
+        if arguments.chapter
+        else cdd.configurations.CHAPTER_TO_RENDER_TUPLE
+    )
+    render_method_list = [
+        render_method
+        for render_method, is_selected in (
+            ("render_notation", arguments.notation),
+            ("render_sound", arguments.sound),
+        )
+        if is_selected
+    ] or cdd.configurations.RENDER_METHOD_LIST
+    stage_name_tuple = tuple(arguments.stage_list) if arguments.stage_list else None
+    if stage_name_tuple is not None:
+        available_stage_name_tuple = get_stage_name_tuple(
+            render_method_list, chapter_name_tuple
+        )
+        if unknown_stage_name_tuple := tuple(
+            stage_name
+            for stage_name in stage_name_tuple
+            if stage_name not in available_stage_name_tuple
+        ):
+            argument_parser.error(
+                f"unknown stage(s): {', '.join(unknown_stage_name_tuple)} "
+                f"(available: {', '.join(available_stage_name_tuple)})"
+            )
+    job_count = (
+        arguments.jobs
+        if arguments.jobs is not None
+        else cdd.configurations.RENDER_JOB_COUNT
+    )
+
+    if arguments.stage_jobs is not None:
+        cdd.configurations.STAGE_JOB_COUNT = arguments.stage_jobs
+    if arguments.preview is not None:
+        cdd_converters.configurations.IS_PREVIEW = arguments.preview
+
+    if arguments.dry_run:
+        print_stage_graph(render_method_list, chapter_name_tuple, stage_name_tuple)
+        return
+
     logging.root.setLevel(logging.DEBUG)
-    render_method_list = cdd.configurations.RENDER_METHOD_LIST
 
     print("START CDD MAIN")
 
@@ -69,6 +456,19 @@ def main():
             RuntimeWarning,
         )
 
-    render(render_method_list)
-    if "render_notation" in render_method_list:
-        concatenate_part_books()
+    try:
+        render(render_method_list, job_count, chapter_name_tuple, stage_name_tuple)
+        if "render_notation" in render_method_list:
+            with cdd.profiling.measure("concatenate_part_books", "stage"):
+                concatenate_part_books(chapter_name_tuple, job_count)
+    finally:
+        if cdd.profiling.IS_ENABLED:
+            report_path, trace_path = cdd.profiling.write_report(
+                cdd.configurations.PATH.BUILDS.PROFILES,
+                {"csound_renders": get_csound_render_report()},
+            )
+            print(f"Wrote profile report to {report_path} and {trace_path}.")
+
+
+if __name__ == "__main__":
+    main()
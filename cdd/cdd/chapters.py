@@ -1,12 +1,22 @@
 import dataclasses
 import importlib
+import os
+import pickle
+import sys
+import typing
+import warnings
 
 import cdd
 
+from mutwo import cdd_converters
+from mutwo import cdd_events
 from mutwo import cdd_interfaces
 from mutwo import cdd_parameters
+from mutwo import cdd_utilities
 
-__all__ = ("Chapter",)
+__all__ = ("Chapter", "RENDER_METHOD_TO_MODULE_NAME", "construct_chapter")
+
+RENDER_METHOD_TO_MODULE_NAME = {"render_notation": "notations", "render_sound": "sounds"}
 
 
 @dataclasses.dataclass
@@ -26,13 +36,171 @@ class Chapter(cdd_interfaces.abc.Chapter):
         )
 
     def get_sound_file_path(self, instrument_name: str) -> str:
-        return f"{cdd.configurations.PATH.BUILDS.SOUND_FILES}/{self.index}_{instrument_name}.wav"
+        # Previews mustn't overwrite final renders
+        if cdd_converters.configurations.IS_PREVIEW:
+            sound_file_directory_path = cdd.configurations.PATH.BUILDS.PREVIEW.SOUND_FILES
+        else:
+            sound_file_directory_path = cdd.configurations.PATH.BUILDS.SOUND_FILES
+        return f"{sound_file_directory_path}/{self.index}_{instrument_name}.wav"
 
     def get_reaper_marker_path(self, reaper_marker_name: str) -> str:
         return f"{cdd.configurations.PATH.BUILDS.REAPER}/{self.index}_{reaper_marker_name}"
 
-    def render_notation(self):
-        importlib.import_module(f"cdd.content.{self.index}.notations").main(self)
+    def get_stage_tuple(self, render_method: str) -> tuple[cdd.stages.Stage, ...]:
+        module_name = RENDER_METHOD_TO_MODULE_NAME[render_method]
+        return cdd.stages.get_stage_tuple(
+            importlib.import_module(f"cdd.content.{self.index}.{module_name}")
+        )
+
+    def _render(
+        self, render_method: str, stage_name_tuple: typing.Optional[tuple[str, ...]]
+    ):
+        cdd.stages.render_stage_tuple(
+            self,
+            cdd.stages.select_stage_tuple(
+                self.get_stage_tuple(render_method), stage_name_tuple
+            ),
+            cdd.configurations.STAGE_JOB_COUNT,
+        )
+
+    def render_notation(self, stage_name_tuple: typing.Optional[tuple[str, ...]] = None):
+        self._render("render_notation", stage_name_tuple)
+
+    def render_sound(self, stage_name_tuple: typing.Optional[tuple[str, ...]] = None):
+        self._render("render_sound", stage_name_tuple)
+
+
+# Modules of the cdd package which are used to construct chapters
+# (relative to the cdd package directory).
+_CHAPTER_SOURCE_PATH_TUPLE = ("chapters.py", "utilities.py", "constants", "configurations")
+
+
+def _get_file_path_tuple(path: str, is_ignored=lambda _: False) -> tuple[str, ...]:
+    if os.path.isfile(path):
+        return (path,)
+    file_path_list = []
+    for directory_path, directory_name_list, file_name_list in os.walk(path):
+        directory_name_list[:] = sorted(
+            directory_name
+            for directory_name in directory_name_list
+            if directory_name != "__pycache__"
+            and not is_ignored(os.path.join(directory_path, directory_name))
+        )
+        file_path_list.extend(
+            file_path
+            for file_name in sorted(file_name_list)
+            if not (file_path := os.path.join(directory_path, file_name)).endswith(
+                ".pyc"
+            )
+            and not is_ignored(file_path)
+        )
+    return tuple(file_path_list)
+
+
+def _get_chapter_source_file_path_tuple(
+    chapter_class: type[Chapter],
+) -> tuple[str, ...]:
+    # e.g. 'cdd.content.12.content' -> 'cdd.content.12'
+    chapter_package = sys.modules[
+        ".".join(chapter_class.__module__.split(".")[:3])
+    ]
+    chapter_directory_path = os.path.dirname(chapter_package.__file__)
+    render_path_tuple = tuple(
+        os.path.join(chapter_directory_path, module_name)
+        for module_name in RENDER_METHOD_TO_MODULE_NAME.values()
+    )
+
+    # Notations and sounds are rendered from a constructed chapter:
+    # changing them mustn't invalidate the snapshot.
+    def is_render_path(path: str) -> bool:
+        return os.path.splitext(path)[0] in render_path_tuple
+
+    cdd_directory_path = os.path.dirname(cdd.__file__)
+    return (
+        _get_file_path_tuple(chapter_directory_path, is_render_path)
+        + tuple(
+            file_path
+            for path in _CHAPTER_SOURCE_PATH_TUPLE
+            for file_path in _get_file_path_tuple(
+                os.path.join(cdd_directory_path, path)
+            )
+        )
+        + tuple(
+            file_path
+            for module in (
+                cdd_converters,
+                cdd_events,
+                cdd_interfaces,
+                cdd_parameters,
+                cdd_utilities,
+            )
+            for file_path in _get_file_path_tuple(os.path.dirname(module.__file__))
+        )
+        + _get_file_path_tuple(cdd.configurations.PATH.CDD.DATA)
+    )
+
+
+def _get_source_hash(file_path_tuple: tuple[str, ...]) -> str:
+    """Get hash of the content of all files.
+
+    The data files (e.g. long field recordings) are too big to read
+    each time a chapter is loaded. Therefore the content hash is
+    saved in the artifact store for the size and modification time
+    of all files and only computed again if one of them changed.
+    """
+
+    stat_hash = cdd_utilities.get_stable_hash(
+        tuple(
+            (file_path, stat_result.st_size, stat_result.st_mtime_ns)
+            for file_path, stat_result in zip(
+                file_path_tuple, map(os.stat, file_path_tuple)
+            )
+        )
+    )
+    artifact_store = cdd_utilities.get_artifact_store()
+    is_found, source_hash = artifact_store.get("snapshot_source_hash", "", stat_hash)
+    if not is_found:
+        source_hash = cdd_utilities.get_stable_hash(
+            tuple(map(cdd_utilities.get_file_hash, file_path_tuple))
+        )
+        artifact_store.set("snapshot_source_hash", "", stat_hash, source_hash)
+    return source_hash
+
+
+def construct_chapter(chapter_class: type[Chapter], *args, **kwargs) -> Chapter:
+    """Construct chapter or restore it from its last snapshot.
+
+    :param chapter_class: The chapter class to initialise.
+    :param args: Arguments of the chapter class.
+    :param kwargs: Keyword arguments of the chapter class.
+
+    Constructing a chapter can take a long time. Therefore a snapshot
+    of each constructed chapter is saved in the artifact store (if
+    :const:`cdd.configurations.USE_CHAPTER_SNAPSHOTS` is ``True``).
+    The snapshot is restored as long as the source code of the
+    chapter (except for its notations and sounds), the cdd
+    constants and configurations, the cdd mutwo extensions and the
+    data files didn't change (files are only read again if their
+    size or modification time changed).
+    """
+
+    if not cdd.configurations.USE_CHAPTER_SNAPSHOTS:
+        return chapter_class(*args, **kwargs)
 
-    def render_sound(self):
-        importlib.import_module(f"cdd.content.{self.index}.sounds").main(self)
+    name = f"snapshot:{chapter_class.__module__}.{chapter_class.__qualname__}"
+    source_hash = _get_source_hash(_get_chapter_source_file_path_tuple(chapter_class))
+    input_hash = cdd_utilities.get_stable_hash(args, kwargs)
+    artifact_store = cdd_utilities.get_artifact_store()
+    is_found, chapter = artifact_store.get(name, source_hash, input_hash)
+    if not is_found:
+        chapter = chapter_class(*args, **kwargs)
+        try:
+            artifact_store.set(name, source_hash, input_hash, chapter)
+        # Chapters which keep references to lambdas or open files
+        # can't be pickled: they are simply constructed each time.
+        except (pickle.PicklingError, TypeError, AttributeError) as exception:
+            warnings.warn(
+                f"Can't save snapshot of chapter {chapter.index}: {exception}",
+                RuntimeWarning,
+            )
+    return chapter
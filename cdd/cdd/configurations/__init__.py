@@ -27,6 +27,13 @@ PATH.BUILDS.MIDI = "midi"
 PATH.BUILDS.SOUND_FILES = "sound_files"
 PATH.BUILDS.PICKLED = "pickled"
 PATH.BUILDS.REAPER = "reaper"
+PATH.BUILDS.JOBS = "jobs"
+PATH.BUILDS.CACHE = ".cache"
+PATH.BUILDS.CACHE.CSOUND_ORCHESTRAS = "csound_orchestras"
+PATH.BUILDS.CACHE.SYNTHESES = "syntheses"
+PATH.BUILDS.PROFILES = "profiles"
+PATH.BUILDS.PREVIEW = "preview"
+PATH.BUILDS.PREVIEW.SOUND_FILES = "sound_files"
 
 PATH.CDD = "cdd"
 PATH.CDD.DATA = "data"
@@ -41,8 +48,28 @@ PATH.ETC.ISIS = "isis"
 PATH.WALKMAN = "walkman"
 PATH.WALKMAN.TAPES = "tapes"
 
-FORCE_TO_COMPUTE_FADO = False
-FORCE_TO_COMPUTE_PESSOA = True
+# Skip csound & lilypond renders if their inputs didn't change
+# (and reuse singing / speaking segments which have already been synthesized)
+USE_BUILD_CACHE = True
+
+# Render sound files faster with reduced quality (lower sampling
+# rate, no convolution reverb, fewer resonator partials, no isis).
+# Preview sound files are saved in builds/preview.
+PREVIEW = False
+
+# How csound renders: "process" (one csound process per sound file)
+# or "api" (in this process via ctcsound, faster for many short sound
+# files like the intonation help of chapter 12).
+CSOUND_BACKEND = "process"
+
+# Constructed chapters are saved and restored on the next run as
+# long as their source code didn't change (see cdd.chapters.construct_chapter)
+USE_CHAPTER_SNAPSHOTS = True
+
+# Results of expensive computations are saved in one database
+# (see mutwo.cdd_utilities.compute_lazy). If the database is bigger,
+# the least recently used results are removed.
+ARTIFACT_STORE_MAXIMA_SIZE_IN_BYTES = 4 * 1024**3
 
 
 # IMPROVE_WESTERN_PITCH_LIST_ITERATION_COUNT = 150000
@@ -51,3 +78,25 @@ IMPROVE_WESTERN_PITCH_LIST_ITERATION_COUNT = 100
 # del os, Path
 
 RENDER_METHOD_LIST = ["render_notation", "render_sound"]
+
+# How many (chapter, render method) jobs run in parallel.
+# 1 = render everything serially in the main process.
+RENDER_JOB_COUNT = 1
+
+# How many independent stages of one chapter are rendered at the
+# same time (in threads, see cdd.stages).
+STAGE_JOB_COUNT = 4
+
+# How many segments of singing / speaking voices are synthesized at the
+# same time (isis needs ~1 GB memory per process).
+SYNTHESIS_JOB_COUNT = 2
+
+# How many seconds of singing are synthesized by one isis call (isis
+# loads its models for each call, which takes longer than to synthesize
+# short segments). None = one isis call per segment.
+# Trade-off: the isis output of a batched segment depends on all other
+# segments of its batch, therefore batched segments are never saved in
+# the synthesis cache. Editing one sentence re-synthesizes (and changes)
+# all segments of its batch. Batches only pay off for first renders
+# without a filled cache (e.g. on a new machine).
+ISIS_BATCH_MAXIMA_DURATION = None
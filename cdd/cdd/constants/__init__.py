@@ -2,3 +2,14 @@ from .lyrics import *
 from .pitches import *
 from .instruments import *
 from .fado import *
+
+
+# Forward constants which are only computed when they
+# are accessed (see for instance 'lyrics.CHAPTER_TO_LYRICS_DICT').
+def __getattr__(name: str):
+    for module in (lyrics, fado):
+        try:
+            return getattr(module, name)
+        except AttributeError:
+            pass
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
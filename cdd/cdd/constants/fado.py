@@ -1,7 +1,7 @@
 import os
 
+from mutwo import cdd_utilities
 from mutwo import core_events
-from mutwo import core_utilities
 from mutwo import midi_converters
 
 import cdd
@@ -17,10 +17,7 @@ def _get_fado_event(
     return midi_file_to_event.convert(fado_midi_file_path)
 
 
-@core_utilities.compute_lazy(
-    path=f"{cdd.configurations.PATH.BUILDS.PICKLED}/fado.pickle",
-    force_to_compute=cdd.configurations.FORCE_TO_COMPUTE_FADO,
-)
+@cdd_utilities.compute_lazy()
 def _get_fado_event_tuple(path: str):
     midi_file_to_event = midi_converters.MidiFileToEvent()
     return tuple(
@@ -34,4 +31,19 @@ def _get_fado_event_tuple(path: str):
     )
 
 
-# FADO_EVENT_TUPLE = _get_fado_event_tuple(cdd.configurations.PATH.CDD.DATA.FADO)
+_LAZY_CONSTANT_NAME_TO_GETTER = {
+    "FADO_EVENT_TUPLE": lambda: _get_fado_event_tuple(
+        cdd.configurations.PATH.CDD.DATA.FADO
+    )
+}
+
+
+# Only parse midi files when the fado events are accessed for the
+# first time.
+def __getattr__(name: str):
+    try:
+        getter = _LAZY_CONSTANT_NAME_TO_GETTER[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = globals()[name] = getter()
+    return value
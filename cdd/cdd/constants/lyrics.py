@@ -1,5 +1,6 @@
 from mutwo import cdd_converters
-from mutwo import core_utilities
+from mutwo import cdd_parameters
+from mutwo import cdd_utilities
 from mutwo import music_parameters
 
 import cdd
@@ -8,14 +9,31 @@ import cdd
 music_parameters.configurations.DEFAULT_LANGUAGE_CODE = LANGUAGE_CODE = "mb-pt1"
 
 
-CHAPTER_TO_LYRICS_DICT = core_utilities.compute_lazy(
-    f"{cdd.configurations.PATH.BUILDS.PICKLED}/chapter_to_lyrics.pickled",
-    force_to_compute=cdd.configurations.FORCE_TO_COMPUTE_PESSOA,
-)(
-    lambda: {
-        chapter: cdd_converters.LyricsStringToLyrics()(content)
-        for chapter, content in cdd_converters.EpubToDict()(
-            cdd.configurations.PATH.CDD.DATA.PESSOA.BOOK
-        ).items()
-    }
-)()
+def _get_chapter_to_lyrics_dict() -> dict[
+    str, cdd_parameters.NestedLanguageBasedLyric
+]:
+    return cdd_utilities.compute_lazy(
+        name=f"{__name__}.CHAPTER_TO_LYRICS_DICT",
+        file_path_tuple=(cdd.configurations.PATH.CDD.DATA.PESSOA.BOOK,),
+    )(
+        lambda: {
+            chapter: cdd_converters.LyricsStringToLyrics()(content)
+            for chapter, content in cdd_converters.EpubToDict()(
+                cdd.configurations.PATH.CDD.DATA.PESSOA.BOOK
+            ).items()
+        }
+    )()
+
+
+_LAZY_CONSTANT_NAME_TO_GETTER = {"CHAPTER_TO_LYRICS_DICT": _get_chapter_to_lyrics_dict}
+
+
+# Parsing and hyphenating the complete book is slow: only do it
+# when the lyrics are accessed for the first time.
+def __getattr__(name: str):
+    try:
+        getter = _LAZY_CONSTANT_NAME_TO_GETTER[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = globals()[name] = getter()
+    return value
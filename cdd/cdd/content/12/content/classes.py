@@ -11,6 +11,7 @@ import quicktions as fractions
 
 from mutwo import cdd_converters
 from mutwo import cdd_interfaces
+from mutwo import cdd_utilities
 from mutwo import common_generators
 from mutwo import core_converters
 from mutwo import core_events
@@ -383,10 +384,7 @@ class GroupCollection(object):
     def _add_soprano_lyric(
         self, soprano_sequential_event: core_events.TaggedSequentialEvent
     ):
-        @core_utilities.compute_lazy(
-            path=f"{cdd.configurations.PATH.BUILDS.PICKLED}/12_soprano_lyric_distribution.pickle",
-            force_to_compute=False,
-        )
+        @cdd_utilities.compute_lazy()
         def distribute_sentence(sentence_to_distribute, event_count):
             return cdd_converters.SentenceAndBeatCountToDistributedSentenceTuple()(
                 sentence_to_distribute, event_count
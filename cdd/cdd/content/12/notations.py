@@ -898,7 +898,8 @@ def notate_noise(chapter: cdd.chapters.Chapter):
     pass
 
 
-def main(chapter: cdd.chapters.Chapter):
-    # notate_soprano(chapter)
-    # notate_clarinet(chapter)
-    notate_clavichord(chapter)
+STAGE_TUPLE = (
+    cdd.stages.Stage("soprano", notate_soprano, is_default=False),
+    cdd.stages.Stage("clarinet", notate_clarinet, is_default=False),
+    cdd.stages.Stage("clavichord", notate_clavichord),
+)
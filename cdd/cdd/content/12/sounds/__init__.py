@@ -3,7 +3,15 @@ import cdd
 from . import instruments
 from . import tapes
 
-
-def main(chapter: cdd.chapters.Chapter):
-    tapes.main(chapter)
-    instruments.main(chapter)
+STAGE_TUPLE = (
+    cdd.stages.Stage("chords", tapes.chords.main),
+    cdd.stages.Stage("midi_tones", tapes.render_midi_tones),
+    # 'render_midi_tones' writes the metronome, too
+    cdd.stages.Stage(
+        "metronome", tapes.render_metronome, dependency_name_tuple=("midi_tones",)
+    ),
+    cdd.stages.Stage("intonation_help", tapes.render_intonation_help),
+    cdd.stages.Stage("soprano", instruments.render_soprano),
+    cdd.stages.Stage("clarinet", instruments.render_clarinet),
+    cdd.stages.Stage("clavichord", instruments.render_clavichord),
+)
@@ -130,9 +130,3 @@ def render_clavichord(chapter):
         ),
         midi_file_path,
     )
-
-
-def main(chapter):
-    render_soprano(chapter)
-    render_clarinet(chapter)
-    render_clavichord(chapter)
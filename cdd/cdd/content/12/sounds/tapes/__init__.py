@@ -103,6 +103,7 @@ def render_intonation_help(chapter):
     sound_file_path = chapter.get_sound_file_path("intonation")
     event_to_sound_file.convert(simultaneous_event, sound_file_path)
 
+    future_list = []
     note_index = 0
     intonation_directory = "12_intonation"
     intonation_file_path = (
@@ -124,19 +125,19 @@ def render_intonation_help(chapter):
             )
             sound_file_path = f"{intonation_file_path}/12_intonation_{note_index}.wav"
             sound_file_path_soprano = f"{intonation_soprano_file_path}/12_intonation_soprano_pitch_{note_index}.wav"
-            event_to_sound_file.convert(new_simultaneous_event, sound_file_path)
-            event_to_sound_file.convert(note_like, sound_file_path_soprano)
+            future_list.extend(
+                (
+                    event_to_sound_file.submit(new_simultaneous_event, sound_file_path),
+                    event_to_sound_file.submit(note_like, sound_file_path_soprano),
+                )
+            )
             note_index += 1
 
+    for future in future_list:
+        future.result()
+
     # Copy data for walkman file
     copy_tree(
         intonation_file_path,
         f"{configurations.PATH.WALKMAN.TAPES}/{intonation_directory}",
     )
-
-
-def main(chapter):
-    chords.main(chapter)
-    render_midi_tones(chapter)
-    render_metronome(chapter)
-    render_intonation_help(chapter)
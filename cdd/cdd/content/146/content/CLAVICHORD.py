@@ -36,6 +36,7 @@ import numpy as np
 import ranges
 import quicktions as fractions
 
+from mutwo import cdd_utilities
 from mutwo import common_generators
 from mutwo import core_converters
 from mutwo import core_events
@@ -43,7 +44,6 @@ from mutwo import core_utilities
 from mutwo import music_events
 from mutwo import music_parameters
 
-from cdd import configurations
 from cdd import constants
 from cdd import utilities
 
@@ -1021,20 +1021,12 @@ def get_sequential_event_tuple(clavichord_ambitus):
     return sequential_event_tuple
 
 
-@core_utilities.compute_lazy(
-    path=f"{configurations.PATH.BUILDS.PICKLED}/146_clavichord_version_0.pickle",
-    force_to_compute=False,
-    # force_to_compute=True,
-)
+@cdd_utilities.compute_lazy()
 def _get_sequential_event_tuple_version_0():
     return get_sequential_event_tuple(old_clavichord_ambitus)
 
 
-@core_utilities.compute_lazy(
-    path=f"{configurations.PATH.BUILDS.PICKLED}/146_clavichord_version_1.pickle",
-    force_to_compute=False,
-    # force_to_compute=True,
-)
+@cdd_utilities.compute_lazy()
 def _get_sequential_event_tuple_version_1():
     return get_sequential_event_tuple(constants.CLAVICHORD_AMBITUS)
 
@@ -658,8 +658,9 @@ def notate_noise(chapter: cdd.chapters.Chapter):
     latex_document.generate_pdf(notation_file_path, clean_tex=False)
 
 
-def main(chapter: cdd.chapters.Chapter):
-    notate_noise(chapter)
-    notate_clarinet(chapter)
-    notate_clavichord(chapter)
-    notate_soprano(chapter)
+STAGE_TUPLE = (
+    cdd.stages.Stage("noise", notate_noise),
+    cdd.stages.Stage("clarinet", notate_clarinet),
+    cdd.stages.Stage("clavichord", notate_clavichord),
+    cdd.stages.Stage("soprano", notate_soprano),
+)
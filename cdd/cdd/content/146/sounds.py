@@ -9,7 +9,6 @@ from mutwo import cdd_converters
 from mutwo import core_converters
 from mutwo import core_events
 from mutwo import isis_converters
-from mutwo import mbrola_converters
 from mutwo import midi_converters
 from mutwo import music_converters
 from mutwo import music_events
@@ -39,6 +38,10 @@ def render_soprano(chapter: cdd.chapters.Chapter):
             "-sv MS",
             "--seed 100",
         ),
+        # Repetitions of a phrase only differ in their tempo: synthesize
+        # each phrase once and time-stretch it to all repetitions.
+        maxima_time_stretch_ratio=chapter.SOPRANO.tempo_range.end
+        / chapter.SOPRANO.tempo_range.start,
     )
 
     grace_note_converter = music_converters.GraceNotesConverter()
@@ -90,7 +93,15 @@ def render_soprano(chapter: cdd.chapters.Chapter):
                 )
 
     path = chapter.get_sound_file_path("soprano")
-    sequential_event_to_singing_synthesis.convert(soprano, path)
+    safe_synthesis_statistic = sequential_event_to_singing_synthesis.convert(
+        soprano, path
+    )
+    print(
+        f"render_soprano: {safe_synthesis_statistic.saved_synthesis_count} of "
+        f"{safe_synthesis_statistic.segment_count} isis calls saved "
+        f"({safe_synthesis_statistic.derived_segment_count} repeated phrases, "
+        f"{safe_synthesis_statistic.cached_segment_count} cached segments)"
+    )
 
 
 def render_clarinet(chapter: cdd.chapters.Chapter):
@@ -139,14 +150,7 @@ def render_clavichord(chapter: cdd.chapters.Chapter):
     event_to_midi_file = midi_converters.EventToMidiFile()
 
     sequential_event_to_speaking_synthesis = cdd_converters.EventToSafeSpeakingSynthesis(
-        mbrola_converters.EventToSpeakSynthesis(
-            voice=voxpopuli.Voice(lang="pt"),
-            event_to_phoneme_list=mbrola_converters.EventToPhonemeList(
-                simple_event_to_pitch=lambda *_, **__: music_parameters.WesternPitch(
-                    random.choice(["b", "bqs", "bqf"]), 3
-                ),
-            ),
-        )
+        voxpopuli.Voice(lang="pt")
     )
 
     max_spoken_work_duration = 2
@@ -175,7 +179,7 @@ def render_clavichord(chapter: cdd.chapters.Chapter):
             lambda event0, event1: cdd.utilities.is_rest(event0)
             and cdd.utilities.is_rest(event1)
         )
-        voice.extend(to_mbrola_friendly(new_voice_sequential_event.copy()))
+        voice.extend(new_voice_sequential_event.copy())
 
         new_sequential_event = sequential_event.copy()
         # * 2 because default tempo is 120 bpm
@@ -192,7 +196,15 @@ def render_clavichord(chapter: cdd.chapters.Chapter):
     )
 
     event_to_midi_file.convert(clavichord, midi_file_path)
-    # sequential_event_to_speaking_synthesis(voice, sound_file_path)
+    # sequential_event_to_speaking_synthesis(
+    #     to_mbrola_friendly.convert_to_phoneme_stream(
+    #         voice,
+    #         simple_event_to_pitch=lambda _: music_parameters.WesternPitch(
+    #             random.choice(["b", "bqs", "bqf"]), 3
+    #         ),
+    #     ),
+    #     sound_file_path,
+    # )
 
 
 def render_noise(chapter: cdd.chapters.Chapter):
@@ -223,8 +235,10 @@ def render_noise(chapter: cdd.chapters.Chapter):
     )
 
 
-def main(chapter: cdd.chapters.Chapter):
-    render_noise(chapter)
-    render_clavichord(chapter)
-    render_clarinet(chapter)
-    # render_soprano(chapter)  # a bit slowly, therefore only render if necessary
+STAGE_TUPLE = (
+    cdd.stages.Stage("noise", render_noise),
+    cdd.stages.Stage("clavichord", render_clavichord),
+    cdd.stages.Stage("clarinet", render_clarinet),
+    # a bit slowly, therefore only render if necessary
+    cdd.stages.Stage("soprano", render_soprano, is_default=False),
+)
@@ -1,3 +1,5 @@
+import cdd
+
 from . import content
 
-CHAPTER = content.Chapter(12)
+CHAPTER = cdd.chapters.construct_chapter(content.Chapter, 12)
@@ -1,15 +1,11 @@
 from mutwo import cdd_converters
+from mutwo import cdd_utilities
 from mutwo import common_generators
 from mutwo import core_events
 from mutwo import core_generators
-from mutwo import core_utilities
 
 
 def main(chapter) -> core_events.SequentialEvent:
-    COMPUTE_ALL = False  # except rms_envelope_tuple
-    COMPUTE_BELL_SEQUENTIAL_EVENT = False
-    COMPUTE_RMS_ENVELOPE = False
-
     attack_dynamic_choice = core_generators.DynamicChoice(
         [0, 1],
         [
@@ -175,33 +171,29 @@ def main(chapter) -> core_events.SequentialEvent:
         )
     )
 
-    attack_sequential_event_tuple = core_utilities.compute_lazy(
-        "builds/pickled/31_bell_attack_sequential_event.pickle",
-        force_to_compute=False or COMPUTE_ALL,
+    attack_sequential_event_tuple = cdd_utilities.compute_lazy(
+        name=f"{__name__}.attack_sequential_event_tuple"
     )(
-        lambda: tuple(
+        lambda mono_sound_file_collection: tuple(
             sound_file_to_dynamic_attack_sequential_event.convert(
                 sound_file,
                 attack_sequential_event_selector_envelope=attack_sequential_event_selector_envelope,
             )
-            for sound_file in chapter.constants.MONO_SOUND_FILE_COLLECTION
+            for sound_file in mono_sound_file_collection
         )
-    )()
+    )(chapter.constants.MONO_SOUND_FILE_COLLECTION)
 
-    rms_envelope_tuple = core_utilities.compute_lazy(
-        "builds/pickled/31_bell_rms_envelope_tuple.pickle",
-        force_to_compute=COMPUTE_RMS_ENVELOPE,
+    rms_envelope_tuple = cdd_utilities.compute_lazy(
+        name=f"{__name__}.rms_envelope_tuple"
     )(
-        lambda: tuple(
-            sound_file.rms_envelope
-            for sound_file in chapter.constants.MONO_SOUND_FILE_COLLECTION
+        lambda mono_sound_file_collection: tuple(
+            sound_file.rms_envelope for sound_file in mono_sound_file_collection
         )
-    )()
+    )(chapter.constants.MONO_SOUND_FILE_COLLECTION)
 
     # Generate bell sequential event
-    bell_sequential_event_blueprint = core_utilities.compute_lazy(
-        "builds/pickled/31_bell_sequential_event_blueprint.pickle",
-        force_to_compute=False or COMPUTE_ALL or COMPUTE_BELL_SEQUENTIAL_EVENT,
+    bell_sequential_event_blueprint = cdd_utilities.compute_lazy(
+        name=f"{__name__}.bell_sequential_event_blueprint"
     )(
         lambda: cdd_converters.AttackDynamicChoiceAndAttackSequentialEventTupleToBellSequentialEventBlueprint(
             cdd_converters.AbsoluteBellPositionToPanning()
@@ -210,9 +202,8 @@ def main(chapter) -> core_events.SequentialEvent:
         )
     )()
 
-    bell_sequential_event = core_utilities.compute_lazy(
-        "builds/pickled/31_bell_sequential_event.pickle",
-        force_to_compute=False or COMPUTE_ALL or COMPUTE_BELL_SEQUENTIAL_EVENT,
+    bell_sequential_event = cdd_utilities.compute_lazy(
+        name=f"{__name__}.bell_sequential_event"
     )(
         lambda: cdd_converters.BellSequentialEventBlueprintToBellSequentialEvent(
             pitch_dynamic_choice,
@@ -222,13 +213,12 @@ def main(chapter) -> core_events.SequentialEvent:
         ).convert(bell_sequential_event_blueprint)
     )()
 
-    bell_csound_sequential_event = core_utilities.compute_lazy(
-        "builds/pickled/31_bell_csound_sequential_event.pickle",
-        force_to_compute=False or COMPUTE_ALL or COMPUTE_BELL_SEQUENTIAL_EVENT,
+    bell_csound_sequential_event = cdd_utilities.compute_lazy(
+        name=f"{__name__}.bell_csound_sequential_event"
     )(
-        lambda: cdd_converters.BellSequentialEventToBellCsoundSequentialEvent(
-            chapter.constants.BELL_COLLECTION, bell_sample_family_dynamic_choice
+        lambda bell_collection: cdd_converters.BellSequentialEventToBellCsoundSequentialEvent(
+            bell_collection, bell_sample_family_dynamic_choice
         ).convert(bell_sequential_event)
-    )()
+    )(chapter.constants.BELL_COLLECTION)
 
     return bell_csound_sequential_event
@@ -1,5 +1,6 @@
 import functools
 import operator
+import sys
 
 from mutwo import cdd_converters
 from mutwo import cdd_parameters
@@ -9,47 +10,72 @@ SOUND_FILE_PATH = "cdd/data/31/field_recording_5_channel.wav"
 
 SOUND_FILE = cdd_parameters.SoundFile(SOUND_FILE_PATH)
 
-MONO_SOUND_FILE_COLLECTION = cdd_converters.SoundFileToMonoSoundFileContainer()(
-    SOUND_FILE
-)
-
-CHAPTER_DURATION_IN_SECONDS = SOUND_FILE.duration_in_seconds
-
 # For bell synthesis
 BELL_DIRECTORY_PATH = "etc/samples/bells"
-BELL_COLLECTION = cdd_converters.BellCollection(
-    [
-        cdd_converters.Bell.from_directory_path_and_pitch(directory_path, pitch)
-        for directory_path, pitch in (
-            (
-                f"{BELL_DIRECTORY_PATH}/0_a",
-                music_parameters.WesternPitch("a", octave=5),
-            ),
-            (
-                f"{BELL_DIRECTORY_PATH}/1_as_m32",
-                music_parameters.WesternPitch(10.7, octave=5),
-            ),
-            (
-                f"{BELL_DIRECTORY_PATH}/2_d",
-                music_parameters.WesternPitch("d", octave=5),
-            ),
-            (
-                f"{BELL_DIRECTORY_PATH}/3_fs_p43",
-                music_parameters.WesternPitch(6.43, octave=6),
-            ),
-            (
-                f"{BELL_DIRECTORY_PATH}/4_a_m40",
-                music_parameters.WesternPitch(11.6, octave=6),
-            ),
-        )
-    ]
-)
-BELL_PITCH_AMBITUS = music_parameters.OctaveAmbitus(
-    music_parameters.DirectPitch(BELL_COLLECTION.minima_pitch.frequency)
-    - music_parameters.DirectPitchInterval(200),
-    music_parameters.DirectPitch(BELL_COLLECTION.maxima_pitch.frequency)
-    + music_parameters.DirectPitchInterval(200),
-)
+
+
+def _get_bell_collection() -> cdd_converters.BellCollection:
+    return cdd_converters.BellCollection(
+        [
+            cdd_converters.Bell.from_directory_path_and_pitch(directory_path, pitch)
+            for directory_path, pitch in (
+                (
+                    f"{BELL_DIRECTORY_PATH}/0_a",
+                    music_parameters.WesternPitch("a", octave=5),
+                ),
+                (
+                    f"{BELL_DIRECTORY_PATH}/1_as_m32",
+                    music_parameters.WesternPitch(10.7, octave=5),
+                ),
+                (
+                    f"{BELL_DIRECTORY_PATH}/2_d",
+                    music_parameters.WesternPitch("d", octave=5),
+                ),
+                (
+                    f"{BELL_DIRECTORY_PATH}/3_fs_p43",
+                    music_parameters.WesternPitch(6.43, octave=6),
+                ),
+                (
+                    f"{BELL_DIRECTORY_PATH}/4_a_m40",
+                    music_parameters.WesternPitch(11.6, octave=6),
+                ),
+            )
+        ]
+    )
+
+
+def _get_bell_pitch_ambitus() -> music_parameters.OctaveAmbitus:
+    # Attribute access only calls '__getattr__' (and loads the bells)
+    # if the bell collection hasn't been loaded yet.
+    bell_collection = sys.modules[__name__].BELL_COLLECTION
+    return music_parameters.OctaveAmbitus(
+        music_parameters.DirectPitch(bell_collection.minima_pitch.frequency)
+        - music_parameters.DirectPitchInterval(200),
+        music_parameters.DirectPitch(bell_collection.maxima_pitch.frequency)
+        + music_parameters.DirectPitchInterval(200),
+    )
+
+
+# Splitting the field recording into mono files, reading its header
+# and loading the bell samples is slow: only do it when the
+# constants are accessed for the first time.
+_LAZY_CONSTANT_NAME_TO_GETTER = {
+    "MONO_SOUND_FILE_COLLECTION": lambda: cdd_converters.SoundFileToMonoSoundFileContainer()(
+        SOUND_FILE
+    ),
+    "CHAPTER_DURATION_IN_SECONDS": lambda: SOUND_FILE.duration_in_seconds,
+    "BELL_COLLECTION": _get_bell_collection,
+    "BELL_PITCH_AMBITUS": _get_bell_pitch_ambitus,
+}
+
+
+def __getattr__(name: str):
+    try:
+        getter = _LAZY_CONSTANT_NAME_TO_GETTER[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = globals()[name] = getter()
+    return value
 
 
 PITCH_COLLECTION_DESCRIPTION_TUPLE = (
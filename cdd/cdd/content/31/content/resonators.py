@@ -1,20 +1,16 @@
 from mutwo import cdd_converters
+from mutwo import cdd_utilities
 from mutwo import common_generators
 from mutwo import core_events
 from mutwo import core_generators
-from mutwo import core_utilities
 
 
 def get_resonator_melody_pair_0(
     chapter,
 ) -> core_events.SimultaneousEvent[core_events.SequentialEvent]:
-    COMPUTE_ALL = False
-    COMPUTE_SOUND_FILE_PULSE = False or COMPUTE_ALL
-    COMPUTE_ENVELOPE_TUPLE = False or COMPUTE_ALL
-    pulse = core_utilities.compute_lazy(
-        "builds/pickled/31_sound_file_pulse.pickle",
-        force_to_compute=COMPUTE_SOUND_FILE_PULSE,
-    )(lambda: cdd_converters.SoundFileToPulse().convert(chapter.constants.SOUND_FILE))()
+    pulse = cdd_utilities.compute_lazy()(cdd_converters.SoundFileToPulse().convert)(
+        chapter.constants.SOUND_FILE
+    )
 
     panning_to_mutated_panning_dynamic_choice = core_generators.DynamicChoice(
         [
@@ -259,7 +255,6 @@ def get_resonator_melody_pair_0(
         "spectral_centroid_envelope",
         0,
         1,
-        force_to_compute=COMPUTE_ENVELOPE_TUPLE,
     )
 
     resampled_spectral_contrast_envelope_tuple = cdd_converters.ResampledEnvelopeTuple(
@@ -267,7 +262,6 @@ def get_resonator_melody_pair_0(
         "spectral_contrast_envelope",
         10,
         1,
-        force_to_compute=COMPUTE_ENVELOPE_TUPLE,
     )
 
     pulse_pair = cdd_converters.PulseToComplementaryPulsePair().convert(pulse)
@@ -308,9 +302,9 @@ def get_resonator_melody_pair_0(
 def get_resonator_melody_pair_1(
     chapter,
 ) -> core_events.SimultaneousEvent[core_events.SequentialEvent]:
-    pulse = core_utilities.compute_lazy("builds/pickled/31_sound_file_pulse.pickle")(
-        lambda: cdd_converters.SoundFileToPulse().convert(chapter.constants.SOUND_FILE)
-    )()
+    pulse = cdd_utilities.compute_lazy()(cdd_converters.SoundFileToPulse().convert)(
+        chapter.constants.SOUND_FILE
+    )
 
     panning_to_mutated_panning_dynamic_choice = core_generators.DynamicChoice(
         [
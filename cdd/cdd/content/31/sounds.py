@@ -5,6 +5,30 @@ from mutwo import reaper_converters
 import cdd
 
 
+def prepare_field_recording(chapter: cdd.chapters.Chapter):
+    # Split the field recording only once, before all stages
+    # which analyse it start at the same time.
+    chapter.constants.MONO_SOUND_FILE_COLLECTION
+
+
+def prepare_bells(chapter: cdd.chapters.Chapter):
+    from .content import bells
+
+    chapter.bell_csound_sequential_event = bells.main(chapter)
+
+
+def prepare_resonators(chapter: cdd.chapters.Chapter):
+    from .content import resonators
+
+    chapter.resonator_bandpass_melody_simultaneous_event = resonators.main(chapter)
+
+
+def prepare_voices(chapter: cdd.chapters.Chapter):
+    from .content import voices
+
+    chapter.voice_simultaneous_event = voices.main(chapter)
+
+
 def render_audio_scores(chapter: cdd.chapters.Chapter):
     print("render_audio_scores")
     for (
@@ -48,9 +72,10 @@ def render_bells(chapter: cdd.chapters.Chapter):
         chapter.bell_csound_sequential_event
     )
 
-    cdd_converters.MonoBellCsoundSimultaneousEventToBellSoundFile().convert(
-        mono_bell_csound_simultaneous_event, chapter.get_sound_file_path("bells")
-    )
+    # Bells don't influence each other: render them in parallel slices.
+    cdd_converters.SlicedEventToSoundFile(
+        cdd_converters.MonoBellCsoundSimultaneousEventToBellSoundFile()
+    ).convert(mono_bell_csound_simultaneous_event, chapter.get_sound_file_path("bells"))
 
 
 def render_bandpass_filter(chapter: cdd.chapters.Chapter):
@@ -82,11 +107,42 @@ def render_harmonic_and_percussive_parts(chapter: cdd.chapters.Chapter):
             ).convert(sound_file, harmonic_sound_file_path, percussive_sound_file_path)
 
 
-def main(chapter: cdd.chapters.Chapter):
-    pass
-    render_audio_scores(chapter)
-    # render_reaper_marker(chapter)
-    # render_harmonic_and_percussive_parts(chapter)
-    # render_bandpass_filter(chapter)
-    # render_bells(chapter)
-    # render_voices(chapter)
+STAGE_TUPLE = (
+    cdd.stages.Stage("field_recording", prepare_field_recording, is_default=False),
+    cdd.stages.Stage(
+        "bell_events",
+        prepare_bells,
+        is_default=False,
+        dependency_name_tuple=("field_recording",),
+    ),
+    cdd.stages.Stage(
+        "resonator_events",
+        prepare_resonators,
+        is_default=False,
+        dependency_name_tuple=("field_recording",),
+    ),
+    cdd.stages.Stage("voice_events", prepare_voices, is_default=False),
+    cdd.stages.Stage("audio_scores", render_audio_scores),
+    cdd.stages.Stage("reaper_marker", render_reaper_marker, is_default=False),
+    cdd.stages.Stage(
+        "harmonic_and_percussive_parts",
+        render_harmonic_and_percussive_parts,
+        is_default=False,
+        dependency_name_tuple=("field_recording",),
+    ),
+    cdd.stages.Stage(
+        "bandpass_filter",
+        render_bandpass_filter,
+        is_default=False,
+        dependency_name_tuple=("resonator_events",),
+    ),
+    cdd.stages.Stage(
+        "bells", render_bells, is_default=False, dependency_name_tuple=("bell_events",)
+    ),
+    cdd.stages.Stage(
+        "voices",
+        render_voices,
+        is_default=False,
+        dependency_name_tuple=("voice_events",),
+    ),
+)
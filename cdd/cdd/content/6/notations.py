@@ -276,6 +276,7 @@ def notate_noise(chapter: cdd.chapters.Chapter):
     ).generate_pdf(notation_file_path)
 
 
-def main(chapter: cdd.chapters.Chapter):
-    notate_noise(chapter)
-    notate_speaking_trio(chapter)
+STAGE_TUPLE = (
+    cdd.stages.Stage("noise", notate_noise),
+    cdd.stages.Stage("speaking_trio", notate_speaking_trio),
+)
@@ -4,6 +4,7 @@ from . import simulations
 from . import tapes
 
 
-def main(chapter: cdd.chapters.Chapter):
-    tapes.render(chapter)
-    simulations.render(chapter)
+STAGE_TUPLE = (
+    cdd.stages.Stage("tapes", tapes.render),
+    cdd.stages.Stage("simulations", simulations.render),
+)
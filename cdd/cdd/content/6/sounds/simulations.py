@@ -1,11 +1,9 @@
-import copy
 import random
 
 import voxpopuli
 
 from mutwo import cdd_converters
 from mutwo import core_converters
-from mutwo import mbrola_converters
 from mutwo import midi_converters
 from mutwo import music_parameters
 
@@ -29,19 +27,13 @@ def render(chapter: cdd.chapters.Chapter):
         lambda _: music_parameters.WesternPitch(random.choice(["b", "bqs"]), 2),
     )
     for voice_index, voice in enumerate(simultaneous_event[1:]):
-        voice = copy.deepcopy(voice)
         sequential_event_to_speaking_synthesis = (
-            cdd_converters.EventToSafeSpeakingSynthesis(
-                mbrola_converters.EventToSpeakSynthesis(
-                    voice=voxpopuli.Voice(lang="pt"),
-                    event_to_phoneme_list=mbrola_converters.EventToPhonemeList(
-                        simple_event_to_pitch=pitch_converter_tuple[voice_index],
-                    ),
-                )
-            )
+            cdd_converters.EventToSafeSpeakingSynthesis(voxpopuli.Voice(lang="pt"))
         )
         path = chapter.get_sound_file_path(f"voice{voice_index}")
-        mbrola_voice = to_mbrola_friendly(voice)
+        mbrola_voice = to_mbrola_friendly.convert_to_phoneme_stream(
+            voice, simple_event_to_pitch=pitch_converter_tuple[voice_index]
+        )
         sequential_event_to_speaking_synthesis.convert(mbrola_voice, path)
 
     event_to_midi_file = midi_converters.EventToMidiFile()
@@ -1,3 +1,5 @@
+import cdd
+
 from . import content
 
-CHAPTER = content.Chapter60(60)
+CHAPTER = cdd.chapters.construct_chapter(content.Chapter60, 60)
@@ -1,11 +1,27 @@
+import importlib
 import pkgutil
 
 from cdd import configurations
+from cdd import profiling
 
-__all__ = []
-for loader, module_name, is_pkg in pkgutil.walk_packages(__path__):
-    module_test_name = module_name.split('.')[0]
-    if module_test_name in configurations.CHAPTER_TO_RENDER_TUPLE:
-        __all__.append(module_name)
-        _module = loader.find_module(module_name).load_module(module_name)
-        globals()[module_name] = _module
+__all__ = list(configurations.CHAPTER_TO_RENDER_TUPLE)
+
+_CHAPTER_NAME_TUPLE = tuple(
+    module_info.name
+    for module_info in pkgutil.iter_modules(__path__)
+    if module_info.ispkg
+)
+
+
+# Chapters are only imported when they are accessed for the first
+# time: constructing a chapter can take a long time and most
+# runs only need a few chapters (or none at all).
+def __getattr__(chapter_name: str):
+    if chapter_name in _CHAPTER_NAME_TUPLE:
+        with profiling.measure(chapter_name, "chapter", trace_memory=True):
+            return importlib.import_module(f"{__name__}.{chapter_name}")
+    raise AttributeError(f"module {__name__!r} has no attribute {chapter_name!r}")
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_CHAPTER_NAME_TUPLE))
@@ -0,0 +1,279 @@
+"""Opt-in instrumentation of a cdd run.
+
+Set the environment variable 'CDD_PROFILE' to a non-empty value
+to measure how long it takes to import modules, to construct
+chapters and to run render stages. At the end of a run a JSON
+report and a Chrome trace (which can be opened with
+chrome://tracing or https://ui.perfetto.dev) are written to
+'builds/profiles'.
+
+This module must not import anything from cdd or mutwo: it is
+imported first, so that the import timer sees all other imports.
+"""
+
+import contextlib
+import dataclasses
+import datetime
+import importlib.abc
+import json
+import os
+import resource
+import subprocess
+import sys
+import threading
+import time
+import tracemalloc
+import typing
+
+__all__ = (
+    "IS_ENABLED",
+    "Measurement",
+    "start",
+    "measure",
+    "get_measurement_tuple",
+    "add_measurement_sequence",
+    "write_report",
+)
+
+IS_ENABLED = bool(os.environ.get("CDD_PROFILE"))
+
+
+@dataclasses.dataclass(frozen=True)
+class Measurement(object):
+    name: str
+    category: str
+    # Seconds since epoch, so that measurements of different
+    # processes can be put on one timeline.
+    start_time: float
+    duration_in_seconds: float
+    # Duration minus the duration of all nested measurements
+    self_duration_in_seconds: float
+    cpu_time_in_seconds: float
+    # CPU time of child processes (e.g. csound or lilypond)
+    child_cpu_time_in_seconds: float
+    # Only known if memory has been traced (see 'measure')
+    peak_memory_in_bytes: typing.Optional[int]
+    # Highest resident set size of the process so far
+    maxima_resident_set_size_in_bytes: int
+    process_id: int
+    thread_id: int
+    depth: int
+
+
+_measurement_list: list[Measurement] = []
+# Measurements can run in multiple threads (see 'cdd.stages'),
+# therefore each thread has its own stack of nested measurements.
+_thread_local = threading.local()
+
+
+def _get_nested_duration_stack() -> list[list[float]]:
+    try:
+        return _thread_local.nested_duration_stack
+    except AttributeError:
+        nested_duration_stack = _thread_local.nested_duration_stack = []
+        return nested_duration_stack
+
+
+def _get_child_cpu_time() -> float:
+    times = os.times()
+    return times.children_user + times.children_system
+
+
+def _get_maxima_resident_set_size() -> int:
+    # ru_maxrss is given in kilobytes on Linux
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+
+@contextlib.contextmanager
+def measure(name: str, category: str, trace_memory: bool = False):
+    """Measure wall time, cpu time and memory of the wrapped code.
+
+    :param name: Name of the measurement, e.g. the chapter name.
+    :param category: Group of the measurement, e.g. 'import',
+        'chapter' or 'stage'.
+    :param trace_memory: If ``True`` the peak of memory allocated
+        by Python inside the block is traced with
+        :mod:`tracemalloc`. This slows the code down considerably.
+        Memory is only traced if no outer measurement already
+        traces memory.
+
+    If profiling isn't enabled, this does nothing.
+    """
+
+    if not IS_ENABLED:
+        yield
+        return
+
+    trace_memory = trace_memory and not tracemalloc.is_tracing()
+    if trace_memory:
+        tracemalloc.start()
+
+    nested_duration_stack = _get_nested_duration_stack()
+    depth = len(nested_duration_stack)
+    nested_duration_stack.append([])
+    start_time = time.time()
+    start_counter = time.perf_counter()
+    start_cpu_time = time.process_time()
+    start_child_cpu_time = _get_child_cpu_time()
+    try:
+        yield
+    finally:
+        duration = time.perf_counter() - start_counter
+        cpu_time = time.process_time() - start_cpu_time
+        child_cpu_time = _get_child_cpu_time() - start_child_cpu_time
+        peak_memory = None
+        if trace_memory:
+            _, peak_memory = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+        nested_duration = sum(nested_duration_stack.pop())
+        if nested_duration_stack:
+            nested_duration_stack[-1].append(duration)
+        _measurement_list.append(
+            Measurement(
+                name,
+                category,
+                start_time,
+                duration,
+                duration - nested_duration,
+                cpu_time,
+                child_cpu_time,
+                peak_memory,
+                _get_maxima_resident_set_size(),
+                os.getpid(),
+                threading.get_ident(),
+                depth,
+            )
+        )
+
+
+class _TimedLoader(object):
+    """Wrap a loader so that executing a module is measured."""
+
+    def __init__(self, loader):
+        self._loader = loader
+
+    def __getattr__(self, attribute_name: str):
+        return getattr(self._loader, attribute_name)
+
+    def create_module(self, spec):
+        return self._loader.create_module(spec)
+
+    def exec_module(self, module):
+        try:
+            with measure(module.__name__, "import"):
+                self._loader.exec_module(module)
+        finally:
+            # Hide the wrapper again, some libraries check the
+            # type of a modules loader.
+            module.__loader__ = self._loader
+            if module.__spec__ is not None:
+                module.__spec__.loader = self._loader
+
+
+class _ImportTimer(importlib.abc.MetaPathFinder):
+    def find_spec(self, fullname, path, target=None):
+        for finder in sys.meta_path:
+            if finder is self or not hasattr(finder, "find_spec"):
+                continue
+            if (spec := finder.find_spec(fullname, path, target)) is not None:
+                if hasattr(spec.loader, "exec_module"):
+                    spec.loader = _TimedLoader(spec.loader)
+                return spec
+        return None
+
+
+def start():
+    """Start measuring the execution time of all following imports."""
+
+    if not any(isinstance(finder, _ImportTimer) for finder in sys.meta_path):
+        sys.meta_path.insert(0, _ImportTimer())
+
+
+def get_measurement_tuple() -> tuple[Measurement, ...]:
+    return tuple(_measurement_list)
+
+
+def add_measurement_sequence(measurement_sequence: typing.Sequence[Measurement]):
+    """Add measurements which have been made in another process."""
+
+    _measurement_list.extend(measurement_sequence)
+
+
+def _get_commit() -> typing.Optional[str]:
+    try:
+        return subprocess.run(
+            ("git", "rev-parse", "HEAD"), capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def _measurement_to_trace_event(measurement: Measurement) -> dict:
+    return {
+        "name": measurement.name,
+        "cat": measurement.category,
+        "ph": "X",
+        "ts": measurement.start_time * 1e6,
+        "dur": measurement.duration_in_seconds * 1e6,
+        "pid": measurement.process_id,
+        "tid": measurement.thread_id,
+        "args": {
+            key: value
+            for key, value in dataclasses.asdict(measurement).items()
+            if key not in ("name", "category", "start_time", "process_id", "thread_id")
+        },
+    }
+
+
+def write_report(
+    directory_path: str, section_dict: typing.Optional[dict[str, typing.Any]] = None
+) -> tuple[str, str]:
+    """Write JSON report and Chrome trace of all measurements.
+
+    :param directory_path: Where to write both files to.
+    :param section_dict: Further (JSON serializable) data which
+        is added to the report, e.g. metrics of csound renders.
+    :return: The paths of the JSON report and the Chrome trace.
+    """
+
+    measurement_tuple = get_measurement_tuple()
+    now = datetime.datetime.now()
+    base_path = f"{directory_path}/{now.strftime('%Y-%m-%d_%H-%M-%S')}"
+    report_path, trace_path = f"{base_path}.json", f"{base_path}.trace.json"
+
+    category_to_measurement_list = {}
+    for measurement in sorted(
+        measurement_tuple,
+        key=lambda measurement: measurement.self_duration_in_seconds,
+        reverse=True,
+    ):
+        category_to_measurement_list.setdefault(measurement.category, []).append(
+            dataclasses.asdict(measurement)
+        )
+
+    with open(report_path, "w") as report_file:
+        json.dump(
+            {
+                "commit": _get_commit(),
+                "date": now.isoformat(),
+                "argv": sys.argv,
+                "measurements": category_to_measurement_list,
+                **(section_dict or {}),
+            },
+            report_file,
+            indent=2,
+        )
+
+    with open(trace_path, "w") as trace_file:
+        json.dump(
+            {
+                "traceEvents": [
+                    _measurement_to_trace_event(measurement)
+                    for measurement in measurement_tuple
+                ],
+                "displayTimeUnit": "ms",
+            },
+            trace_file,
+        )
+
+    return report_path, trace_path
@@ -0,0 +1,189 @@
+"""Named render stages of chapters.
+
+The 'sounds' and 'notations' module of each chapter declare their
+render steps in a ``STAGE_TUPLE``, so that single stages can be
+selected from the command line (see ``cdd.__main__``) instead of
+commenting out calls. Modules without a ``STAGE_TUPLE`` are
+rendered as one stage named 'main'.
+
+Stages declare which other stages they depend on. Stages which
+don't depend on each other are rendered concurrently in threads
+(most time is spent waiting for csound, lilypond & co.). Data
+which is needed by multiple stages (e.g. the analysis of a field
+recording) should be prepared in a stage on its own, so that it is
+computed once before all stages which need it start.
+"""
+
+import concurrent.futures
+import dataclasses
+import sys
+import traceback
+import types
+import typing
+
+import cdd
+
+from . import profiling
+
+__all__ = ("Stage", "get_stage_tuple", "select_stage_tuple", "render_stage_tuple")
+
+
+@dataclasses.dataclass(frozen=True)
+class Stage(object):
+    name: str
+    render: typing.Callable[["cdd.chapters.Chapter"], None]
+    # Stages which aren't rendered by default (e.g. because
+    # they are slow) can still be selected explicitly.
+    is_default: bool = True
+    # Names of stages which need to be rendered before this stage
+    # (because they prepare data or write files which are used by
+    # this stage).
+    dependency_name_tuple: tuple[str, ...] = ()
+
+
+def get_stage_tuple(module: types.ModuleType) -> tuple[Stage, ...]:
+    try:
+        return module.STAGE_TUPLE
+    except AttributeError:
+        return (Stage("main", module.main),)
+
+
+def select_stage_tuple(
+    stage_tuple: tuple[Stage, ...],
+    stage_name_tuple: typing.Optional[tuple[str, ...]] = None,
+) -> tuple[Stage, ...]:
+    """Get stages which should be rendered.
+
+    :param stage_tuple: All stages of a chapter module.
+    :param stage_name_tuple: Names of stages to select. If ``None``
+        all default stages are selected.
+
+    All stages which the selected stages depend on are selected, too.
+    """
+
+    if stage_name_tuple is None:
+        stage_name_set = {stage.name for stage in stage_tuple if stage.is_default}
+    else:
+        stage_name_set = set(stage_name_tuple)
+
+    stage_name_to_stage = _get_stage_name_to_stage(stage_tuple)
+    stage_name_to_check_list = list(stage_name_set)
+    while stage_name_to_check_list:
+        stage_name = stage_name_to_check_list.pop()
+        if stage := stage_name_to_stage.get(stage_name):
+            for dependency_name in stage.dependency_name_tuple:
+                if dependency_name not in stage_name_set:
+                    stage_name_set.add(dependency_name)
+                    stage_name_to_check_list.append(dependency_name)
+
+    return tuple(stage for stage in stage_tuple if stage.name in stage_name_set)
+
+
+def _get_stage_name_to_stage(stage_tuple: tuple[Stage, ...]) -> dict[str, Stage]:
+    stage_name_to_stage = {}
+    for stage in stage_tuple:
+        if stage.name in stage_name_to_stage:
+            raise ValueError(f"Found multiple stages with name '{stage.name}'.")
+        stage_name_to_stage[stage.name] = stage
+    for stage in stage_tuple:
+        for dependency_name in stage.dependency_name_tuple:
+            if dependency_name not in stage_name_to_stage:
+                raise ValueError(
+                    f"Stage '{stage.name}' depends on unknown stage "
+                    f"'{dependency_name}'."
+                )
+    return stage_name_to_stage
+
+
+def _sort_stage_tuple(stage_tuple: tuple[Stage, ...]) -> tuple[Stage, ...]:
+    """Sort stages so that each stage is behind its dependencies."""
+
+    _get_stage_name_to_stage(stage_tuple)
+    sorted_stage_list, sorted_stage_name_set = [], set()
+    stage_to_sort_list = list(stage_tuple)
+    while stage_to_sort_list:
+        for stage in stage_to_sort_list:
+            if sorted_stage_name_set.issuperset(stage.dependency_name_tuple):
+                stage_to_sort_list.remove(stage)
+                sorted_stage_list.append(stage)
+                sorted_stage_name_set.add(stage.name)
+                break
+        else:
+            raise ValueError(
+                "Found cyclic dependency between stages "
+                f"{', '.join(stage.name for stage in stage_to_sort_list)}."
+            )
+    return tuple(sorted_stage_list)
+
+
+def _render_stage(chapter: "cdd.chapters.Chapter", stage: Stage):
+    print(f"{chapter.index}.{stage.name}")
+    with profiling.measure(f"{chapter.index}.{stage.name}", "stage"):
+        stage.render(chapter)
+
+
+def render_stage_tuple(
+    chapter: "cdd.chapters.Chapter", stage_tuple: tuple[Stage, ...], job_count: int = 1
+):
+    """Render stages of a chapter.
+
+    :param chapter: The chapter which is rendered.
+    :param stage_tuple: The stages to render. All dependencies of
+        these stages need to be part of the tuple (see
+        :func:`select_stage_tuple`).
+    :param job_count: How many stages are rendered at the same time.
+        If a stage fails, all stages which haven't started yet are
+        cancelled and the exception is raised once all running
+        stages are finished (exceptions of other stages which fail
+        meanwhile are printed).
+    """
+
+    stage_tuple = _sort_stage_tuple(stage_tuple)
+
+    if job_count <= 1:
+        for stage in stage_tuple:
+            _render_stage(chapter, stage)
+        return
+
+    stage_to_render_list = list(stage_tuple)
+    rendered_stage_name_set = set()
+    future_to_stage = {}
+    stage_and_exception_list = []
+    with concurrent.futures.ThreadPoolExecutor(job_count) as executor:
+        while future_to_stage or (
+            stage_to_render_list and not stage_and_exception_list
+        ):
+            if not stage_and_exception_list:
+                for stage in tuple(stage_to_render_list):
+                    if rendered_stage_name_set.issuperset(stage.dependency_name_tuple):
+                        stage_to_render_list.remove(stage)
+                        future_to_stage[
+                            executor.submit(_render_stage, chapter, stage)
+                        ] = stage
+            done_future_set, _ = concurrent.futures.wait(
+                future_to_stage, return_when=concurrent.futures.FIRST_COMPLETED
+            )
+            for future in done_future_set:
+                stage = future_to_stage.pop(future)
+                if (exception := future.exception()) is None:
+                    rendered_stage_name_set.add(stage.name)
+                    continue
+                if not stage_and_exception_list:
+                    # Submitted stages which wait for a free thread
+                    # are never started ('wait' doesn't return
+                    # cancelled futures, so they are forgotten).
+                    executor.shutdown(wait=False, cancel_futures=True)
+                    future_to_stage = {
+                        future: stage
+                        for future, stage in future_to_stage.items()
+                        if not future.cancelled()
+                    }
+                stage_and_exception_list.append((stage, exception))
+
+    if stage_and_exception_list:
+        for stage, exception in stage_and_exception_list[1:]:
+            print(f"Stage {chapter.index}.{stage.name} failed, too:", file=sys.stderr)
+            traceback.print_exception(
+                type(exception), exception, exception.__traceback__
+            )
+        raise stage_and_exception_list[0][1]
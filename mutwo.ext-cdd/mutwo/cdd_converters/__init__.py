@@ -1,3 +1,5 @@
+from . import configurations
+
 from .abjad import *
 from .chapters import *
 from .ebooks import *
@@ -9,5 +11,7 @@ from .pannings import *
 from .sound_files import *
 from .bells_31 import *
 from .resonators_31 import *
+from .csound_engines import *
+from .csound_telemetry import *
 from .csound import *
 from .audio_scores import *
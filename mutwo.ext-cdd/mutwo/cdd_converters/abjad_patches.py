@@ -2,11 +2,14 @@
 
 import collections
 import numbers
+import os
 import typing
 
 import abjad
 
 from mutwo import abjad_converters
+from mutwo import cdd_converters
+from mutwo import cdd_utilities
 from mutwo import core_events
 
 __all__ = ("AbjadScoreListToLilyPondFile",)
@@ -214,3 +217,42 @@ def NoteHead__get_format_pieces(self) -> list[str]:
 
 
 abjad.NoteHead._get_format_pieces = NoteHead__get_format_pieces
+
+
+# Monkey patch abjad.persist.as_pdf in order to skip calling lilypond
+# if the pdf has already been rendered from the same lilypond code.
+
+abjad_persist_as_pdf = abjad.persist.as_pdf
+
+
+def persist_as_pdf(argument, pdf_file_path=None, *args, **kwargs):
+    if not (
+        pdf_file_path
+        and (
+            build_cache_directory_path := cdd_converters.configurations.BUILD_CACHE_DIRECTORY_PATH
+        )
+    ):
+        return abjad_persist_as_pdf(argument, pdf_file_path, *args, **kwargs)
+
+    lilypond_str = abjad.lilypond(argument)
+    build_cache = cdd_utilities.BuildCache(build_cache_directory_path)
+    build_key = cdd_utilities.get_stable_hash(
+        lilypond_str,
+        args,
+        kwargs,
+        tuple(
+            cdd_utilities.get_file_hash(file_path)
+            for file_path in cdd_utilities.get_referenced_file_path_tuple(
+                lilypond_str, (".ly", ".ily")
+            )
+        ),
+    )
+    if build_cache.is_up_to_date(pdf_file_path, build_key):
+        return pdf_file_path, 0, 0, True
+    result = abjad_persist_as_pdf(argument, pdf_file_path, *args, **kwargs)
+    if os.path.exists(pdf_file_path):
+        build_cache.register(pdf_file_path, build_key)
+    return result
+
+
+abjad.persist.as_pdf = persist_as_pdf
@@ -1,6 +1,6 @@
 import math
 import os
-import uuid
+import shutil
 
 import geometer
 import gtts
@@ -10,6 +10,7 @@ import sox
 
 from mutwo import cdd_events
 from mutwo import cdd_parameters
+from mutwo import cdd_utilities
 from mutwo import core_converters
 from mutwo import core_events
 from mutwo import csound_converters
@@ -180,7 +181,9 @@ class CommandSequentialEventToSoundFile(csound_converters.EventToSoundFile):
         command_to_soundfile = CommandToSoundFileWithCounting()
         with progressbar.ProgressBar(max_value=len(sequential_event_to_convert)) as bar:
             for command_index, command in enumerate(sequential_event_to_convert):
-                sound_file_path = f".{uuid.uuid4()}.wav"
+                sound_file_path = cdd_utilities.get_scratch_space().get_path(
+                    suffix=".wav"
+                )
                 command_to_soundfile.convert(command, sound_file_path)
                 simple_event = core_events.SimpleEvent(command.duration).set_parameter(
                     "sound_file_path", sound_file_path
@@ -195,7 +198,9 @@ class CommandSequentialEventToSoundFile(csound_converters.EventToSoundFile):
 
 class CommandToSoundFileWithCounting(CommandToSoundFile):
     def convert(self, command_to_convert: cdd_events.Command, path: str):
-        base_path = f"_base_{path}"
+        base_path = cdd_utilities.get_scratch_space().get_path(
+            suffix=".wav", prefix="base_"
+        )
         super().convert(command_to_convert, base_path)
         base_duration = sox.file_info.duration(base_path)
         pause = 1
@@ -220,4 +225,5 @@ class CommandToSoundFileWithCounting(CommandToSoundFile):
             )
             os.remove(base_path)
         else:
-            os.rename(base_path, path)
+            # The scratch space may be on another file system.
+            shutil.move(base_path, path)
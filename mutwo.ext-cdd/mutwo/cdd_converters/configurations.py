@@ -0,0 +1,73 @@
+"""Configure the behaviour of converters in :mod:`mutwo.cdd_converters`"""
+
+import typing
+
+BUILD_CACHE_DIRECTORY_PATH: typing.Optional[str] = None
+"""If set, csound and lilypond renders are skipped if their output
+already exists and none of their inputs changed since the last
+render. Set to ``None`` to always render."""
+
+IS_PREVIEW: bool = False
+"""If ``True``, sound files are rendered with reduced quality, but
+much faster (to quickly listen to compositional changes). All csound
+orchestras are rendered with the variables ``is_preview`` and
+``preview_sampling_rate``, so that they can lower their sampling
+rate and bypass expensive effects."""
+
+PREVIEW_SAMPLING_RATE: int = 22050
+"""Sampling rate of csound renders in preview mode."""
+
+PREVIEW_MAXIMA_PARTIAL_COUNT: int = 2
+"""In preview mode resonators never use more partials."""
+
+PREVIEW_MAXIMA_FILTER_LAYER_COUNT: int = 1
+"""In preview mode resonators never use more filter layers."""
+
+PREVIEW_SKIP_SINGING_SYNTHESIS: bool = True
+"""In preview mode isis isn't called at all: singing voices are
+rendered as silence with the correct duration."""
+
+CSOUND_ORCHESTRA_CACHE_DIRECTORY_PATH: str = ".csound_orchestras"
+"""Where rendered csound orchestra templates are saved. Each
+orchestra is only rendered once per process and its file is named
+by the hash of its content."""
+
+CSOUND_SCORE_BUFFER_SIZE_IN_BYTES: int = 2**20
+"""Size of the buffer with which csound scores with function tables
+are written (see
+:class:`mutwo.cdd_converters.EventToCsoundScoreWithFunctionTables`)."""
+
+CSOUND_BACKEND: str = "process"
+"""How csound renders sound files: 'process' starts a csound process
+for each sound file, 'api' renders in threads of the current process
+via the csound API (needs the optional dependency 'ctcsound', see
+:mod:`mutwo.cdd_converters.csound_engines`)."""
+
+IS_CSOUND_TELEMETRY_ENABLED: bool = False
+"""If ``True``, metrics of all csound renders are collected (see
+:mod:`mutwo.cdd_converters.csound_telemetry`)."""
+
+SYNTHESIS_JOB_COUNT: int = 2
+"""How many segments of :class:`mutwo.cdd_converters.EventToSafeSynthesis`
+are synthesized at the same time (by all converters of the process
+together). isis needs a lot of memory, so this shouldn't be too high."""
+
+SYNTHESIS_CACHE_DIRECTORY_PATH: typing.Optional[str] = None
+"""If set, segments which are synthesized by
+:class:`mutwo.cdd_converters.EventToSafeSynthesis` are saved in this
+directory and reused (in all following renders) for segments with
+the same content and the same synthesizer settings. Set to ``None``
+to always synthesize all segments."""
+
+ISIS_BATCH_MAXIMA_DURATION: typing.Optional[float] = None
+"""isis needs a long time to start. If set, segments of
+:class:`mutwo.cdd_converters.EventToSafeSingingSynthesis` are
+synthesized together (separated by rests) by one isis call, as long
+as the batch isn't longer than this duration in seconds. ``None``
+means that isis is called for each segment.
+
+The isis output of a segment depends on all segments of its batch:
+segments which share their batch with other segments aren't saved in
+``SYNTHESIS_CACHE_DIRECTORY_PATH`` and changing one segment changes
+the sound of the other segments of its batch, too. Batches are
+therefore only faster if the cache isn't used or mostly empty."""
@@ -1,15 +1,32 @@
+import concurrent.futures
+import contextvars
+import copy
+import dataclasses
+import functools
+import heapq
+import io
 import os
+import resource
+import shlex
+import shutil
+import threading
+import time
 import typing
-import uuid
+import warnings
 
 import jinja2
+import jinja2.meta
+import numpy as np
+import soundfile
+import voxpopuli
 
+from mutwo import cdd_converters
 from mutwo import cdd_events
 from mutwo import cdd_parameters
+from mutwo import cdd_utilities
 from mutwo import core_converters
 from mutwo import core_constants
 from mutwo import core_events
-from mutwo import core_utilities
 from mutwo import csound_converters
 from mutwo import isis_converters
 from mutwo import mbrola_converters
@@ -23,17 +40,225 @@ __all__ = (
     "EventToSafeSingingSynthesis",
     "MonoBellCsoundSimultaneousEventToBellSoundFile",
     "ResonatorSequentialEventToResonatorSoundFile",
+    "SafeSynthesisStatistic",
+    "SlicedEventToSoundFile",
 )
 
 
 # MONKEY PATCH: Allow csound converter to parse jinja2 files
-def EventToSoundFile_convert(
+def _get_csound_orchestra_context() -> dict[str, typing.Any]:
+    """Variables with which all csound orchestra templates are rendered"""
+
+    return {
+        "is_preview": cdd_converters.configurations.IS_PREVIEW,
+        "preview_sampling_rate": cdd_converters.configurations.PREVIEW_SAMPLING_RATE,
+    }
+
+
+class _CsoundOrchestraCache(object):
+    """Render each csound orchestra template only once per process.
+
+    Rendered orchestras are identified by the template (its path and
+    the modification times of the template and all templates it
+    imports, or its source code) and the render context. Their files
+    are named by the hash of their content and saved in
+    ``CSOUND_ORCHESTRA_CACHE_DIRECTORY_PATH``: a file is never
+    changed once it has been written, so concurrent renders can't
+    overwrite the orchestra of each other.
+    """
+
+    def __init__(self):
+        self._environment = jinja2.Environment(loader=jinja2.FileSystemLoader("./"))
+        self._lock = threading.Lock()
+        self._key_to_csound_orchestra = {}
+        self._file_state_to_referenced_template_path_tuple = {}
+
+    def _get_referenced_template_path_tuple(
+        self, file_state: tuple[str, int, int]
+    ) -> tuple[str, ...]:
+        try:
+            return self._file_state_to_referenced_template_path_tuple[file_state]
+        except KeyError:
+            pass
+        with open(file_state[0], "r") as template_file:
+            template_source = template_file.read()
+        referenced_template_path_tuple = self._file_state_to_referenced_template_path_tuple[
+            file_state
+        ] = tuple(
+            template_path
+            for template_path in jinja2.meta.find_referenced_templates(
+                self._environment.parse(template_source)
+            )
+            # Dynamic imports are 'None'
+            if template_path
+        )
+        return referenced_template_path_tuple
+
+    def _get_file_state_tuple(
+        self, template_path: str
+    ) -> tuple[tuple[str, int, int], ...]:
+        file_state_list = []
+        template_path_list = [template_path]
+        while template_path_list:
+            template_path = template_path_list.pop(0)
+            template_stat = os.stat(template_path)
+            file_state = (template_path, template_stat.st_mtime_ns, template_stat.st_size)
+            file_state_list.append(file_state)
+            for referenced_template_path in self._get_referenced_template_path_tuple(
+                file_state
+            ):
+                if referenced_template_path not in template_path_list + [
+                    template_path for template_path, *_ in file_state_list
+                ]:
+                    template_path_list.append(referenced_template_path)
+        return tuple(file_state_list)
+
+    def _write(self, csound_orchestra_str: str) -> str:
+        directory_path = (
+            cdd_converters.configurations.CSOUND_ORCHESTRA_CACHE_DIRECTORY_PATH
+        )
+        os.makedirs(directory_path, exist_ok=True)
+        csound_orchestra_path = (
+            f"{directory_path}/{cdd_utilities.get_stable_hash(csound_orchestra_str)}.orc"
+        )
+        # Maybe another process already wrote the same orchestra.
+        if not os.path.exists(csound_orchestra_path):
+            temporary_csound_orchestra_path = (
+                f"{csound_orchestra_path}.{os.getpid()}.{threading.get_ident()}"
+            )
+            with open(temporary_csound_orchestra_path, "w") as csound_orchestra_file:
+                csound_orchestra_file.write(csound_orchestra_str)
+            os.replace(temporary_csound_orchestra_path, csound_orchestra_path)
+        return csound_orchestra_path
+
+    def _get(
+        self, key: tuple, get_template: typing.Callable[[], jinja2.Template]
+    ) -> tuple[str, str]:
+        context = _get_csound_orchestra_context()
+        key += tuple(sorted(context.items()))
+        with self._lock:
+            try:
+                csound_orchestra_str, csound_orchestra_path = self._key_to_csound_orchestra[
+                    key
+                ]
+            except KeyError:
+                pass
+            else:
+                # The cache directory may have been cleaned.
+                if os.path.exists(csound_orchestra_path):
+                    return csound_orchestra_str, csound_orchestra_path
+            csound_orchestra_str = get_template().render(**context)
+            csound_orchestra = self._key_to_csound_orchestra[key] = (
+                csound_orchestra_str,
+                self._write(csound_orchestra_str),
+            )
+        return csound_orchestra
+
+    def get_from_path(self, template_path: str) -> tuple[str, str]:
+        """Get rendered orchestra and its path from template file"""
+
+        return self._get(
+            ("path", self._get_file_state_tuple(template_path)),
+            lambda: self._environment.get_template(template_path),
+        )
+
+    def get_from_str(self, template_str: str) -> tuple[str, str]:
+        """Get rendered orchestra and its path from template code"""
+
+        return self._get(
+            ("str", template_str),
+            lambda: self._environment.from_string(template_str),
+        )
+
+
+_csound_orchestra_cache = _CsoundOrchestraCache()
+
+
+def EventToSoundFile__get_csound_orchestra(self) -> tuple[str, str]:
+    """Get rendered csound orchestra and the path of its file"""
+
+    return _csound_orchestra_cache.get_from_path(self.csound_orchestra_path)
+
+
+def _get_csound_score_str(
+    csound_score_converter: csound_converters.EventToCsoundScore,
+    event_to_convert: core_events.abc.Event,
+) -> str:
+    if isinstance(csound_score_converter, EventToCsoundScoreWithFunctionTables):
+        csound_score_file = io.StringIO()
+        csound_score_converter.convert(event_to_convert, csound_score_file)
+        return csound_score_file.getvalue()
+    return "\n".join(csound_score_converter._convert_event(event_to_convert, 0))
+
+
+def _get_subtype(flag_sequence: typing.Sequence[str]) -> str:
+    """Get sample format which csound would write with the flags"""
+
+    subtype = "PCM_16"
+    for flag_str in flag_sequence:
+        for flag in shlex.split(flag_str):
+            subtype = {
+                "-f": "FLOAT",
+                "--format=float": "FLOAT",
+                "--format=double": "DOUBLE",
+                "-3": "PCM_24",
+                "--format=24bit": "PCM_24",
+                "-l": "PCM_32",
+                "--format=long": "PCM_32",
+                "-s": "PCM_16",
+                "--format=short": "PCM_16",
+            }.get(flag, subtype)
+    return subtype
+
+
+def EventToSoundFile_convert_to_array(
+    self, event_to_convert: core_events.abc.Event
+) -> tuple[np.ndarray, int]:
+    """Render samples of the mutwo event with the csound API.
+
+    :param event_to_convert: The event that shall be rendered.
+    :type event_to_convert: core_events.abc.Event
+    :return: Samples with shape (frame count, channel count) and
+        the sampling rate.
+
+    This needs the optional dependency 'ctcsound'.
+    """
+
+    return cdd_converters.get_csound_engine().render(
+        self._get_csound_orchestra()[0],
+        _get_csound_score_str(self.csound_score_converter, event_to_convert),
+        self.flags,
+    )
+
+
+def EventToSoundFile__get_build_key(
+    self, event_to_convert: core_events.abc.Event, csound_orchestra_str: str
+) -> str:
+    """Get hash of all inputs of a render (see :class:`cdd_utilities.BuildCache`)"""
+
+    return cdd_utilities.get_stable_hash(
+        event_to_convert,
+        self.csound_score_converter,
+        csound_orchestra_str,
+        self.flags,
+        tuple(
+            cdd_utilities.get_file_hash(file_path)
+            for file_path in cdd_utilities.get_referenced_file_path_tuple(
+                csound_orchestra_str
+            )
+        ),
+    )
+
+
+def EventToSoundFile_submit(
     self,
     event_to_convert: core_events.abc.Event,
     path: str,
     score_path: typing.Optional[str] = None,
-) -> None:
-    """Render sound file from the mutwo event.
+    is_failure_tolerated: bool = False,
+    use_build_cache: bool = True,
+) -> concurrent.futures.Future[typing.Optional[cdd_utilities.ProcessResult]]:
+    """Start rendering a sound file from the mutwo event.
 
     :param event_to_convert: The event that shall be rendered.
     :type event_to_convert: core_events.abc.Event
@@ -41,40 +266,238 @@ def EventToSoundFile_convert(
     :type path: str
     :param score_path: where to write the score file
     :type score_path: typing.Optional[str]
+    :param is_failure_tolerated: If csound fails (or is killed after
+        ``PROCESS_TIMEOUT_IN_SECONDS``), the future raises a
+        ``RuntimeError``. If this is ``True`` only a warning is shown
+        and the future resolves to the failed process result.
+    :type is_failure_tolerated: bool
+    :param use_build_cache: Set to ``False`` to always render (and to
+        not register) the sound file, e.g. for temporary files.
+    :type use_build_cache: bool
+    :return: A future which resolves to the result of the csound
+        process once the sound file is written (or to ``None`` if
+        the sound file is already up to date or has been rendered
+        with the csound API).
+
+    csound runs in the process pool of :mod:`mutwo.cdd_utilities`,
+    so that multiple sound files can be rendered at the same time.
+    If ``CSOUND_BACKEND`` is 'api', csound renders in threads of
+    this process instead (see :mod:`mutwo.cdd_converters.csound_engines`).
     """
 
-    environment = jinja2.Environment(loader=jinja2.FileSystemLoader("./"))
-    template = environment.get_template(self.csound_orchestra_path)
-    csound_orchestra_str = template.render()
-    split_csound_orchestra_path = self.csound_orchestra_path.split("/")
-    csound_orchestra_directory_path, csound_orchestra_file_path = (
-        "/".join(split_csound_orchestra_path[:-1]),
-        split_csound_orchestra_path[-1],
-    )
-    if not csound_orchestra_directory_path:
-        csound_orchestra_directory_path = "."
-    csound_orchestra_path = f"{csound_orchestra_directory_path}/.{csound_orchestra_file_path.split('.')[0]}.orc"
+    csound_orchestra_str, csound_orchestra_path = self._get_csound_orchestra()
+
+    future = concurrent.futures.Future()
+
+    if use_build_cache and (
+        build_cache_directory_path := cdd_converters.configurations.BUILD_CACHE_DIRECTORY_PATH
+    ):
+        build_cache = cdd_utilities.BuildCache(build_cache_directory_path)
+        build_key = self._get_build_key(event_to_convert, csound_orchestra_str)
+        if build_cache.is_up_to_date(path, build_key):
+            future.set_result(None)
+            return future
+    else:
+        build_cache = None
+
+    csound_orchestra_name = self.csound_orchestra_path or type(self).__name__
 
-    with open(csound_orchestra_path, "w") as csound_orchestra_file:
-        csound_orchestra_file.write(csound_orchestra_str)
+    if cdd_converters.configurations.CSOUND_BACKEND == "api":
+
+        def render():
+            start_time, start_cpu_time = time.time(), time.thread_time()
+            csound_score_str = _get_csound_score_str(
+                self.csound_score_converter, event_to_convert
+            )
+            sample_array, sampling_rate = cdd_converters.get_csound_engine().render(
+                csound_orchestra_str, csound_score_str, self.flags
+            )
+            soundfile.write(
+                path, sample_array, sampling_rate, subtype=_get_subtype(self.flags)
+            )
+            if build_cache:
+                build_cache.register(path, build_key)
+            if cdd_converters.configurations.IS_CSOUND_TELEMETRY_ENABLED:
+                cdd_converters.add_csound_render_metrics_sequence(
+                    (
+                        cdd_converters.make_csound_render_metrics(
+                            path,
+                            csound_orchestra_name,
+                            "api",
+                            0,
+                            csound_score_str.splitlines(),
+                            time.time() - start_time,
+                            time.thread_time() - start_cpu_time,
+                            # Peak of the complete process
+                            resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024,
+                        ),
+                    )
+                )
+
+        return cdd_converters.get_csound_engine_executor().submit(render)
 
     if not score_path:
         score_path = path + ".sco"
 
     self.csound_score_converter.convert(event_to_convert, score_path)
-    flag_string = " ".join(self.flags)
-    command = f"csound -o {path} {flag_string}" f" {csound_orchestra_path} {score_path}"
+    command = (
+        "csound",
+        "-o",
+        path,
+        *(flag for flag_str in self.flags for flag in shlex.split(flag_str)),
+        csound_orchestra_path,
+        score_path,
+    )
+
+    def finish(process_future):
+        try:
+            process_result = process_future.result()
+            if cdd_converters.configurations.IS_CSOUND_TELEMETRY_ENABLED:
+                with open(score_path, "r") as csound_score_file:
+                    csound_render_metrics = cdd_converters.make_csound_render_metrics(
+                        path,
+                        csound_orchestra_name,
+                        "process",
+                        process_result.exit_status,
+                        csound_score_file,
+                        process_result.duration_in_seconds,
+                        process_result.cpu_time_in_seconds,
+                        process_result.maxima_resident_set_size_in_bytes,
+                    )
+                cdd_converters.add_csound_render_metrics_sequence(
+                    (csound_render_metrics,)
+                )
+            if self.remove_score_file:
+                os.remove(score_path)
+            if not process_result.is_successful:
+                reason = (
+                    "was killed after timeout"
+                    if process_result.is_timed_out
+                    else f"failed with exit status {process_result.exit_status}"
+                )
+                stderr_tail = "\n".join(process_result.stderr.splitlines()[-10:])
+                message = f"csound {reason} while rendering '{path}':\n{stderr_tail}"
+                if not is_failure_tolerated:
+                    raise RuntimeError(message)
+                warnings.warn(message, RuntimeWarning)
+            elif build_cache and os.path.exists(path):
+                build_cache.register(path, build_key)
+        except BaseException as exception:
+            future.set_exception(exception)
+        else:
+            future.set_result(process_result)
 
-    os.system(command)
+    cdd_utilities.get_process_pool().submit(command).add_done_callback(finish)
+    return future
 
-    if self.remove_score_file:
-        os.remove(score_path)
 
+def EventToSoundFile_convert(
+    self,
+    event_to_convert: core_events.abc.Event,
+    path: str,
+    score_path: typing.Optional[str] = None,
+    is_failure_tolerated: bool = False,
+) -> None:
+    """Render sound file from the mutwo event.
 
+    :param event_to_convert: The event that shall be rendered.
+    :type event_to_convert: core_events.abc.Event
+    :param path: where to write the sound file
+    :type path: str
+    :param score_path: where to write the score file
+    :type score_path: typing.Optional[str]
+    :param is_failure_tolerated: Only warn instead of raising a
+        ``RuntimeError`` if csound fails.
+    :type is_failure_tolerated: bool
+
+    Blocks until csound is finished, use ``submit`` to render
+    multiple sound files at the same time.
+    """
+
+    self.submit(
+        event_to_convert, path, score_path, is_failure_tolerated=is_failure_tolerated
+    ).result()
+
+
+csound_converters.EventToSoundFile._get_csound_orchestra = (
+    EventToSoundFile__get_csound_orchestra
+)
+csound_converters.EventToSoundFile._get_build_key = EventToSoundFile__get_build_key
+csound_converters.EventToSoundFile.convert_to_array = (
+    EventToSoundFile_convert_to_array
+)
+csound_converters.EventToSoundFile.submit = EventToSoundFile_submit
 csound_converters.EventToSoundFile.convert = EventToSoundFile_convert
 
 
-class EventToSafeSynthesis(csound_converters.EventToSoundFile):
+def _get_absolute_time_and_simple_event_tuple(
+    event: core_events.abc.Event, absolute_time: core_constants.DurationType = 0
+) -> tuple[tuple[core_constants.DurationType, core_events.SimpleEvent], ...]:
+    if isinstance(event, core_events.SimpleEvent):
+        return ((absolute_time, event),)
+    if isinstance(event, core_events.SequentialEvent):
+        absolute_time_iterable = (
+            absolute_time + local_absolute_time
+            for local_absolute_time in event.absolute_time_tuple
+        )
+    else:
+        absolute_time_iterable = (absolute_time for _ in event)
+    return tuple(
+        absolute_time_and_simple_event
+        for local_absolute_time, local_event in zip(absolute_time_iterable, event)
+        for absolute_time_and_simple_event in _get_absolute_time_and_simple_event_tuple(
+            local_event, local_absolute_time
+        )
+    )
+
+
+@dataclasses.dataclass(frozen=True)
+class SafeSynthesisStatistic(object):
+    """How the segments of :class:`EventToSafeSynthesis` were rendered"""
+
+    segment_count: int
+    # How often the synthesizer has been called
+    synthesis_count: int
+    # Repetitions of a phrase which have been reused or time-stretched
+    derived_segment_count: int
+    # Segments which have been found in 'SYNTHESIS_CACHE_DIRECTORY_PATH'
+    cached_segment_count: int
+
+    @property
+    def saved_synthesis_count(self) -> int:
+        return self.segment_count - self.synthesis_count
+
+
+@functools.lru_cache(maxsize=None)
+def _get_synthesis_executor(job_count: int) -> concurrent.futures.Executor:
+    # Threads are enough: the synthesizers are external programs.
+    return concurrent.futures.ThreadPoolExecutor(job_count)
+
+
+class EventToSafeSynthesis(core_converters.abc.Converter):
+    """Synthesize event in segments which are mixed into one sound file.
+
+    :param event_to_sound_file: Synthesizer which renders each segment.
+    :param is_rest: Whether a simple event is silent. Long rests split
+        the event into segments.
+    :param maxima_time_stretch_ratio: Segments which only differ in
+        their tempo (same events with the same relative rhythm) are
+        synthesized only once and time-stretched to the duration of
+        their repetitions, as long as they don't need to be stretched
+        (or compressed) by more than this ratio. 1 means that only
+        repetitions with exactly the same duration are reused.
+
+    Synthesizers (e.g. isis) easily fail or drift for long events,
+    therefore the event is split at all rests which are longer than
+    ``split_duration`` and each segment is synthesized separately (up to
+    ``SYNTHESIS_JOB_COUNT`` segments at the same time and only if
+    they aren't in ``SYNTHESIS_CACHE_DIRECTORY_PATH`` yet). The
+    segments are faded in and out (to avoid clicks) and summed at
+    their position in a preallocated sample array, which is written
+    once (in 16 bit). :meth:`convert` returns how many synthesizer
+    calls have been saved.
+    """
+
     class EventToSplitEvent(core_converters.abc.EventConverter):
         def __init__(
             self,
@@ -196,10 +619,19 @@ class EventToSafeSynthesis(csound_converters.EventToSoundFile):
 
             flat_event_list = []
             add_event(csound_concatenation_event)
+            # Segments are named by their position (and not by the
+            # order in which they are synthesized).
+            sound_file_path_prefix = cdd_utilities.get_scratch_space().get_path(
+                prefix="safe_synthesized_"
+            )
+            segment_index = 0
             for event in flat_event_list:
                 event.duration = float(event.duration)
                 if hasattr(event, "event_to_synthesize"):
-                    event.sound_file_path = f".safe_synthesized_{uuid.uuid4()}.wav"
+                    event.sound_file_path = (
+                        f"{sound_file_path_prefix}_{segment_index}.wav"
+                    )
+                    segment_index += 1
 
             synthesized_sound_file_path_tuple = (
                 csound_concatenation_event.get_parameter("sound_file_path", flat=True)
@@ -215,29 +647,24 @@ class EventToSafeSynthesis(csound_converters.EventToSoundFile):
                 csound_concatenation_event,
             )
 
-    csound_orchestra = r"""
-0dbfs=1
-instr 1
-    asig diskin2 p4
-    kenv linseg 0, 0.01, 1, p3 - 0.02, 1, 0.01, 0
-    out asig * kenv
-endin
-"""
+    # Rests which are longer split the event into segments
+    split_duration: float = 2
+    # Duration of the linear fade in and fade out of each segment
+    fade_duration: float = 0.01
+    # Duration at the start of each synthesized sound file which is skipped
+    skip_duration: float = 0
+    # Sampling rate of the mixed sound file (if it isn't a preview)
+    sampling_rate: int = 44100
 
     def __init__(
         self,
         event_to_sound_file: core_converters.abc.Converter,
         is_rest: typing.Callable[[core_events.SimpleEvent], bool],
+        maxima_time_stretch_ratio: float = 1,
     ):
         self._event_to_sound_file = event_to_sound_file
         self._is_rest = is_rest
-        temporary_csound_orchestra_path = f".{uuid.uuid4()}.orc"
-        super().__init__(
-            temporary_csound_orchestra_path,
-            csound_converters.EventToCsoundScore(
-                p4=lambda event: event.sound_file_path
-            ),
-        )
+        self._maxima_time_stretch_ratio = maxima_time_stretch_ratio
 
     def _submit_conversion(
         self,
@@ -253,23 +680,276 @@ endin
             **kwargs,
         )
 
-    def _render_synthesizer(
+    def _get_segment_key(
+        self, event_to_render_with_synthesizer: core_events.abc.Event
+    ) -> str:
+        """Get hash of all inputs of the synthesis of one segment.
+
+        This includes the events of the segment, the synthesizer
+        (with all its arguments, e.g. voice and seed) and the content
+        of all files which are passed to the synthesizer (e.g. isis
+        configuration files).
+        """
+
+        file_path_list = []
+        for flag_str in getattr(self._event_to_sound_file, "flags", ()):
+            for flag in shlex.split(str(flag_str)):
+                if os.path.isfile(flag):
+                    file_path_list.append(flag)
+        return cdd_utilities.get_stable_hash(
+            event_to_render_with_synthesizer,
+            self._event_to_sound_file,
+            # The start of the sound file which is skipped by the mixer
+            self.skip_duration,
+            tuple(
+                cdd_utilities.get_file_hash(file_path) for file_path in file_path_list
+            ),
+        )
+
+    def _get_cached_sound_file_path(
+        self, event_to_render_with_synthesizer: core_events.abc.Event
+    ) -> typing.Optional[str]:
+        if not (
+            synthesis_cache_directory_path := cdd_converters.configurations.SYNTHESIS_CACHE_DIRECTORY_PATH
+        ):
+            return None
+        return os.path.abspath(
+            f"{synthesis_cache_directory_path}/"
+            f"{self._get_segment_key(event_to_render_with_synthesizer)}.wav"
+        )
+
+    @staticmethod
+    def _add_to_cache(synthesizer_sound_file_path: str, cached_sound_file_path: str):
+        os.makedirs(os.path.dirname(cached_sound_file_path), exist_ok=True)
+        # Maybe another process synthesizes the same segment.
+        temporary_cached_sound_file_path = (
+            f"{cached_sound_file_path}.{os.getpid()}.{threading.get_ident()}"
+        )
+        shutil.copyfile(synthesizer_sound_file_path, temporary_cached_sound_file_path)
+        os.replace(temporary_cached_sound_file_path, cached_sound_file_path)
+
+    def _get_cacheable_index_tuple(
+        self, event_to_render_with_synthesizer_tuple: tuple[core_events.abc.Event, ...]
+    ) -> tuple[int, ...]:
+        """Get indices of segments which :meth:`_synthesize` renders alone.
+
+        Only the sound files of these segments depend on nothing but
+        their segment key, therefore only they are cached.
+        """
+
+        return tuple(range(len(event_to_render_with_synthesizer_tuple)))
+
+    def _synthesize(
         self,
         event_to_render_with_synthesizer_tuple: tuple[core_events.abc.Event, ...],
         synthesizer_sound_file_path_tuple: tuple[str, ...],
-    ):
-        for event_to_render_with_synthesizer, synthesizer_sound_file_path in zip(
-            event_to_render_with_synthesizer_tuple, synthesizer_sound_file_path_tuple
+    ) -> int:
+        """Synthesize segments.
+
+        :return: How often the synthesizer has been called.
+        """
+
+        # Segments are independent of each other: the synthesizers are
+        # called with the same arguments (and therefore the same seed)
+        # as if they were called one after the other.
+        executor = _get_synthesis_executor(
+            cdd_converters.configurations.SYNTHESIS_JOB_COUNT
+        )
+        future_list = [
+            executor.submit(
+                self._submit_conversion,
+                event_to_render_with_synthesizer,
+                synthesizer_sound_file_path,
+            )
+            for event_to_render_with_synthesizer, synthesizer_sound_file_path in zip(
+                event_to_render_with_synthesizer_tuple,
+                synthesizer_sound_file_path_tuple,
+            )
+        ]
+        # Wait for all segments before the temporary files are removed.
+        concurrent.futures.wait(future_list)
+        for future in future_list:
+            future.result()
+        return len(future_list)
+
+    def _get_phrase_key(
+        self, event_to_render_with_synthesizer: core_events.SequentialEvent
+    ) -> str:
+        """Get hash of segment which doesn't depend on its tempo."""
+
+        duration = float(event_to_render_with_synthesizer.duration)
+        phrase = event_to_render_with_synthesizer.copy()
+        for simple_event in phrase:
+            # Rounded, so that tempo conversions with different
+            # floating point errors still return the same phrase.
+            simple_event.duration = round(float(simple_event.duration) / duration, 6)
+        return self._get_segment_key(phrase)
+
+    def _get_phrase_group_tuple(
+        self, event_to_render_with_synthesizer_tuple: tuple[core_events.abc.Event, ...]
+    ) -> tuple[tuple[int, tuple[int, ...]], ...]:
+        """Group repetitions of the same phrase.
+
+        :return: Index of the segment which is synthesized and indices
+            of all segments which are derived from it (including itself).
+            Rests (``None``) are skipped.
+        """
+
+        phrase_key_to_index_list, index_to_duration = {}, {}
+        for index, event_to_render_with_synthesizer in enumerate(
+            event_to_render_with_synthesizer_tuple
         ):
             if event_to_render_with_synthesizer is not None:
-                self._submit_conversion(
-                    event_to_render_with_synthesizer,
-                    synthesizer_sound_file_path,
+                phrase_key_to_index_list.setdefault(
+                    self._get_phrase_key(event_to_render_with_synthesizer), []
+                ).append(index)
+                index_to_duration[index] = float(
+                    event_to_render_with_synthesizer.duration
                 )
 
-    def _save_csound_orchestra(self):
-        with open(self.csound_orchestra_path, "w") as f:
-            f.write(self.csound_orchestra)
+        phrase_group_list = []
+        for index_list in phrase_key_to_index_list.values():
+            index_list.sort(key=lambda index: index_to_duration[index])
+            while index_list:
+                # The longest segment which the shortest segment can
+                # be derived from is synthesized, so that as many
+                # segments as possible can be derived from it.
+                maxima_duration = (
+                    index_to_duration[index_list[0]] * self._maxima_time_stretch_ratio
+                )
+                synthesized_index = [
+                    index
+                    for index in index_list
+                    if index_to_duration[index] <= maxima_duration
+                ][-1]
+                maxima_duration = (
+                    index_to_duration[synthesized_index]
+                    * self._maxima_time_stretch_ratio
+                )
+                derived_index_tuple = tuple(
+                    index
+                    for index in index_list
+                    if index_to_duration[index] <= maxima_duration
+                )
+                phrase_group_list.append((synthesized_index, derived_index_tuple))
+                index_list = index_list[len(derived_index_tuple) :]
+        return tuple(phrase_group_list)
+
+    def _derive_segment(
+        self,
+        synthesized_sound_file_path: str,
+        synthesized_duration: float,
+        derived_sound_file_path: str,
+        derived_duration: float,
+    ):
+        # The synthesizer failed, the repetitions stay silent too.
+        if not os.path.exists(synthesized_sound_file_path):
+            return
+        if derived_duration == synthesized_duration:
+            os.symlink(
+                os.path.abspath(synthesized_sound_file_path), derived_sound_file_path
+            )
+            return
+
+        import librosa
+
+        sample_array, sampling_rate = soundfile.read(
+            synthesized_sound_file_path, dtype="float32", always_2d=True
+        )
+        # The skipped start isn't part of the phrase.
+        skip_frame_count = round(self.skip_duration * sampling_rate)
+        stretched_sample_array = np.stack(
+            [
+                librosa.effects.time_stretch(
+                    np.ascontiguousarray(channel),
+                    rate=synthesized_duration / derived_duration,
+                )
+                for channel in sample_array[skip_frame_count:].T
+            ],
+            axis=1,
+        )
+        soundfile.write(
+            derived_sound_file_path,
+            np.concatenate((sample_array[:skip_frame_count], stretched_sample_array)),
+            sampling_rate,
+            subtype="FLOAT",
+        )
+
+    def _render_synthesizer(
+        self,
+        event_to_render_with_synthesizer_tuple: tuple[core_events.abc.Event, ...],
+        synthesizer_sound_file_path_tuple: tuple[str, ...],
+    ) -> SafeSynthesisStatistic:
+        phrase_group_tuple = self._get_phrase_group_tuple(
+            event_to_render_with_synthesizer_tuple
+        )
+
+        synthesized_index_list, cached_sound_file_path_list = [], []
+        for synthesized_index, _ in phrase_group_tuple:
+            cached_sound_file_path = self._get_cached_sound_file_path(
+                event_to_render_with_synthesizer_tuple[synthesized_index]
+            )
+            if cached_sound_file_path and os.path.exists(cached_sound_file_path):
+                # The temporary sound file is removed after mixing,
+                # the cached sound file is kept.
+                os.symlink(
+                    cached_sound_file_path,
+                    synthesizer_sound_file_path_tuple[synthesized_index],
+                )
+            else:
+                synthesized_index_list.append(synthesized_index)
+                cached_sound_file_path_list.append(cached_sound_file_path)
+
+        synthesized_event_tuple = tuple(
+            event_to_render_with_synthesizer_tuple[synthesized_index]
+            for synthesized_index in synthesized_index_list
+        )
+        synthesis_count = self._synthesize(
+            synthesized_event_tuple,
+            tuple(
+                synthesizer_sound_file_path_tuple[synthesized_index]
+                for synthesized_index in synthesized_index_list
+            ),
+        )
+        for index in self._get_cacheable_index_tuple(synthesized_event_tuple):
+            synthesized_index = synthesized_index_list[index]
+            cached_sound_file_path = cached_sound_file_path_list[index]
+            synthesizer_sound_file_path = synthesizer_sound_file_path_tuple[
+                synthesized_index
+            ]
+            # If the synthesizer failed, the segment stays silent.
+            if cached_sound_file_path and os.path.exists(synthesizer_sound_file_path):
+                self._add_to_cache(synthesizer_sound_file_path, cached_sound_file_path)
+
+        executor = _get_synthesis_executor(
+            cdd_converters.configurations.SYNTHESIS_JOB_COUNT
+        )
+        duration_tuple = tuple(
+            float(event.duration) if event is not None else 0
+            for event in event_to_render_with_synthesizer_tuple
+        )
+        derivation_future_list = [
+            executor.submit(
+                self._derive_segment,
+                synthesizer_sound_file_path_tuple[synthesized_index],
+                duration_tuple[synthesized_index],
+                synthesizer_sound_file_path_tuple[derived_index],
+                duration_tuple[derived_index],
+            )
+            for synthesized_index, derived_index_tuple in phrase_group_tuple
+            for derived_index in derived_index_tuple
+            if derived_index != synthesized_index
+        ]
+        concurrent.futures.wait(derivation_future_list)
+        for future in derivation_future_list:
+            future.result()
+
+        return SafeSynthesisStatistic(
+            sum(len(index_tuple) for _, index_tuple in phrase_group_tuple),
+            synthesis_count,
+            len(derivation_future_list),
+            len(phrase_group_tuple) - len(synthesized_index_list),
+        )
 
     def _remove_temporary_sound_files(
         self, synthesizer_sound_file_path_tuple: tuple[str, ...]
@@ -281,58 +961,251 @@ endin
                 except FileNotFoundError:
                     pass
 
-    def _remove_csound_orchestra(self):
-        os.remove(self.csound_orchestra_path)
+    def _get_sampling_rate(self) -> int:
+        if cdd_converters.configurations.IS_PREVIEW:
+            return cdd_converters.configurations.PREVIEW_SAMPLING_RATE
+        return self.sampling_rate
+
+    def _read_segment(
+        self, segment_sound_file_path: str, frame_count: int, sampling_rate: int
+    ) -> np.ndarray:
+        """Read faded mono segment with exactly ``frame_count`` frames.
+
+        Synthesized sound files which are too short are padded with
+        silence, sound files with another sampling rate are resampled.
+        """
 
-    def convert(self, event_to_convert: str, sound_file_path: str):
+        with soundfile.SoundFile(segment_sound_file_path) as sound_file:
+            file_sampling_rate = sound_file.samplerate
+            sound_file.seek(
+                min(round(self.skip_duration * file_sampling_rate), sound_file.frames)
+            )
+            # Only read the frames which are actually needed
+            segment_array = sound_file.read(
+                int(np.ceil(frame_count * file_sampling_rate / sampling_rate)) + 1,
+                dtype="float64",
+                always_2d=True,
+            ).mean(axis=1)
+
+        if file_sampling_rate != sampling_rate:
+            segment_array = np.interp(
+                np.arange(frame_count) * (file_sampling_rate / sampling_rate),
+                np.arange(len(segment_array)),
+                segment_array,
+                right=0,
+            )
+        segment_array = segment_array[:frame_count]
+        if (missing_frame_count := frame_count - len(segment_array)) > 0:
+            segment_array = np.pad(segment_array, (0, missing_frame_count))
+
+        # Trapezoid envelope: rises to 1 within 'fade_duration' and
+        # falls to 0 within 'fade_duration' before the segment ends.
+        frame_index_array = np.arange(frame_count, dtype="float64")
+        fade_frame_count = max(self.fade_duration * sampling_rate, 1)
+        segment_array *= np.clip(
+            np.minimum(frame_index_array, frame_count - frame_index_array)
+            / fade_frame_count,
+            0,
+            1,
+        )
+        return segment_array
+
+    def _mix(
+        self, csound_concatenation_event: core_events.abc.Event, sound_file_path: str
+    ):
+        sampling_rate = self._get_sampling_rate()
+        segment_array_and_offset_list = []
+        for absolute_time, simple_event in _get_absolute_time_and_simple_event_tuple(
+            csound_concatenation_event
+        ):
+            # Ensure that even when some sound files couldn't be
+            # rendered, the converter can still render the complete
+            # sound file (they are simply silent).
+            if not (
+                segment_sound_file_path := getattr(
+                    simple_event, "sound_file_path", None
+                )
+            ) or not os.path.exists(segment_sound_file_path):
+                continue
+            offset = round(float(absolute_time) * sampling_rate)
+            frame_count = (
+                round(float(absolute_time + simple_event.duration) * sampling_rate)
+                - offset
+            )
+            if frame_count > 0:
+                segment_array_and_offset_list.append(
+                    (
+                        self._read_segment(
+                            segment_sound_file_path, frame_count, sampling_rate
+                        ),
+                        offset,
+                    )
+                )
+
+        # The sound file ends with the last synthesized segment.
+        mixed_sample_array = np.zeros(
+            max(
+                (
+                    offset + len(segment_array)
+                    for segment_array, offset in segment_array_and_offset_list
+                ),
+                default=0,
+            )
+        )
+        for segment_array, offset in segment_array_and_offset_list:
+            mixed_sample_array[offset : offset + len(segment_array)] += segment_array
+        soundfile.write(
+            sound_file_path, mixed_sample_array, sampling_rate, subtype="PCM_16"
+        )
+
+    def _split(
+        self, event_to_convert: core_events.abc.Event
+    ) -> tuple[tuple[str, ...], tuple[typing.Any, ...], core_events.abc.Event]:
+        """Split event into segments.
+
+        :return: Temporary sound file paths of the segments, the
+            segments and the event which is mixed (with the
+            sound file path of each segment).
+        """
+
+        return self.EventToSplitEvent(self._is_rest, self.split_duration)(
+            event_to_convert
+        )
+
+    def convert(
+        self, event_to_convert: str, sound_file_path: str
+    ) -> SafeSynthesisStatistic:
         (
             synthesizer_sound_file_path_tuple,
             event_to_render_with_synthesizer_tuple,
             csound_concatenation_event,
-        ) = self.EventToSplitEvent(self._is_rest)(event_to_convert)
-        self._render_synthesizer(
-            event_to_render_with_synthesizer_tuple, synthesizer_sound_file_path_tuple
-        )
-        self._save_csound_orchestra()
-        # Ensure that even when some sound files couldn't be rendered,
-        # the converter can still render the complete sound file
-        # (avoid csound errors).
-        for simple_event in csound_concatenation_event:
-            if hasattr(simple_event, "sound_file_path"):
-                if not os.path.exists(simple_event.sound_file_path):
-                    del simple_event.sound_file_path
-        super().convert(csound_concatenation_event, sound_file_path)
-        self._remove_temporary_sound_files(synthesizer_sound_file_path_tuple)
-        self._remove_csound_orchestra()
+        ) = self._split(event_to_convert)
+        try:
+            safe_synthesis_statistic = self._render_synthesizer(
+                event_to_render_with_synthesizer_tuple,
+                synthesizer_sound_file_path_tuple,
+            )
+            self._mix(csound_concatenation_event, sound_file_path)
+        finally:
+            self._remove_temporary_sound_files(synthesizer_sound_file_path_tuple)
+        return safe_synthesis_statistic
 
 
 class EventToSafeSpeakingSynthesis(EventToSafeSynthesis):
+    """Speak event (or :class:`PhonemeStream`) with mbrola in segments.
+
+    :param voice: The mbrola voice which speaks the segments.
+    :param event_to_phoneme_list: Converts the segments of events
+        (but not of phoneme streams) to the input of mbrola.
+    """
+
     def __init__(
         self,
-        event_to_speak_synthesis: mbrola_converters.EventToSpeakSynthesis = mbrola_converters.EventToSpeakSynthesis(),
+        voice: voxpopuli.Voice = voxpopuli.Voice(),
+        event_to_phoneme_list: mbrola_converters.EventToPhonemeList = mbrola_converters.EventToPhonemeList(),
     ):
         is_rest = (
-            lambda simple_event: not event_to_speak_synthesis._event_to_phoneme_list._simple_event_to_pitch(
-                simple_event
-            )
-            or event_to_speak_synthesis._event_to_phoneme_list._simple_event_to_phoneme_string(
+            lambda simple_event: not event_to_phoneme_list._simple_event_to_pitch(
                 simple_event
             )
+            or event_to_phoneme_list._simple_event_to_phoneme_string(simple_event)
             == "_"
         )
-        super().__init__(event_to_speak_synthesis, is_rest)
+        super().__init__(
+            mbrola_converters.EventToSpeakSynthesis(voice, event_to_phoneme_list),
+            is_rest,
+        )
+        self._voice = voice
+
+    def _split(
+        self,
+        event_to_convert: typing.Union[
+            core_events.abc.Event, cdd_converters.PhonemeStream
+        ],
+    ) -> tuple[tuple[str, ...], tuple[typing.Any, ...], core_events.abc.Event]:
+        if not isinstance(event_to_convert, cdd_converters.PhonemeStream):
+            return super()._split(event_to_convert)
+
+        phoneme_stream = event_to_convert
+        is_long_rest_array = phoneme_stream.is_rest_array & (
+            phoneme_stream.duration_array > self.split_duration
+        )
+        # Segments are all phonemes between long rests.
+        is_segment_start_array = np.ones(len(phoneme_stream), dtype=bool)
+        is_segment_start_array[1:] = is_long_rest_array[1:] != is_long_rest_array[:-1]
+        segment_start_array = np.flatnonzero(is_segment_start_array)
+        sound_file_path_prefix = cdd_utilities.get_scratch_space().get_path(
+            prefix="safe_synthesized_"
+        )
+        synthesizer_sound_file_path_list, segment_list = [], []
+        csound_concatenation_event = core_events.SequentialEvent([])
+        for segment_start, segment_end in zip(
+            segment_start_array.tolist(),
+            segment_start_array[1:].tolist() + [len(phoneme_stream)],
+        ):
+            segment = phoneme_stream[segment_start:segment_end]
+            simple_event = core_events.SimpleEvent(segment.duration)
+            if not is_long_rest_array[segment_start]:
+                simple_event.sound_file_path = (
+                    f"{sound_file_path_prefix}_{len(segment_list)}.wav"
+                )
+                synthesizer_sound_file_path_list.append(simple_event.sound_file_path)
+                segment_list.append(segment)
+            csound_concatenation_event.append(simple_event)
+        return (
+            tuple(synthesizer_sound_file_path_list),
+            tuple(segment_list),
+            csound_concatenation_event,
+        )
+
+    def _submit_conversion(
+        self,
+        event_to_render_with_synthesizer: typing.Union[
+            core_events.abc.Event, cdd_converters.PhonemeStream
+        ],
+        synthesizer_sound_file_path: str,
+        *args,
+        **kwargs,
+    ):
+        if not isinstance(
+            event_to_render_with_synthesizer, cdd_converters.PhonemeStream
+        ):
+            return super()._submit_conversion(
+                event_to_render_with_synthesizer,
+                synthesizer_sound_file_path,
+                *args,
+                **kwargs,
+            )
+        # mbrola reads the phonemes directly (without any events).
+        self._voice.to_audio(
+            event_to_render_with_synthesizer.to_phoneme_list(),
+            synthesizer_sound_file_path,
+        )
+
+    def _get_phrase_key(
+        self,
+        event_to_render_with_synthesizer: typing.Union[
+            core_events.SequentialEvent, cdd_converters.PhonemeStream
+        ],
+    ) -> str:
+        if not isinstance(
+            event_to_render_with_synthesizer, cdd_converters.PhonemeStream
+        ):
+            return super()._get_phrase_key(event_to_render_with_synthesizer)
+        phrase = event_to_render_with_synthesizer.copy()
+        phrase.duration_array = np.round(
+            phrase.duration_array / event_to_render_with_synthesizer.duration, 6
+        )
+        return self._get_segment_key(phrase)
 
 
 class EventToSafeSingingSynthesis(EventToSafeSynthesis):
-    csound_orchestra = r"""
-0dbfs=1
-instr 1
-    ; 1 second skip time because isis always starts one second late!
-    asig diskin2 p4, 1, 1
-    kenv linseg 0, 0.02, 1, p3 - 0.04, 1, 0.02, 0
-    out asig * kenv
-endin
-"""
+    fade_duration = 0.02
+    # isis always starts one second late! This is removed when the
+    # sound file of isis is split into segments.
+    isis_delay_duration: float = 1
+    # Rest between the segments of one isis call
+    batch_rest_duration: float = 2
 
     def __init__(
         self,
@@ -371,10 +1244,131 @@ endin
 
     def _submit_conversion(self, *args, **kwargs):
         return super()._submit_conversion(
-            *args, score_path=f".isis_score_{uuid.uuid4()}.cfg", **kwargs
+            *args,
+            score_path=cdd_utilities.get_scratch_space().get_path(
+                suffix=".cfg", prefix="isis_score_"
+            ),
+            **kwargs,
         )
 
-    def convert(self, event_to_convert: core_events.abc.Event, *args, **kwargs):
+    def _get_batch_tuple(
+        self, event_to_render_with_synthesizer_tuple: tuple[core_events.abc.Event, ...]
+    ) -> tuple[tuple[int, ...], ...]:
+        """Split segments into batches which isis synthesizes together."""
+
+        maxima_duration = cdd_converters.configurations.ISIS_BATCH_MAXIMA_DURATION
+        batch_list, batch_duration = [], 0
+        for index, event_to_render_with_synthesizer in enumerate(
+            event_to_render_with_synthesizer_tuple
+        ):
+            duration = float(event_to_render_with_synthesizer.duration)
+            if (
+                batch_list
+                and maxima_duration is not None
+                and batch_duration + self.batch_rest_duration + duration
+                <= maxima_duration
+            ):
+                batch_list[-1].append(index)
+                batch_duration += self.batch_rest_duration + duration
+            else:
+                batch_list.append([index])
+                batch_duration = duration
+        return tuple(map(tuple, batch_list))
+
+    def _get_cacheable_index_tuple(
+        self, event_to_render_with_synthesizer_tuple: tuple[core_events.abc.Event, ...]
+    ) -> tuple[int, ...]:
+        # The isis output of one segment also depends on the other
+        # segments of its batch (one seeded random generator is used
+        # for the complete call), so only segments which have been
+        # synthesized without any other segment are cached.
+        return tuple(
+            batch[0]
+            for batch in self._get_batch_tuple(event_to_render_with_synthesizer_tuple)
+            if len(batch) == 1
+        )
+
+    def _synthesize_batch(
+        self,
+        event_to_render_with_synthesizer_tuple: tuple[core_events.abc.Event, ...],
+        synthesizer_sound_file_path_tuple: tuple[str, ...],
+    ):
+        batch_event, segment_start_list = core_events.SequentialEvent([]), []
+        for event_to_render_with_synthesizer in event_to_render_with_synthesizer_tuple:
+            if batch_event:
+                batch_event.append(core_events.SimpleEvent(self.batch_rest_duration))
+            segment_start_list.append(float(batch_event.duration))
+            batch_event.extend(event_to_render_with_synthesizer)
+        batch_sound_file_path = cdd_utilities.get_scratch_space().get_path(
+            suffix=".wav", prefix="isis_batch_"
+        )
+        self._submit_conversion(batch_event, batch_sound_file_path)
+        # isis failed, all segments stay silent.
+        if not os.path.exists(batch_sound_file_path):
+            return
+        try:
+            sample_array, sampling_rate = soundfile.read(
+                batch_sound_file_path, dtype="float32", always_2d=True
+            )
+        finally:
+            os.remove(batch_sound_file_path)
+
+        # Each segment lasts until the next segment starts, so that
+        # segments which are time-stretched keep their release.
+        segment_start_frame_list = [
+            round((self.isis_delay_duration + segment_start) * sampling_rate)
+            for segment_start in segment_start_list
+        ] + [len(sample_array)]
+        for (
+            synthesizer_sound_file_path,
+            segment_start_frame,
+            segment_end_frame,
+        ) in zip(
+            synthesizer_sound_file_path_tuple,
+            segment_start_frame_list,
+            segment_start_frame_list[1:],
+        ):
+            soundfile.write(
+                synthesizer_sound_file_path,
+                sample_array[segment_start_frame:segment_end_frame],
+                sampling_rate,
+                subtype="FLOAT",
+            )
+
+    def _synthesize(
+        self,
+        event_to_render_with_synthesizer_tuple: tuple[core_events.abc.Event, ...],
+        synthesizer_sound_file_path_tuple: tuple[str, ...],
+    ) -> int:
+        executor = _get_synthesis_executor(
+            cdd_converters.configurations.SYNTHESIS_JOB_COUNT
+        )
+        future_list = [
+            executor.submit(
+                self._synthesize_batch,
+                tuple(event_to_render_with_synthesizer_tuple[index] for index in batch),
+                tuple(synthesizer_sound_file_path_tuple[index] for index in batch),
+            )
+            for batch in self._get_batch_tuple(event_to_render_with_synthesizer_tuple)
+        ]
+        concurrent.futures.wait(future_list)
+        for future in future_list:
+            future.result()
+        return len(future_list)
+
+    def _render_synthesizer(self, *args, **kwargs) -> SafeSynthesisStatistic:
+        # isis is by far the slowest synthesizer. Segments which aren't
+        # synthesized are simply silent in the concatenated sound file.
+        if (
+            cdd_converters.configurations.IS_PREVIEW
+            and cdd_converters.configurations.PREVIEW_SKIP_SINGING_SYNTHESIS
+        ):
+            return SafeSynthesisStatistic(0, 0, 0, 0)
+        return super()._render_synthesizer(*args, **kwargs)
+
+    def convert(
+        self, event_to_convert: core_events.abc.Event, *args, **kwargs
+    ) -> SafeSynthesisStatistic:
         return super().convert(event_to_convert, *args, **kwargs)
 
 
@@ -409,148 +1403,523 @@ class MonoBellCsoundSimultaneousEventToBellSoundFile(
         )
 
 
+class SlicedEventToSoundFile(core_converters.abc.Converter):
+    """Render event in time slices which csound renders in parallel.
+
+    :param event_to_sound_file: The converter which renders each slice.
+    :param slice_duration: Duration of one slice in seconds. To keep
+        all events at exactly the same sample position as in a
+        render of the complete event, this should be a multiple
+        of the control period of the orchestra (e.g. whole seconds).
+    :param subtype: Sample format of the rendered sound file (see
+        :func:`soundfile.available_subtypes`). This should be the
+        format in which csound writes with the flags of
+        ``event_to_sound_file`` (by default 16 bit).
+
+    If csound fails for one slice, a ``RuntimeError`` is raised and
+    no sound file is written.
+
+    Each slice contains all simple events which start in the slice,
+    with their complete duration: events which ring past the end of
+    the slice (e.g. bells with their long release) are rendered
+    completely and overlap with the next slices. All slices are
+    rendered with 32 bit float samples and summed at their sample
+    offset. The result equals a render of the complete event as long
+    as the instruments of the orchestra don't depend on each other
+    (e.g. via global variables) or on random numbers.
+    """
+
+    def __init__(
+        self,
+        event_to_sound_file: csound_converters.EventToSoundFile,
+        slice_duration: core_constants.DurationType = 60,
+        subtype: str = "PCM_16",
+    ):
+        self._event_to_sound_file = copy.copy(event_to_sound_file)
+        self._event_to_sound_file.flags = tuple(event_to_sound_file.flags) + ("-f",)
+        self._slice_duration = slice_duration
+        self._subtype = subtype
+
+    def _get_slice_tuple(
+        self, event_to_convert: core_events.abc.Event
+    ) -> tuple[tuple[core_constants.DurationType, core_events.SimultaneousEvent], ...]:
+        slice_index_to_simultaneous_event = {}
+        for (
+            absolute_time,
+            simple_event,
+        ) in _get_absolute_time_and_simple_event_tuple(event_to_convert):
+            slice_index = int(absolute_time // self._slice_duration)
+            slice_start = slice_index * self._slice_duration
+            sequential_event = core_events.SequentialEvent([simple_event])
+            if delay := absolute_time - slice_start:
+                sequential_event.insert(0, core_events.SimpleEvent(delay))
+            slice_index_to_simultaneous_event.setdefault(
+                slice_index, core_events.SimultaneousEvent([])
+            ).append(sequential_event)
+        return tuple(
+            (slice_index * self._slice_duration, simultaneous_event)
+            for slice_index, simultaneous_event in sorted(
+                slice_index_to_simultaneous_event.items()
+            )
+        )
+
+    def _mix(
+        self,
+        slice_start_and_sound_file_path_tuple: tuple[
+            tuple[core_constants.DurationType, str], ...
+        ],
+        path: str,
+    ):
+        sample_array_and_offset_list, sampling_rate = [], None
+        for slice_start, sound_file_path in slice_start_and_sound_file_path_tuple:
+            sample_array, sampling_rate = soundfile.read(
+                sound_file_path, dtype="float64", always_2d=True
+            )
+            sample_array_and_offset_list.append(
+                (sample_array, round(float(slice_start) * sampling_rate))
+            )
+        if not sample_array_and_offset_list:
+            return
+        mixed_sample_array = np.zeros(
+            (
+                max(
+                    offset + len(sample_array)
+                    for sample_array, offset in sample_array_and_offset_list
+                ),
+                sample_array_and_offset_list[0][0].shape[1],
+            )
+        )
+        for sample_array, offset in sample_array_and_offset_list:
+            mixed_sample_array[offset : offset + len(sample_array)] += sample_array
+        soundfile.write(path, mixed_sample_array, sampling_rate, subtype=self._subtype)
+
+    def convert(self, event_to_convert: core_events.abc.Event, path: str):
+        if (
+            build_cache_directory_path := cdd_converters.configurations.BUILD_CACHE_DIRECTORY_PATH
+        ):
+            build_cache = cdd_utilities.BuildCache(build_cache_directory_path)
+            build_key = cdd_utilities.get_stable_hash(
+                self._slice_duration,
+                self._subtype,
+                self._event_to_sound_file._get_build_key(
+                    event_to_convert, self._event_to_sound_file._get_csound_orchestra()[0]
+                ),
+            )
+            if build_cache.is_up_to_date(path, build_key):
+                return
+        else:
+            build_cache = None
+
+        slice_start_and_sound_file_path_list, future_list = [], []
+        for slice_index, (slice_start, slice_event) in enumerate(
+            self._get_slice_tuple(event_to_convert)
+        ):
+            sound_file_path = f"{path}.slice_{slice_index}.wav"
+            slice_start_and_sound_file_path_list.append((slice_start, sound_file_path))
+            future_list.append(
+                # Slices are temporary: they mustn't be in the build cache.
+                self._event_to_sound_file.submit(
+                    slice_event, sound_file_path, use_build_cache=False
+                )
+            )
+        try:
+            # Slices mustn't be removed while csound still writes them.
+            concurrent.futures.wait(future_list)
+            # If one slice failed, the sound file would be incomplete:
+            # it is neither written nor registered in the build cache.
+            for future in future_list:
+                future.result()
+            self._mix(tuple(slice_start_and_sound_file_path_list), path)
+        finally:
+            for _, sound_file_path in slice_start_and_sound_file_path_list:
+                try:
+                    os.remove(sound_file_path)
+                except FileNotFoundError:
+                    pass
+
+        if build_cache and os.path.exists(path):
+            build_cache.register(path, build_key)
+
+
 class EnvelopeToFunctionTable(core_converters.abc.Converter):
-    def __init__(self, gen_routine_index: int = 7):
-        self._gen_routine_index = gen_routine_index
+    """Convert envelope to csound function table definition.
 
-    def convert(
-        self, envelope_to_convert: core_events.Envelope, function_table_index: int
-    ) -> str:
-        envelope_duration = envelope_to_convert.duration
-        expected_table_size = 100000
-        table_size = 0
+    :param gen_routine_index: GEN routine of inline function tables.
+    :param table_size: How many points the function table has
+        (approximately, each segment has at least one point).
+    :param maxima_segment_count: Envelopes with more segments are
+        simplified.
+    :param maxima_error: Envelopes are simplified as long as no value
+        of the simplified envelope differs more than this from the
+        original envelope (and as long as they have more than
+        ``maxima_segment_count`` segments).
+    :param binary_directory_path: If set, envelopes with more than
+        ``maxima_segment_count`` segments aren't simplified, but
+        sampled into a binary file (32 bit floats) in this directory.
+        The function table reads this file with GEN01.
+
+    Envelopes are simplified with the Ramer-Douglas-Peucker
+    algorithm: starting with the first and the last point, the point
+    which is the most distant to the simplified envelope is added
+    until the simplified envelope is precise enough.
+    """
+
+    def __init__(
+        self,
+        gen_routine_index: int = 7,
+        table_size: int = 100000,
         # XXX: CSound returns odd error if there are more than x entries
         #       ftable 17203: gen call has negative segment size:
         # even though no segment is negative
-        maxima_entry_count = 1000
-        function_table_element_list = []
-        for value, duration in zip(
-            envelope_to_convert.value_tuple,
-            envelope_to_convert.get_parameter("duration"),
-        ):
-            value = str(core_utilities.round_floats(float(value), 8))
-            duration = max(int((duration / envelope_duration) * expected_table_size), 1)
-            table_size += duration
-            if len(function_table_element_list) < maxima_entry_count:
-                function_table_element_list.extend([str(value), str(duration)])
-            else:
-                function_table_element_list[-3] = str(
-                    int(function_table_element_list[-3]) + duration
+        maxima_segment_count: int = 500,
+        maxima_error: float = 0.001,
+        binary_directory_path: typing.Optional[str] = None,
+    ):
+        self._gen_routine_index = gen_routine_index
+        self._table_size = table_size
+        self._maxima_segment_count = maxima_segment_count
+        self._maxima_error = maxima_error
+        self._binary_directory_path = binary_directory_path
+
+    def _get_point_array_tuple(
+        self, envelope_to_convert: core_events.Envelope
+    ) -> tuple[np.ndarray, np.ndarray]:
+        value_array = np.array(envelope_to_convert.value_tuple, dtype=float)
+        duration_array = np.array(
+            envelope_to_convert.get_parameter("duration"), dtype=float
+        )
+        position_array = np.concatenate(([0], np.cumsum(duration_array)))
+        # The last value lasts until the end of the envelope.
+        value_array = np.append(value_array, value_array[-1])
+        return position_array / position_array[-1] * self._table_size, value_array
+
+    def _simplify(
+        self, position_array: np.ndarray, value_array: np.ndarray
+    ) -> np.ndarray:
+        """Get indices of points which are kept (see class docstring)."""
+
+        def get_segment(start_index: int, end_index: int) -> tuple:
+            if end_index - start_index < 2:
+                return (0, start_index, end_index, start_index)
+            local_position_array = position_array[start_index : end_index + 1]
+            error_array = np.abs(
+                value_array[start_index : end_index + 1]
+                - np.interp(
+                    local_position_array,
+                    local_position_array[[0, -1]],
+                    value_array[[start_index, end_index]],
                 )
+            )
+            maxima_error_index = int(np.argmax(error_array))
+            # Negative error: 'heapq' pops the smallest item first.
+            return (
+                -error_array[maxima_error_index],
+                start_index,
+                end_index,
+                start_index + maxima_error_index,
+            )
 
-        if function_table_element_list:
-            # To have value at the end
-            function_table_element_list.append(function_table_element_list[-2])
-        else:
-            table_size = 10
-            function_table_element_list = f"0.5 {table_size} 0.5".split(" ")
+        kept_index_list = [0, len(position_array) - 1]
+        segment_heap = [get_segment(*kept_index_list)]
+        while len(kept_index_list) <= self._maxima_segment_count:
+            negative_error, start_index, end_index, split_index = heapq.heappop(
+                segment_heap
+            )
+            if -negative_error <= self._maxima_error:
+                break
+            kept_index_list.append(split_index)
+            heapq.heappush(segment_heap, get_segment(start_index, split_index))
+            heapq.heappush(segment_heap, get_segment(split_index, end_index))
+        return np.sort(kept_index_list)
+
+    def _convert_to_binary_argument_str(
+        self, position_array: np.ndarray, value_array: np.ndarray
+    ) -> str:
+        sample_array = np.interp(
+            np.arange(self._table_size), position_array, value_array
+        ).astype(np.float32)
+        os.makedirs(self._binary_directory_path, exist_ok=True)
+        binary_path = f"{self._binary_directory_path}/{cdd_utilities.get_stable_hash(sample_array)}.raw"
+        if not os.path.exists(binary_path):
+            temporary_binary_path = (
+                f"{binary_path}.{os.getpid()}.{threading.get_ident()}"
+            )
+            sample_array.tofile(temporary_binary_path)
+            os.replace(temporary_binary_path, binary_path)
+        # Size 0: csound takes the size of the file. Negative GEN
+        # routine index: values aren't normalized. Format 6: 32 bit floats.
+        return f'0 0 -1 "{binary_path}" 0 6 1'
+
+    def convert_to_argument_str(self, envelope_to_convert: core_events.Envelope) -> str:
+        """Get function table definition without its index"""
 
-        function_table_element_str = " ".join(function_table_element_list)
-        return f"f {function_table_index} 0 {table_size} {self._gen_routine_index} {function_table_element_str}"
+        if len(envelope_to_convert) == 0 or not envelope_to_convert.duration:
+            value = (
+                round(float(envelope_to_convert.value_tuple[0]), 8)
+                if len(envelope_to_convert)
+                else 0.5
+            )
+            return f"0 10 {self._gen_routine_index} {value!r} 10 {value!r}"
+
+        position_array, value_array = self._get_point_array_tuple(envelope_to_convert)
+        if (
+            self._binary_directory_path is not None
+            and len(position_array) - 1 > self._maxima_segment_count
+        ):
+            return self._convert_to_binary_argument_str(position_array, value_array)
+
+        kept_index_array = self._simplify(position_array, value_array)
+        position_array = np.round(position_array[kept_index_array]).astype(int)
+        value_array = np.round(value_array[kept_index_array], 8)
+        # Each segment needs at least one point.
+        duration_array = np.maximum(np.diff(position_array), 1)
+        table_size = int(duration_array.sum())
+
+        function_table_element_list = [None] * (len(value_array) + len(duration_array))
+        function_table_element_list[::2] = value_array.tolist()
+        function_table_element_list[1::2] = duration_array.tolist()
+        function_table_element_str = (
+            "%r %d " * len(duration_array) + "%r"
+        ) % tuple(function_table_element_list)
+        return f"0 {table_size} {self._gen_routine_index} {function_table_element_str}"
+
+    def convert(
+        self, envelope_to_convert: core_events.Envelope, function_table_index: int
+    ) -> str:
+        return f"f {function_table_index} {self.convert_to_argument_str(envelope_to_convert)}"
+
+
+@dataclasses.dataclass
+class _FunctionTableScoreContext(object):
+    """State of one :meth:`EventToCsoundScoreWithFunctionTables.convert` call"""
+
+    score_file: typing.TextIO
+    function_table_key_to_function_table_index: dict[str, int] = dataclasses.field(
+        default_factory=dict
+    )
+    # Function tables of the event which is currently converted
+    envelope_attribute_to_function_table_index_tuple: dict[
+        str, tuple[int, ...]
+    ] = dataclasses.field(default_factory=dict)
+
+
+# P-field functions only get the event, so they find the state of the
+# conversion in the context: parallel conversions (in other threads)
+# have their own context and never see each others function tables.
+_function_table_score_context: contextvars.ContextVar[
+    _FunctionTableScoreContext
+] = contextvars.ContextVar("function_table_score_context")
 
 
 class EventToCsoundScoreWithFunctionTables(csound_converters.EventToCsoundScore):
+    """Convert event to csound score which also defines function tables.
+
+    :param envelope_attribute_tuple: Names of attributes of events
+        which contain tuples of envelopes. For each envelope a
+        function table is defined. P-field functions can get the
+        index of these tables with :meth:`get_function_table_index`.
+    :param **pfield: See :class:`mutwo.csound_converters.EventToCsoundScore`.
+
+    Function tables with the same content are only defined once
+    and shared by all events which use them. Function tables of
+    the envelopes of events are written to the score together with
+    the line of the event. All lines are written as soon as an event
+    is converted, so that even scores of huge events never need to
+    be in memory at once. One converter can write multiple scores
+    at the same time (in different threads).
+    """
+
+    _envelope_to_function_table = EnvelopeToFunctionTable()
+
+    def __init__(
+        self,
+        envelope_attribute_tuple: tuple[str, ...] = (
+            "spectral_centroid_envelope_tuple",
+            "spectral_contrast_envelope_tuple",
+        ),
+        **pfield,
+    ):
+        super().__init__(**pfield)
+        self._envelope_attribute_tuple = envelope_attribute_tuple
+
+    def _get_function_table_index(
+        self, envelope: core_events.Envelope, context: _FunctionTableScoreContext
+    ) -> int:
+        function_table_argument_str = (
+            self._envelope_to_function_table.convert_to_argument_str(envelope)
+        )
+        # Values are already rounded by 'EnvelopeToFunctionTable', so
+        # (nearly) equal envelopes lead to equal definitions.
+        function_table_key = cdd_utilities.get_stable_hash(function_table_argument_str)
+        function_table_key_to_function_table_index = (
+            context.function_table_key_to_function_table_index
+        )
+        try:
+            return function_table_key_to_function_table_index[function_table_key]
+        except KeyError:
+            # Function table 0 doesn't exist in csound
+            function_table_index = function_table_key_to_function_table_index[
+                function_table_key
+            ] = (len(function_table_key_to_function_table_index) + 1)
+            context.score_file.write(
+                f"f {function_table_index} {function_table_argument_str}\n"
+            )
+            return function_table_index
+
+    def get_function_table_index(self, envelope_attribute: str, index: int) -> int:
+        """Get function table index of envelope of currently converted event.
+
+        :param envelope_attribute: Name of the attribute which
+            contains the envelope tuple.
+        :param index: Index of the envelope in the envelope tuple.
+
+        This is supposed to be called in p-field functions.
+        """
+
+        context = _function_table_score_context.get()
+        return context.envelope_attribute_to_function_table_index_tuple[
+            envelope_attribute
+        ][index]
+
     def _convert_simple_event(
         self,
         simple_event: core_events.SimpleEvent,
         absolute_entry_delay: core_constants.DurationType,
     ) -> tuple[str, ...]:
-        for function_table_attribute, envelope_attribute in (
-            (
-                "spectral_centroid_envelope_function_table_index_tuple",
-                "spectral_centroid_envelope_tuple",
-            ),
-            (
-                "spectral_contrast_envelope_function_table_index_tuple",
-                "spectral_contrast_envelope_tuple",
-            ),
-        ):
+        context = _function_table_score_context.get()
+        envelope_attribute_to_function_table_index_tuple = {}
+        for envelope_attribute in self._envelope_attribute_tuple:
             try:
-                function_table_data = zip(
-                    getattr(simple_event, function_table_attribute),
-                    getattr(simple_event, envelope_attribute),
-                )
+                envelope_tuple = getattr(simple_event, envelope_attribute)
             except AttributeError:
                 continue
-            for function_table_index, envelope in function_table_data:
-                if function_table_or_none := EnvelopeToFunctionTable()(
-                    envelope, function_table_index
-                ):
-                    self._function_table_definition_list.append(function_table_or_none)
+            envelope_attribute_to_function_table_index_tuple[
+                envelope_attribute
+            ] = tuple(
+                self._get_function_table_index(envelope, context)
+                for envelope in envelope_tuple
+            )
+        context.envelope_attribute_to_function_table_index_tuple = (
+            envelope_attribute_to_function_table_index_tuple
+        )
 
-        return super()._convert_simple_event(simple_event, absolute_entry_delay)
+        for csound_score_line in super()._convert_simple_event(
+            simple_event, absolute_entry_delay
+        ):
+            context.score_file.write(f"{csound_score_line}\n")
+        return ()
 
-    def convert(self, event_to_convert: core_events.abc.Event, path: str) -> None:
-        self._function_table_definition_list: list[str] = []
-        csound_score_line_tuple = self._convert_event(event_to_convert, 0)
-        csound_score_line_tuple = (
-            tuple(self._function_table_definition_list) + csound_score_line_tuple
+    def _write(self, event_to_convert: core_events.abc.Event, score_file: typing.TextIO):
+        token = _function_table_score_context.set(
+            _FunctionTableScoreContext(score_file)
         )
+        try:
+            self._convert_event(event_to_convert, 0)
+        finally:
+            _function_table_score_context.reset(token)
 
-        csound_score_str = "\n".join(csound_score_line_tuple)
-        with open(path, "w") as f:
-            f.write(csound_score_str)
+    def convert(
+        self,
+        event_to_convert: core_events.abc.Event,
+        path: typing.Union[str, typing.TextIO],
+    ) -> None:
+        """Write csound score of event.
+
+        :param event_to_convert: The event which shall be converted.
+        :param path: Where to write the score. Can also be a
+            writable text stream (for instance the standard input
+            of a csound process which reads its score from
+            '/dev/stdin'), the stream isn't closed.
+        """
+
+        if isinstance(path, str):
+            with open(
+                path,
+                "w",
+                buffering=cdd_converters.configurations.CSOUND_SCORE_BUFFER_SIZE_IN_BYTES,
+            ) as score_file:
+                self._write(event_to_convert, score_file)
+        else:
+            self._write(event_to_convert, path)
 
 
 class ResonatorSequentialEventToResonatorSoundFile(csound_converters.EventToSoundFile):
     def __init__(self):
-        super().__init__(
-            "etc/csound/31_resonator.orc.j2",
-            EventToCsoundScoreWithFunctionTables(
-                p1=lambda event: event.instrument,
-                p3=lambda event: float(event.duration),
-                p4=lambda event: event.pitch.frequency,
-                p5=lambda event: event.volume.amplitude,
-                p6=lambda event: event.bandwidth_start,
-                p7=lambda event: event.bandwidth_end,
-                # Panning start
-                p8=lambda event: event.panning_start[0],
-                p9=lambda event: event.panning_start[1],
-                p10=lambda event: event.panning_start[2],
-                p11=lambda event: event.panning_start[3],
-                p12=lambda event: event.panning_start[4],
-                # Panning end
-                p13=lambda event: event.panning_end[0],
-                p14=lambda event: event.panning_end[1],
-                p15=lambda event: event.panning_end[2],
-                p16=lambda event: event.panning_end[3],
-                p17=lambda event: event.panning_end[4],
-                # Other
-                p18=lambda event: event.filter_layer_count,
-                # Spectral centroid function tables
-                p19=lambda event: event.spectral_centroid_envelope_function_table_index_tuple[
-                    0
-                ],
-                p20=lambda event: event.spectral_centroid_envelope_function_table_index_tuple[
-                    1
-                ],
-                p21=lambda event: event.spectral_centroid_envelope_function_table_index_tuple[
-                    2
-                ],
-                p22=lambda event: event.spectral_centroid_envelope_function_table_index_tuple[
-                    3
-                ],
-                p23=lambda event: event.spectral_centroid_envelope_function_table_index_tuple[
-                    4
-                ],
-                # Spectral contrast function tables
-                p24=lambda event: event.spectral_contrast_envelope_function_table_index_tuple[
-                    0
-                ],
-                p25=lambda event: event.spectral_contrast_envelope_function_table_index_tuple[
-                    1
-                ],
-                p26=lambda event: event.spectral_contrast_envelope_function_table_index_tuple[
-                    2
-                ],
-                p27=lambda event: event.spectral_contrast_envelope_function_table_index_tuple[
-                    3
-                ],
-                p28=lambda event: event.spectral_contrast_envelope_function_table_index_tuple[
-                    4
-                ],
+        event_to_csound_score = EventToCsoundScoreWithFunctionTables(
+            p1=self._get_instrument,
+            p3=lambda event: float(event.duration),
+            p4=lambda event: event.pitch.frequency,
+            p5=lambda event: event.volume.amplitude,
+            p6=lambda event: event.bandwidth_start,
+            p7=lambda event: event.bandwidth_end,
+            # Panning start
+            p8=lambda event: event.panning_start[0],
+            p9=lambda event: event.panning_start[1],
+            p10=lambda event: event.panning_start[2],
+            p11=lambda event: event.panning_start[3],
+            p12=lambda event: event.panning_start[4],
+            # Panning end
+            p13=lambda event: event.panning_end[0],
+            p14=lambda event: event.panning_end[1],
+            p15=lambda event: event.panning_end[2],
+            p16=lambda event: event.panning_end[3],
+            p17=lambda event: event.panning_end[4],
+            # Other
+            p18=self._get_filter_layer_count,
+            # Spectral centroid function tables
+            p19=lambda _: event_to_csound_score.get_function_table_index(
+                "spectral_centroid_envelope_tuple", 0
+            ),
+            p20=lambda _: event_to_csound_score.get_function_table_index(
+                "spectral_centroid_envelope_tuple", 1
+            ),
+            p21=lambda _: event_to_csound_score.get_function_table_index(
+                "spectral_centroid_envelope_tuple", 2
+            ),
+            p22=lambda _: event_to_csound_score.get_function_table_index(
+                "spectral_centroid_envelope_tuple", 3
+            ),
+            p23=lambda _: event_to_csound_score.get_function_table_index(
+                "spectral_centroid_envelope_tuple", 4
+            ),
+            # Spectral contrast function tables
+            p24=lambda _: event_to_csound_score.get_function_table_index(
+                "spectral_contrast_envelope_tuple", 0
+            ),
+            p25=lambda _: event_to_csound_score.get_function_table_index(
+                "spectral_contrast_envelope_tuple", 1
+            ),
+            p26=lambda _: event_to_csound_score.get_function_table_index(
+                "spectral_contrast_envelope_tuple", 2
+            ),
+            p27=lambda _: event_to_csound_score.get_function_table_index(
+                "spectral_contrast_envelope_tuple", 3
+            ),
+            p28=lambda _: event_to_csound_score.get_function_table_index(
+                "spectral_contrast_envelope_tuple", 4
             ),
         )
+        super().__init__("etc/csound/31_resonator.orc.j2", event_to_csound_score)
+
+    @staticmethod
+    def _get_instrument(event: cdd_events.ResonatorEvent) -> int:
+        # Instrument 1 is the field recording player, all other
+        # instruments are resonators with 'instrument - 1' partials.
+        if cdd_converters.configurations.IS_PREVIEW and event.instrument > 1:
+            return min(
+                event.instrument,
+                1 + cdd_converters.configurations.PREVIEW_MAXIMA_PARTIAL_COUNT,
+            )
+        return event.instrument
+
+    @staticmethod
+    def _get_filter_layer_count(event: cdd_events.ResonatorEvent) -> int:
+        if cdd_converters.configurations.IS_PREVIEW:
+            return min(
+                event.filter_layer_count,
+                cdd_converters.configurations.PREVIEW_MAXIMA_FILTER_LAYER_COUNT,
+            )
+        return event.filter_layer_count
 
     def convert(self, event_to_convert: core_events.abc.Event, *args, **kwargs):
         field_recording_player_event = cdd_events.ResonatorEvent(
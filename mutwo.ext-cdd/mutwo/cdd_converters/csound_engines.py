@@ -0,0 +1,138 @@
+"""Render csound orchestras in the current process via the csound API.
+
+This needs the optional dependency 'ctcsound' (which is shipped
+with csound). Rendering with the API avoids to start a new csound
+process (which loads all opcode libraries) and to write score and
+sound files for each render, which is much more expensive than the
+DSP for short sound files.
+"""
+
+import concurrent.futures
+import functools
+import threading
+import typing
+
+import numpy as np
+
+from mutwo import cdd_utilities
+
+__all__ = ("CsoundEngine", "get_csound_engine", "get_csound_engine_executor")
+
+
+class CsoundEngine(object):
+    """Long-lived csound instance which renders scores to arrays.
+
+    A csound instance can't be used by multiple threads at the same
+    time: use :func:`get_csound_engine` to get the engine of the
+    current thread.
+
+    **Example:**
+
+    >>> from mutwo import cdd_converters
+    >>> csound_engine = cdd_converters.CsoundEngine()
+    >>> sample_array, sampling_rate = csound_engine.render(
+    ...     "0dbfs=1\\ninstr 1\\nout poscil(0.5, 440)\\nendin", "i 1 0 1"
+    ... )
+    """
+
+    def __init__(self):
+        try:
+            import ctcsound
+        except ImportError:
+            raise ImportError(
+                "The csound API backend needs 'ctcsound', which is part "
+                "of csound (or can be installed with 'pip install ctcsound')."
+            )
+
+        self._csound = ctcsound.Csound()
+        self._csound.createMessageBuffer(False)
+
+    def _get_message_str(self) -> str:
+        message_list = []
+        while self._csound.messageCnt():
+            message_list.append(self._csound.firstMessage())
+            self._csound.popFirstMessage()
+        return "".join(message_list)
+
+    def render(
+        self,
+        csound_orchestra_str: str,
+        csound_score_str: str,
+        flag_sequence: typing.Sequence[str] = (),
+    ) -> tuple[np.ndarray, int]:
+        """Render score with orchestra.
+
+        :param csound_orchestra_str: Code of the orchestra.
+        :param csound_score_str: Code of the score.
+        :param flag_sequence: Options for csound. Output options are
+            ignored, because no sound file is written.
+        :return: Samples (with shape (frame count, channel count) and
+            scaled so that 1 is 0dbfs) and the sampling rate.
+
+        The engine is reset before each render, so that renders
+        never influence each other (the same as if each render had
+        its own csound process).
+        """
+
+        csound = self._csound
+        csound.reset()
+        for flag in tuple(flag_sequence) + ("-n", "-d"):
+            csound.setOption(flag)
+        if csound.compileOrc(csound_orchestra_str) != 0:
+            raise RuntimeError(
+                f"csound can't compile orchestra:\n{self._get_message_str()}"
+            )
+        csound.readScore(csound_score_str)
+        if csound.start() != 0:
+            raise RuntimeError(f"csound can't start:\n{self._get_message_str()}")
+
+        channel_count, sampling_rate, full_scale = (
+            csound.nchnls(),
+            int(csound.sr()),
+            csound.get0dBFS(),
+        )
+        block_list = []
+        try:
+            while csound.performKsmps() == 0:
+                # 'spout' is overwritten by the next control period.
+                block_list.append(np.array(csound.spout()))
+        finally:
+            csound.cleanup()
+            self._get_message_str()
+
+        if block_list:
+            sample_array = np.concatenate(block_list) / full_scale
+        else:
+            sample_array = np.zeros(0)
+        return sample_array.reshape(-1, channel_count), sampling_rate
+
+
+_thread_local = threading.local()
+
+
+def get_csound_engine() -> CsoundEngine:
+    """Get csound engine of the current thread (created on first use)."""
+
+    try:
+        return _thread_local.csound_engine
+    except AttributeError:
+        csound_engine = _thread_local.csound_engine = CsoundEngine()
+        return csound_engine
+
+
+@functools.lru_cache(maxsize=None)
+def _get_csound_engine_executor(job_count: int) -> concurrent.futures.Executor:
+    return concurrent.futures.ThreadPoolExecutor(job_count)
+
+
+def get_csound_engine_executor() -> concurrent.futures.Executor:
+    """Get threads which render with their own :class:`CsoundEngine`.
+
+    There are as many threads as programs which can run at the same
+    time in :func:`mutwo.cdd_utilities.get_process_pool`. Csound
+    releases the GIL while it renders.
+    """
+
+    return _get_csound_engine_executor(
+        cdd_utilities.configurations.PROCESS_POOL_JOB_COUNT
+    )
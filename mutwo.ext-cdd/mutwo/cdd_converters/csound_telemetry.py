@@ -0,0 +1,111 @@
+"""Metrics of csound renders.
+
+If ``IS_CSOUND_TELEMETRY_ENABLED`` is set, each csound render of
+:class:`mutwo.csound_converters.EventToSoundFile` records how big
+its score is, how long it took and how many resources csound needed,
+so that slow orchestras can be found and optimized.
+"""
+
+import dataclasses
+import os
+import threading
+import typing
+
+import soundfile
+
+__all__ = (
+    "CsoundRenderMetrics",
+    "make_csound_render_metrics",
+    "get_csound_render_metrics_tuple",
+    "add_csound_render_metrics_sequence",
+)
+
+
+@dataclasses.dataclass(frozen=True)
+class CsoundRenderMetrics(object):
+    sound_file_path: str
+    # Path of the orchestra template or name of the converter class
+    # if the orchestra is defined in the code.
+    csound_orchestra_name: str
+    backend: str
+    exit_status: int
+    # Count of 'i' statements
+    event_count: int
+    # Count of 'f' statements
+    function_table_count: int
+    # Sum of the sizes (in points) of all function tables
+    function_table_size: int
+    duration_in_seconds: float
+    audio_duration_in_seconds: float
+    # Seconds of audio which are rendered per second
+    realtime_factor: float
+    # CPU time (user + system) of csound
+    cpu_time_in_seconds: typing.Optional[float]
+    maxima_resident_set_size_in_bytes: typing.Optional[int]
+    output_size_in_bytes: int
+
+
+def _get_score_statistic_tuple(
+    csound_score_line_iterable: typing.Iterable[str],
+) -> tuple[int, int, int]:
+    event_count, function_table_count, function_table_size = 0, 0, 0
+    for csound_score_line in csound_score_line_iterable:
+        if csound_score_line.startswith("i"):
+            event_count += 1
+        elif csound_score_line.startswith("f"):
+            function_table_count += 1
+            try:
+                function_table_size += abs(int(csound_score_line.split()[3]))
+            except (IndexError, ValueError):
+                pass
+    return event_count, function_table_count, function_table_size
+
+
+def make_csound_render_metrics(
+    sound_file_path: str,
+    csound_orchestra_name: str,
+    backend: str,
+    exit_status: int,
+    csound_score_line_iterable: typing.Iterable[str],
+    duration_in_seconds: float,
+    cpu_time_in_seconds: typing.Optional[float] = None,
+    maxima_resident_set_size_in_bytes: typing.Optional[int] = None,
+) -> CsoundRenderMetrics:
+    """Measure score and sound file of a finished render."""
+
+    try:
+        audio_duration_in_seconds = soundfile.info(sound_file_path).duration
+        output_size_in_bytes = os.path.getsize(sound_file_path)
+    except (RuntimeError, OSError):  # No sound file has been written
+        audio_duration_in_seconds, output_size_in_bytes = 0, 0
+    return CsoundRenderMetrics(
+        sound_file_path,
+        csound_orchestra_name,
+        backend,
+        exit_status,
+        *_get_score_statistic_tuple(csound_score_line_iterable),
+        duration_in_seconds,
+        audio_duration_in_seconds,
+        audio_duration_in_seconds / duration_in_seconds if duration_in_seconds else 0,
+        cpu_time_in_seconds,
+        maxima_resident_set_size_in_bytes,
+        output_size_in_bytes,
+    )
+
+
+_csound_render_metrics_list: list[CsoundRenderMetrics] = []
+_lock = threading.Lock()
+
+
+def add_csound_render_metrics_sequence(
+    csound_render_metrics_sequence: typing.Sequence[CsoundRenderMetrics],
+):
+    """Add metrics of renders (e.g. from another process)."""
+
+    with _lock:
+        _csound_render_metrics_list.extend(csound_render_metrics_sequence)
+
+
+def get_csound_render_metrics_tuple() -> tuple[CsoundRenderMetrics, ...]:
+    with _lock:
+        return tuple(_csound_render_metrics_list)
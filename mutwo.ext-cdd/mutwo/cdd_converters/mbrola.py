@@ -1,11 +1,24 @@
 import copy
+import itertools
+import typing
+
+import numpy as np
+import voxpopuli
 
 from mutwo import core_converters
 from mutwo import core_events
 from mutwo import music_events
+from mutwo import music_parameters
+
 
+__all__ = (
+    "SimpleEventToPhonemeString",
+    "PhonemeStream",
+    "SequentialEventToMbrolaFriendlyEvent",
+)
 
-__all__ = ("SimpleEventToPhonemeString", "SequentialEventToMbrolaFriendlyEvent")
+# mbrola phoneme for silence
+_REST_PHONEME = "_"
 
 
 class SimpleEventToPhonemeString(core_converters.SimpleEventToAttribute):
@@ -19,6 +32,231 @@ class SimpleEventToPhonemeString(core_converters.SimpleEventToAttribute):
         super().__init__(attribute_name, exception_value)
 
 
+def _iterate_simple_events(
+    event: core_events.abc.Event,
+) -> typing.Iterator[core_events.SimpleEvent]:
+    if isinstance(event, core_events.SimpleEvent):
+        yield event
+    else:
+        for sub_event in event:
+            yield from _iterate_simple_events(sub_event)
+
+
+class PhonemeStream(object):
+    """Phonemes, their durations and their frequencies in arrays.
+
+    :param phoneme_array: The phoneme of each entry ('_' for rests).
+    :param duration_array: The duration of each entry in seconds.
+    :param frequency_array: The frequency of each entry in Hertz
+        (``NaN`` if the entry has no pitch).
+    :param simple_event_index_array: The index of the simple event in
+        ``simple_event_tuple`` from which the entry is derived.
+    :param simple_event_tuple: The simple events from which the
+        phonemes are derived.
+
+    Unlike the events of :class:`SequentialEventToMbrolaFriendlyEvent`
+    a phoneme stream doesn't need an event per phoneme: it only
+    refers to the original simple events (which aren't copied).
+    Slices of a phoneme stream share the arrays of the sliced stream.
+    Use :meth:`from_sequential_event` to create a phoneme stream and
+    :meth:`to_phoneme_list` to synthesize it with mbrola.
+
+    **Example:**
+
+    >>> from mutwo import cdd_converters
+    >>> from mutwo import core_events
+    >>> sequential_event = core_events.SequentialEvent(
+    ...     [core_events.SimpleEvent(duration) for duration in (1, 0.5, 0.25)]
+    ... )
+    >>> phoneme_stream = cdd_converters.PhonemeStream.from_sequential_event(
+    ...     sequential_event
+    ... )
+    >>> phoneme_stream
+    PhonemeStream(3 phonemes, 1.75 seconds)
+    >>> phoneme_stream.phoneme_array.tolist()  # no lyrics: only rests
+    ['_', '_', '_']
+    >>> phoneme_stream[:2].duration
+    1.5
+    """
+
+    def __init__(
+        self,
+        phoneme_array: np.ndarray,
+        duration_array: np.ndarray,
+        frequency_array: np.ndarray,
+        simple_event_index_array: np.ndarray,
+        simple_event_tuple: tuple[core_events.SimpleEvent, ...],
+    ):
+        self.phoneme_array = phoneme_array
+        self.duration_array = duration_array
+        self.frequency_array = frequency_array
+        self.simple_event_index_array = simple_event_index_array
+        self.simple_event_tuple = simple_event_tuple
+
+    @staticmethod
+    def _get_phonetic_representation(
+        simple_event: core_events.SimpleEvent,
+    ) -> tuple[str, ...]:
+        try:
+            phonetic_representation = simple_event.lyric.phonetic_representation
+        except AttributeError:
+            phonetic_representation = None
+        return tuple(phonetic_representation or (_REST_PHONEME,))
+
+    @staticmethod
+    def _get_frequency(
+        simple_event: core_events.SimpleEvent,
+        simple_event_to_pitch: typing.Optional[
+            typing.Callable[
+                [core_events.SimpleEvent], typing.Optional[music_parameters.abc.Pitch]
+            ]
+        ],
+    ) -> float:
+        try:
+            if simple_event_to_pitch:
+                pitch = simple_event_to_pitch(simple_event)
+            else:
+                pitch = simple_event.pitch_list[0]
+        except (AttributeError, IndexError):
+            pitch = None
+        return float(pitch.frequency) if pitch is not None else np.nan
+
+    @classmethod
+    def from_sequential_event(
+        cls,
+        sequential_event: core_events.SequentialEvent,
+        simple_event_to_pitch: typing.Optional[
+            typing.Callable[
+                [core_events.SimpleEvent], typing.Optional[music_parameters.abc.Pitch]
+            ]
+        ] = None,
+    ) -> "PhonemeStream":
+        """Create phoneme stream from the lyrics of a sequential event.
+
+        :param sequential_event: Sequential event with simple events
+            which have a ``lyric`` (with a ``phonetic_representation``).
+            Simple events without phonemes are rests.
+        :param simple_event_to_pitch: Function which returns the pitch
+            of each phoneme. By default the first pitch of the
+            ``pitch_list`` of the simple event.
+
+        The duration of a simple event is equally divided between its
+        phonemes. The simple events aren't copied: changes of the
+        simple events after the phoneme stream has been created
+        don't change the phoneme stream.
+        """
+
+        simple_event_tuple = tuple(_iterate_simple_events(sequential_event))
+        phonetic_representation_tuple = tuple(
+            map(cls._get_phonetic_representation, simple_event_tuple)
+        )
+        phoneme_count_array = np.fromiter(
+            map(len, phonetic_representation_tuple),
+            dtype=np.int64,
+            count=len(simple_event_tuple),
+        )
+        simple_event_index_array = np.repeat(
+            np.arange(len(simple_event_tuple)), phoneme_count_array
+        )
+        duration_array = np.repeat(
+            np.fromiter(
+                (float(simple_event.duration) for simple_event in simple_event_tuple),
+                dtype=np.float64,
+                count=len(simple_event_tuple),
+            )
+            / np.maximum(phoneme_count_array, 1),
+            phoneme_count_array,
+        )
+        phoneme_array = np.empty(len(simple_event_index_array), dtype=object)
+        phoneme_array[:] = tuple(
+            itertools.chain.from_iterable(phonetic_representation_tuple)
+        )
+        # Each phoneme gets its own pitch (pitch functions may be random).
+        frequency_array = np.fromiter(
+            (
+                cls._get_frequency(
+                    simple_event_tuple[simple_event_index], simple_event_to_pitch
+                )
+                for simple_event_index in simple_event_index_array.tolist()
+            ),
+            dtype=np.float64,
+            count=len(simple_event_index_array),
+        )
+        return cls(
+            phoneme_array,
+            duration_array,
+            frequency_array,
+            simple_event_index_array,
+            simple_event_tuple,
+        )
+
+    def __len__(self) -> int:
+        return len(self.phoneme_array)
+
+    def __getitem__(self, key: slice) -> "PhonemeStream":
+        if not isinstance(key, slice):
+            raise TypeError("Phoneme streams can only be sliced.")
+        return type(self)(
+            self.phoneme_array[key],
+            self.duration_array[key],
+            self.frequency_array[key],
+            self.simple_event_index_array[key],
+            self.simple_event_tuple,
+        )
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({len(self)} phonemes, {self.duration} seconds)"
+
+    @property
+    def duration(self) -> float:
+        return float(self.duration_array.sum())
+
+    @property
+    def absolute_time_array(self) -> np.ndarray:
+        return np.concatenate(((0,), np.cumsum(self.duration_array)[:-1]))
+
+    @property
+    def is_rest_array(self) -> np.ndarray:
+        return (self.phoneme_array == _REST_PHONEME) | np.isnan(self.frequency_array)
+
+    def copy(self) -> "PhonemeStream":
+        return type(self)(
+            self.phoneme_array.copy(),
+            self.duration_array.copy(),
+            self.frequency_array.copy(),
+            self.simple_event_index_array.copy(),
+            self.simple_event_tuple,
+        )
+
+    def get_stable_hash_content(self) -> tuple:
+        # Only what mbrola gets: streams with the same phonemes sound
+        # the same, regardless from which simple events they are derived.
+        return (self.phoneme_array, self.duration_array, self.frequency_array)
+
+    def to_phoneme_list(self) -> voxpopuli.PhonemeList:
+        """Convert phoneme stream to the input of mbrola."""
+
+        phoneme_list = []
+        for phoneme, duration, frequency in zip(
+            self.phoneme_array.tolist(),
+            self.duration_array.tolist(),
+            self.frequency_array.tolist(),
+        ):
+            # Values are truncated (like by 'EventToPhonemeList' of
+            # mutwo.mbrola), so that streams and events sound the same.
+            if np.isnan(frequency):
+                pitch_modification_list = []
+            else:
+                frequency = int(frequency)
+                pitch_modification_list = [(0, frequency), (100, frequency)]
+            phoneme_list.append(
+                voxpopuli.Phoneme(
+                    phoneme, int(duration * 1000), pitch_modification_list
+                )
+            )
+        return voxpopuli.PhonemeList(phoneme_list)
+
+
 class SequentialEventToMbrolaFriendlyEvent(core_converters.abc.EventConverter):
     def _convert_simple_event(self, event_to_convert, _):
         event_to_convert = event_to_convert.set_parameter(
@@ -54,3 +292,23 @@ class SequentialEventToMbrolaFriendlyEvent(core_converters.abc.EventConverter):
 
     def convert(self, event_to_convert):
         return self._convert_event(event_to_convert, 0)
+
+    def convert_to_phoneme_stream(
+        self,
+        event_to_convert: core_events.SequentialEvent,
+        simple_event_to_pitch: typing.Optional[
+            typing.Callable[
+                [core_events.SimpleEvent], typing.Optional[music_parameters.abc.Pitch]
+            ]
+        ] = None,
+    ) -> PhonemeStream:
+        """Convert to phoneme stream (without an event per phoneme).
+
+        :param event_to_convert: The event which shall be spoken.
+        :param simple_event_to_pitch: Function which returns the pitch
+            of each phoneme (see :meth:`PhonemeStream.from_sequential_event`).
+        """
+
+        return PhonemeStream.from_sequential_event(
+            event_to_convert, simple_event_to_pitch
+        )
@@ -7,6 +7,7 @@ import ranges
 from mutwo import cdd_converters
 from mutwo import cdd_events
 from mutwo import cdd_parameters
+from mutwo import cdd_utilities
 from mutwo import common_generators
 from mutwo import core_converters
 from mutwo import core_events
@@ -67,15 +68,77 @@ class PulseToComplementaryPulsePair(core_converters.abc.Converter):
         return complementary_pulse_pair
 
 
+@cdd_utilities.compute_lazy()
+def _get_envelope_tuple(
+    mono_sound_file_container: cdd_parameters.MonoSoundFileContainer,
+    envelope_name: str,
+) -> tuple[core_events.Envelope, ...]:
+    return tuple(
+        getattr(soundfile, envelope_name) for soundfile in mono_sound_file_container
+    )
+
+
+@cdd_utilities.compute_lazy()
+def _get_resampled_envelope_tuple(
+    mono_sound_file_container: cdd_parameters.MonoSoundFileContainer,
+    envelope_name: str,
+    new_minima: float,
+    new_maxima: float,
+) -> tuple[core_events.Envelope, ...]:
+    envelope_tuple = _get_envelope_tuple(mono_sound_file_container, envelope_name)
+    envelope_minima_tuple = tuple(
+        min(envelope.get_parameter("value")) for envelope in envelope_tuple
+    )
+    envelope_maxima_tuple = tuple(
+        max(envelope.get_parameter("value")) for envelope in envelope_tuple
+    )
+    return tuple(
+        envelope.set_parameter(
+            "value",
+            lambda value: core_utilities.scale(
+                value,
+                envelope_minima,
+                envelope_maxima,
+                new_minima,
+                new_maxima,
+            ),
+            mutate=False,
+        )
+        for envelope, envelope_minima, envelope_maxima in zip(
+            envelope_tuple,
+            envelope_minima_tuple,
+            envelope_maxima_tuple,
+        )
+    )
+
+
+@cdd_utilities.compute_lazy()
+def _get_local_envelope_tuple(
+    resampled_envelope_tuple: "ResampledEnvelopeTuple",
+    start_time: float,
+    end_time: float,
+) -> tuple[core_events.Envelope, ...]:
+    return tuple(
+        envelope.cut_out(start_time, end_time, mutate=False)
+        for envelope in resampled_envelope_tuple
+    )
+
+
 class ResampledEnvelopeTuple(tuple):
     def __init__(
         self,
-        _: cdd_parameters.MonoSoundFileContainer,
+        mono_sound_file_container: cdd_parameters.MonoSoundFileContainer,
         envelope_name: str,
-        *args,
-        **kwargs,
+        new_minima: float = 0,
+        new_maxima: float = 1,
     ):
         self.envelope_name = envelope_name
+        self._argument_tuple = (
+            mono_sound_file_container,
+            envelope_name,
+            new_minima,
+            new_maxima,
+        )
         super().__init__()
 
     def __new__(
@@ -84,66 +147,23 @@ class ResampledEnvelopeTuple(tuple):
         envelope_name: str,
         new_minima: float = 0,
         new_maxima: float = 1,
-        force_to_compute: bool = False,
     ):
-        envelope_tuple = core_utilities.compute_lazy(
-            f"builds/pickled/31_{envelope_name}_tuple.pickle"
-        )(
-            lambda envelope_name: tuple(
-                getattr(soundfile, envelope_name)
-                for soundfile in mono_sound_file_container
-            )
-        )(
-            envelope_name
-        )
-
-        envelope_minima_tuple = tuple(
-            min(envelope.get_parameter("value")) for envelope in envelope_tuple
-        )
-        envelope_maxima_tuple = tuple(
-            max(envelope.get_parameter("value")) for envelope in envelope_tuple
-        )
-
-        resampled_envelope_tuple = core_utilities.compute_lazy(
-            f"builds/pickled/31_{envelope_name}_tuple_resampled.pickle",
-            force_to_compute=force_to_compute,
-        )(
-            lambda _, new_minima, new_maxima: tuple(
-                envelope.set_parameter(
-                    "value",
-                    lambda value: core_utilities.scale(
-                        value,
-                        envelope_minima,
-                        envelope_maxima,
-                        new_minima,
-                        new_maxima,
-                    ),
-                    mutate=False,
-                )
-                for envelope, envelope_minima, envelope_maxima in zip(
-                    envelope_tuple,
-                    envelope_minima_tuple,
-                    envelope_maxima_tuple,
-                )
-            )
-        )(
-            envelope_name, new_minima, new_maxima
+        return super().__new__(
+            cls,
+            _get_resampled_envelope_tuple(
+                mono_sound_file_container, envelope_name, new_minima, new_maxima
+            ),
         )
 
-        return super().__new__(cls, resampled_envelope_tuple)
+    def get_stable_hash_content(self) -> tuple:
+        # The resampled envelopes only depend on the arguments: avoid
+        # hashing thousands of envelope points for each local envelope.
+        return self._argument_tuple
 
     def get_local_envelope_tuple(
         self, start_time: float, end_time: float
     ) -> tuple[core_events.Envelope, ...]:
-        envelope_tuple = core_utilities.compute_lazy(
-            f"builds/pickled/31_{self.envelope_name}_tuple_selection_{start_time}_{end_time}.pickle"
-        )(
-            lambda: tuple(
-                envelope.cut_out(start_time, end_time, mutate=False)
-                for envelope in self
-            )
-        )()
-        return envelope_tuple
+        return _get_local_envelope_tuple(self, start_time, end_time)
 
 
 class ResonatorSequentialEventToResonatorSequentialEventWithEnvelope(
@@ -1,10 +1,8 @@
 import abc
 import functools
 import operator
-import tempfile
 import typing
 
-import librosa
 import numpy as np
 import soundfile
 
@@ -41,8 +39,9 @@ class SoundFileToMonoSoundFileContainer(core_converters.abc.Converter):
         mono_sound_file_list = []
         for channel_index in range(sound_file_to_convert.channel_count):
             mono_sound_file_data = new_sound_file[:, channel_index]
-            temporary_file = tempfile.NamedTemporaryFile(suffix=".wav", delete=False)
-            mono_sound_file_path = temporary_file.name
+            mono_sound_file_path = cdd_utilities.get_scratch_space().get_path(
+                suffix=".wav"
+            )
             soundfile.write(
                 mono_sound_file_path,
                 mono_sound_file_data,
@@ -101,6 +100,8 @@ class SoundFileToRMSEnvelope(SoundFileToAnalysisEnvelope):
     def _sound_file_to_data_array(
         self, sound_file_to_convert: cdd_parameters.SoundFile
     ) -> np.ndarray:
+        import librosa
+
         return librosa.feature.rms(
             S=sound_file_to_convert.spectrogram_magnitude,
             hop_length=self._window_size,
@@ -112,6 +113,8 @@ class SoundFileToSpectralFlatnessEnvelope(SoundFileToAnalysisEnvelope):
     def _sound_file_to_data_array(
         self, sound_file_to_convert: cdd_parameters.SoundFile
     ) -> np.ndarray:
+        import librosa
+
         return librosa.feature.spectral_flatness(
             y=sound_file_to_convert.mono_array,
             S=sound_file_to_convert.spectrogram_magnitude,
@@ -124,6 +127,8 @@ class SoundFileToSpectralCentroidEnvelope(SoundFileToAnalysisEnvelope):
     def _sound_file_to_data_array(
         self, sound_file_to_convert: cdd_parameters.SoundFile
     ) -> np.ndarray:
+        import librosa
+
         return librosa.feature.spectral_centroid(
             y=sound_file_to_convert.mono_array,
             S=sound_file_to_convert.spectrogram_magnitude,
@@ -136,6 +141,8 @@ class SoundFileToSpectralContrastEnvelope(SoundFileToAnalysisEnvelope):
     def _sound_file_to_data_array(
         self, sound_file_to_convert: cdd_parameters.SoundFile
     ) -> np.ndarray:
+        import librosa
+
         return librosa.feature.spectral_contrast(
             y=sound_file_to_convert.mono_array,
             S=sound_file_to_convert.spectrogram_magnitude,
@@ -151,6 +158,8 @@ class SoundFileToAttackSequentialEvent(core_converters.abc.Converter):
     def convert(
         self, sound_file_to_convert: cdd_parameters.SoundFile
     ) -> core_events.SequentialEvent[core_events.SimpleEvent]:
+        import librosa
+
         absolute_time_list = list(
             map(
                 float,
@@ -261,6 +270,8 @@ class SoundFileToPulse(core_converters.abc.Converter):
     def convert(
         self, sound_file_to_convert: cdd_parameters.SoundFile
     ) -> core_events.SequentialEvent[core_events.SimpleEvent]:
+        import librosa
+
         hop_length = 512
         pulse_array = librosa.beat.plp(
             y=sound_file_to_convert.mono_array,
@@ -311,6 +322,8 @@ class SoundFileToHarmonicAndPercussiveSoundFile(core_converters.abc.Converter):
         harmonic_sound_file_path: str,
         percussive_sound_file_path: str,
     ):
+        import librosa
+
         for data, path in zip(
             librosa.effects.hpss(
                 sound_file_to_convert.mono_array,
@@ -8,12 +8,8 @@ __all__ = ("ResonatorEvent",)
 class ResonatorEvent(core_events.SimpleEvent):
     CHANNEL_COUNT = 5
 
-    # Global counter: now two events will have the same base function table index.
-    # XXX: Start with 1, otherwise 000 will be 0 which will create an error.
-    class_function_table_index = 1
-
-    spectral_centroid_envelope_function_table_index = 0
-    spectral_contrast_envelope_function_table_index = 1
+    # The function tables of the envelopes are numbered by
+    # 'mutwo.cdd_converters.EventToCsoundScoreWithFunctionTables'.
 
     def __init__(
         self,
@@ -52,27 +48,3 @@ class ResonatorEvent(core_events.SimpleEvent):
         self.spectral_centroid_envelope_tuple = spectral_centroid_envelope_tuple
         self.spectral_contrast_envelope_tuple = spectral_contrast_envelope_tuple
         super().__init__(duration)
-        self.instance_function_table_index = self.class_function_table_index
-        ResonatorEvent.class_function_table_index += 1
-
-    @property
-    def spectral_centroid_envelope_function_table_index_tuple(self) -> tuple[int, ...]:
-        return tuple(
-            int(
-                f"{self.instance_function_table_index}"
-                f"{self.spectral_centroid_envelope_function_table_index}"
-                f"{channel_index}"
-            )
-            for channel_index in range(self.CHANNEL_COUNT)
-        )
-
-    @property
-    def spectral_contrast_envelope_function_table_index_tuple(self) -> tuple[int, ...]:
-        return tuple(
-            int(
-                f"{self.instance_function_table_index}"
-                f"{self.spectral_contrast_envelope_function_table_index}"
-                f"{channel_index}"
-            )
-            for channel_index in range(self.CHANNEL_COUNT)
-        )
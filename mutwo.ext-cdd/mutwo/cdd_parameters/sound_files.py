@@ -3,11 +3,10 @@ from __future__ import annotations
 import dataclasses
 import functools
 
-import librosa
 import numpy as np
-import pyo
 import soundfile
 
+from mutwo import cdd_utilities
 from mutwo import core_events
 
 FrameCount = int
@@ -26,6 +25,10 @@ class SoundFile(object):
 
     path: str
 
+    def get_stable_hash_content(self) -> str:
+        # Temporary mono files have random paths, but the same content.
+        return cdd_utilities.get_file_hash(self.path)
+
     @functools.cached_property
     def information_tuple(
         self,
@@ -37,6 +40,8 @@ class SoundFile(object):
         FileFormat,
         SampleType,
     ]:
+        import pyo
+
         return pyo.sndinfo(self.path)
 
     @functools.cached_property
@@ -71,12 +76,16 @@ class SoundFile(object):
 
     @functools.cached_property
     def mono_array(self) -> np.array:
+        import librosa
+
         array, sampling_rate = librosa.load(self.path, sr=self.sampling_rate)
         assert self.sampling_rate == sampling_rate
         return array
 
     @functools.cached_property
     def spectrogram_magnitude(self) -> np.ndarray:
+        import librosa
+
         spectrogram_magnitude, _ = librosa.magphase(librosa.stft(self.array))
         return spectrogram_magnitude
 
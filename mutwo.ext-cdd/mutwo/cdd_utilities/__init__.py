@@ -2,6 +2,13 @@ import datetime
 
 import numpy as np
 
+from . import configurations
+
+from .caches import *
+from .hashes import *
+from .processes import *
+from .scratches import *
+
 __all__ = ("duration_in_seconds_to_readable_duration", "reject_outliers")
 
 
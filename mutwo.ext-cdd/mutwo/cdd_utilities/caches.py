@@ -0,0 +1,301 @@
+import functools
+import hashlib
+import os
+import pickle
+import re
+import sqlite3
+import threading
+import time
+import types
+import typing
+
+from mutwo import cdd_utilities
+
+__all__ = (
+    "BuildCache",
+    "ArtifactStore",
+    "get_artifact_store",
+    "compute_lazy",
+    "get_referenced_file_path_tuple",
+)
+
+
+def get_referenced_file_path_tuple(
+    text: str, recursive_file_suffix_tuple: tuple[str, ...] = ()
+) -> tuple[str, ...]:
+    """Find all quoted strings in a text which are paths of existing files.
+
+    :param text: The text (e.g. a csound orchestra or a lilypond file)
+        which shall be searched.
+    :param recursive_file_suffix_tuple: Found files with one of these
+        suffixes are also searched (for instance '.ily' for lilypond
+        files which include other files).
+    """
+
+    file_path_list = []
+    text_to_search_list = [(text, ".")]
+    while text_to_search_list:
+        text_to_search, directory_path = text_to_search_list.pop(0)
+        for quoted_string in re.findall(r'"([^"\n]+)"', text_to_search):
+            for file_path in (quoted_string, f"{directory_path}/{quoted_string}"):
+                if os.path.isfile(file_path) and file_path not in file_path_list:
+                    file_path_list.append(file_path)
+                    if file_path.endswith(recursive_file_suffix_tuple):
+                        with open(file_path, "r", errors="ignore") as f:
+                            text_to_search_list.append(
+                                (f.read(), os.path.dirname(file_path) or ".")
+                            )
+                    break
+    return tuple(file_path_list)
+
+
+class BuildCache(object):
+    """Remember with which inputs an artifact has been build.
+
+    :param directory_path: Where the cache saves its keys.
+
+    For each artifact the cache stores the key (a hash of all inputs)
+    which has been used to build the artifact. If an artifact
+    with the same key is requested again and the artifact still
+    exists, the artifact is up-to-date and doesn't need to be
+    rebuild. Each artifact has its own key file, so that parallel
+    render processes never write to the same file.
+    """
+
+    def __init__(self, directory_path: str):
+        self._directory_path = directory_path
+        os.makedirs(directory_path, exist_ok=True)
+
+    def _get_key_file_path(self, artifact_path: str) -> str:
+        artifact_path_hash = hashlib.sha256(
+            os.path.abspath(artifact_path).encode()
+        ).hexdigest()
+        return f"{self._directory_path}/{artifact_path_hash}"
+
+    def get_key(self, artifact_path: str) -> typing.Optional[str]:
+        try:
+            with open(self._get_key_file_path(artifact_path), "r") as f:
+                return f.read()
+        except FileNotFoundError:
+            return None
+
+    def is_up_to_date(self, artifact_path: str, key: str) -> bool:
+        return os.path.exists(artifact_path) and self.get_key(artifact_path) == key
+
+    def register(self, artifact_path: str, key: str):
+        key_file_path = self._get_key_file_path(artifact_path)
+        temporary_key_file_path = f"{key_file_path}.{os.getpid()}"
+        with open(temporary_key_file_path, "w") as f:
+            f.write(key)
+        os.replace(temporary_key_file_path, key_file_path)
+
+    def invalidate(self, artifact_path: str):
+        try:
+            os.remove(self._get_key_file_path(artifact_path))
+        except FileNotFoundError:
+            pass
+
+
+class ArtifactStore(object):
+    """Persistent store for results of expensive computations.
+
+    :param path: Path of the database file.
+    :param maxima_size_in_bytes: If the stored artifacts need more
+        space, the least recently used artifacts are removed (until
+        they only need ``eviction_ratio`` of this size, so that this
+        doesn't happen again with the next artifact).
+
+    All artifacts are saved in one sqlite database file. An
+    artifact is identified by the name of the function which computed
+    it, the hash of the functions code and the hash of the functions
+    input. If the code of a function changes, all artifacts of the
+    previous versions of the function are removed.
+
+    The store can be used from multiple threads and processes: each
+    of them gets its own connection to the database.
+    """
+
+    # Share of the maxima size which is left after artifacts are evicted
+    eviction_ratio: float = 0.8
+
+    def __init__(self, path: str, maxima_size_in_bytes: int):
+        self._path = path
+        self._maxima_size_in_bytes = maxima_size_in_bytes
+        self._local = threading.local()
+
+    @property
+    def _connection(self) -> sqlite3.Connection:
+        # sqlite connections can't be shared between threads or
+        # processes. A forked child inherits the thread local data
+        # of its parents thread, therefore the process id is checked too.
+        process_id = os.getpid()
+        if getattr(self._local, "process_id", None) != process_id:
+            directory_path = os.path.dirname(self._path)
+            if directory_path:
+                os.makedirs(directory_path, exist_ok=True)
+            connection = sqlite3.connect(self._path, timeout=60)
+            # Free pages of removed artifacts can be given back to the
+            # file system without rewriting the complete database.
+            # Existing databases only change their mode with a VACUUM.
+            if connection.execute("PRAGMA auto_vacuum").fetchone()[0] != 2:
+                connection.execute("PRAGMA auto_vacuum=INCREMENTAL")
+                connection.execute("VACUUM")
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS artifact ("
+                "name TEXT, code_hash TEXT, input_hash TEXT, data BLOB, "
+                "size INTEGER, access_time REAL, "
+                "PRIMARY KEY (name, input_hash))"
+            )
+            connection.commit()
+            self._local.connection = connection
+            self._local.process_id = process_id
+        return self._local.connection
+
+    def get(
+        self, name: str, code_hash: str, input_hash: str
+    ) -> tuple[bool, typing.Any]:
+        row = self._connection.execute(
+            "SELECT data FROM artifact WHERE name=? AND code_hash=? AND input_hash=?",
+            (name, code_hash, input_hash),
+        ).fetchone()
+        if row is None:
+            return False, None
+        with self._connection:
+            self._connection.execute(
+                "UPDATE artifact SET access_time=? WHERE name=? AND input_hash=?",
+                (time.time(), name, input_hash),
+            )
+        return True, pickle.loads(row[0])
+
+    def set(self, name: str, code_hash: str, input_hash: str, value: typing.Any):
+        data = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        with self._connection:
+            # Artifacts of outdated versions of the function are stale.
+            self._connection.execute(
+                "DELETE FROM artifact WHERE name=? AND code_hash!=?",
+                (name, code_hash),
+            )
+            self._connection.execute(
+                "INSERT OR REPLACE INTO artifact VALUES (?, ?, ?, ?, ?, ?)",
+                (name, code_hash, input_hash, data, len(data), time.time()),
+            )
+        self.evict()
+
+    def evict(self):
+        """Remove least recently used artifacts until the store fits its size"""
+
+        connection = self._connection
+        (size,) = connection.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM artifact"
+        ).fetchone()
+        if size <= self._maxima_size_in_bytes:
+            return
+        target_size = self._maxima_size_in_bytes * self.eviction_ratio
+        with connection:
+            for name, input_hash, artifact_size in connection.execute(
+                "SELECT name, input_hash, size FROM artifact ORDER BY access_time"
+            ).fetchall():
+                if size <= target_size:
+                    break
+                connection.execute(
+                    "DELETE FROM artifact WHERE name=? AND input_hash=?",
+                    (name, input_hash),
+                )
+                size -= artifact_size
+        # Give the space back to the file system ('execute' would only
+        # free one page: the pragma frees one page per step).
+        connection.executescript("PRAGMA incremental_vacuum;")
+
+    def clear(self):
+        with self._connection:
+            self._connection.execute("DELETE FROM artifact")
+        self._connection.executescript("PRAGMA incremental_vacuum;")
+
+
+@functools.lru_cache(maxsize=None)
+def _get_artifact_store(path: str, maxima_size_in_bytes: int) -> ArtifactStore:
+    return ArtifactStore(path, maxima_size_in_bytes)
+
+
+def get_artifact_store() -> ArtifactStore:
+    """Get the artifact store which is defined in :mod:`configurations`"""
+
+    return _get_artifact_store(
+        cdd_utilities.configurations.ARTIFACT_STORE_PATH,
+        cdd_utilities.configurations.ARTIFACT_STORE_MAXIMA_SIZE_IN_BYTES,
+    )
+
+
+def _get_function_name(function: typing.Callable) -> str:
+    function = getattr(function, "__func__", function)
+    # Lambdas defined in the same scope would share the same name.
+    # Their line number would distinguish them, but it changes
+    # whenever code above them is edited and their artifacts would
+    # be orphaned.
+    if getattr(function, "__name__", None) == "<lambda>":
+        raise ValueError(
+            f"Can't derive a name for lambda '{function.__qualname__}'. "
+            "Pass an explicit 'name' to 'compute_lazy'."
+        )
+    return f"{function.__module__}.{function.__qualname__}"
+
+
+def compute_lazy(
+    name: typing.Optional[str] = None,
+    file_path_tuple: tuple[str, ...] = (),
+    version: int = 0,
+):
+    """Save results of a function in the artifact store.
+
+    :param name: Identifies the function. By default the module and the
+        qualified name of the function are used. Lambdas have no
+        unique qualified name, therefore a name is required for them.
+    :param file_path_tuple: Files on which the result depends. If the
+        content of one of them changes, the result is computed again.
+    :param version: Increment to manually invalidate previous results
+        (e.g. if code called by the function changed).
+
+    The result is computed again if the code of the function, its
+    arguments, its closure variables or the global data it refers to
+    change.
+
+    **Example:**
+
+    >>> from mutwo import cdd_utilities
+    >>> @cdd_utilities.compute_lazy()
+    ... def add(a, b):
+    ...     return a + b
+    >>> square = cdd_utilities.compute_lazy(name="square")(lambda a: a**2)
+    """
+
+    def decorator(function: typing.Callable):
+        function_name = name or _get_function_name(function)
+
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            raw_function = getattr(function, "__func__", function)
+            code_hash = cdd_utilities.get_stable_hash(
+                raw_function.__code__
+                if isinstance(raw_function, types.FunctionType)
+                else raw_function,
+                version,
+            )
+            input_hash = cdd_utilities.get_stable_hash(
+                function,
+                args,
+                kwargs,
+                tuple(
+                    cdd_utilities.get_file_hash(file_path)
+                    for file_path in file_path_tuple
+                ),
+            )
+            artifact_store = get_artifact_store()
+            is_found, result = artifact_store.get(function_name, code_hash, input_hash)
+            if not is_found:
+                result = function(*args, **kwargs)
+                artifact_store.set(function_name, code_hash, input_hash, result)
+            return result
+
+        return wrapper
+
+    return decorator
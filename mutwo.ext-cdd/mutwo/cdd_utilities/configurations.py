@@ -0,0 +1,29 @@
+"""Configure the behaviour of :mod:`mutwo.cdd_utilities`"""
+
+import os
+import typing
+
+ARTIFACT_STORE_PATH = "builds/artifacts.sqlite"
+"""Database file in which :func:`mutwo.cdd_utilities.compute_lazy` stores
+the results of expensive computations."""
+
+ARTIFACT_STORE_MAXIMA_SIZE_IN_BYTES = 4 * 1024**3
+"""If the stored artifacts need more space, the artifacts which
+haven't been used for the longest time are removed."""
+
+PROCESS_POOL_JOB_COUNT = os.cpu_count() or 1
+"""How many external programs (e.g. csound renders) run at the
+same time (see :func:`mutwo.cdd_utilities.get_process_pool`)."""
+
+PROCESS_TIMEOUT_IN_SECONDS: typing.Optional[float] = None
+"""External programs which run longer are killed. ``None`` means
+that programs are never killed."""
+
+SCRATCH_SPACE_DIRECTORY_PATH: typing.Optional[str] = None
+"""Where temporary files are saved (see
+:func:`mutwo.cdd_utilities.get_scratch_space`). ``None`` means tmpfs
+if it has enough free space, otherwise the systems temporary
+directory."""
+
+SCRATCH_SPACE_MAXIMA_SIZE_IN_BYTES = 4 * 1024**3
+"""How much space the temporary files of one process can use."""
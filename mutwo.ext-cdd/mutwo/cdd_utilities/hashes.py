@@ -0,0 +1,280 @@
+"""Deterministic hashing of (mutwo) objects.
+
+Python's builtin ``hash`` is salted per process and isn't defined
+for mutable objects (like mutwo events). The functions in this
+module walk through an object and feed a canonical representation
+of it into a cryptographic hash function, so that equal objects
+return equal hashes in all processes and all sessions.
+"""
+
+import functools
+import hashlib
+import numbers
+import os
+import types
+import typing
+
+import numpy as np
+
+__all__ = ("get_stable_hash", "get_file_hash")
+
+
+def get_stable_hash(*object_to_hash: typing.Any) -> str:
+    """Get hex digest which only depends on the content of the objects.
+
+    :param object_to_hash: The objects which shall be hashed.
+
+    Events, parameters and converters are hashed via their class and
+    their attributes, functions (e.g. the lambdas used by many
+    converters) via their byte code, constants, default arguments,
+    closure variables and the global data they refer to.
+    Values of :class:`functools.cached_property` are ignored, because
+    they only depend on the other attributes of an object.
+
+    Objects can define a method ``get_stable_hash_content`` which returns
+    the content that shall be hashed instead of their attributes (for
+    instance the content of a file instead of its path). Objects which
+    neither define this method nor support the pickle protocol raise
+    a :class:`TypeError`.
+    """
+
+    hash_object = hashlib.sha256()
+    _update(hash_object, object_to_hash, {})
+    return hash_object.hexdigest()
+
+
+_path_and_stat_to_file_hash: dict[tuple[str, int, int], str] = {}
+
+
+def get_file_hash(path: str) -> str:
+    """Get hex digest of the content of a file.
+
+    :param path: The path of the file which shall be hashed.
+
+    The result is memorized per process (as long as size and
+    modification time of the file don't change).
+    """
+
+    stat_result = os.stat(path)
+    key = (os.path.abspath(path), stat_result.st_size, stat_result.st_mtime_ns)
+    try:
+        return _path_and_stat_to_file_hash[key]
+    except KeyError:
+        pass
+    hash_object = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(2**20), b""):
+            hash_object.update(chunk)
+    file_hash = _path_and_stat_to_file_hash[key] = hash_object.hexdigest()
+    return file_hash
+
+
+def _update_tag(hash_object, tag: str, content: str = ""):
+    hash_object.update(f"<{tag}:{content}>".encode())
+
+
+def _get_type_name(type_: type) -> str:
+    return f"{type_.__module__}.{type_.__qualname__}"
+
+
+def _update(hash_object, object_to_hash: typing.Any, id_to_index: dict[int, int]):
+    if object_to_hash is None or isinstance(object_to_hash, (bool, int, str)):
+        _update_tag(hash_object, type(object_to_hash).__name__, repr(object_to_hash))
+    elif isinstance(object_to_hash, bytes):
+        _update_tag(hash_object, "bytes", str(len(object_to_hash)))
+        hash_object.update(object_to_hash)
+    elif isinstance(object_to_hash, float):
+        # repr of floats is the shortest representation which round trips
+        # and therefore deterministic.
+        _update_tag(hash_object, "float", repr(object_to_hash))
+    elif isinstance(object_to_hash, numbers.Rational):
+        # Catches fractions.Fraction, quicktions.Fraction and abjad.Duration
+        _update_tag(
+            hash_object,
+            _get_type_name(type(object_to_hash)),
+            f"{object_to_hash.numerator}/{object_to_hash.denominator}",
+        )
+    elif isinstance(object_to_hash, np.ndarray):
+        _update_tag(
+            hash_object, "ndarray", f"{object_to_hash.dtype}{object_to_hash.shape}"
+        )
+        # The bytes of object arrays are the addresses of their items.
+        if object_to_hash.dtype.hasobject:
+            _update(hash_object, object_to_hash.tolist(), id_to_index)
+        else:
+            hash_object.update(np.ascontiguousarray(object_to_hash).tobytes())
+    elif isinstance(object_to_hash, np.generic):
+        _update(hash_object, object_to_hash.item(), id_to_index)
+    elif isinstance(object_to_hash, type):
+        _update_tag(hash_object, "type", _get_type_name(object_to_hash))
+    elif isinstance(object_to_hash, types.ModuleType):
+        _update_tag(hash_object, "module", object_to_hash.__name__)
+    # Objects which could contain themselves: use memo to avoid
+    # infinite recursion.
+    elif (object_id := id(object_to_hash)) in id_to_index:
+        _update_tag(hash_object, "reference", str(id_to_index[object_id]))
+    else:
+        id_to_index[object_id] = len(id_to_index)
+        if not isinstance(object_to_hash, type) and hasattr(
+            object_to_hash, "get_stable_hash_content"
+        ):
+            _update_tag(hash_object, "content", _get_type_name(type(object_to_hash)))
+            _update(hash_object, object_to_hash.get_stable_hash_content(), id_to_index)
+        else:
+            _update_container(hash_object, object_to_hash, id_to_index)
+
+
+def _update_container(hash_object, object_to_hash, id_to_index):
+    if type(object_to_hash) in (tuple, list):
+        _update_tag(hash_object, type(object_to_hash).__name__, str(len(object_to_hash)))
+        for item in object_to_hash:
+            _update(hash_object, item, id_to_index)
+    elif type(object_to_hash) is dict:
+        _update_mapping(hash_object, object_to_hash, id_to_index)
+    elif isinstance(object_to_hash, (set, frozenset)):
+        _update_tag(hash_object, "set", str(len(object_to_hash)))
+        for item_hash in sorted(get_stable_hash(item) for item in object_to_hash):
+            _update_tag(hash_object, "item", item_hash)
+    elif isinstance(object_to_hash, types.FunctionType):
+        _update_function(hash_object, object_to_hash, id_to_index)
+    elif isinstance(object_to_hash, types.CodeType):
+        _update_code(hash_object, object_to_hash, id_to_index)
+    elif isinstance(object_to_hash, types.MethodType):
+        _update_tag(hash_object, "method")
+        _update(hash_object, object_to_hash.__func__, id_to_index)
+        _update(hash_object, object_to_hash.__self__, id_to_index)
+    elif isinstance(
+        object_to_hash, (types.BuiltinFunctionType, types.BuiltinMethodType)
+    ):
+        _update_tag(
+            hash_object,
+            "builtin",
+            f"{getattr(object_to_hash, '__module__', None)}.{object_to_hash.__qualname__}",
+        )
+    else:
+        _update_object(hash_object, object_to_hash, id_to_index)
+
+
+def _update_mapping(hash_object, mapping, id_to_index):
+    _update_tag(hash_object, "dict", str(len(mapping)))
+    # Sort items by the hash of their keys: dictionaries with equal
+    # content but a different insertion order are equal.
+    for _, key, value in sorted(
+        ((get_stable_hash(key), key, value) for key, value in mapping.items()),
+        key=lambda hash_key_value: hash_key_value[0],
+    ):
+        _update(hash_object, key, id_to_index)
+        _update(hash_object, value, id_to_index)
+
+
+def _update_function(hash_object, function: types.FunctionType, id_to_index):
+    _update_tag(hash_object, "function", f"{function.__module__}.{function.__qualname__}")
+    _update_code(hash_object, function.__code__, id_to_index)
+    _update(hash_object, function.__defaults__, id_to_index)
+    _update(hash_object, function.__kwdefaults__, id_to_index)
+    if function.__closure__:
+        closure_content_list = []
+        for cell in function.__closure__:
+            try:
+                closure_content_list.append(cell.cell_contents)
+            except ValueError:  # Empty cell
+                closure_content_list.append(None)
+        _update(hash_object, closure_content_list, id_to_index)
+    _update(
+        hash_object,
+        _get_global_data_dict(function.__code__, function.__globals__, function.__module__),
+        id_to_index,
+    )
+
+
+def _get_global_data_dict(
+    code: types.CodeType, global_dict: dict[str, typing.Any], module_name: str
+) -> dict[str, typing.Any]:
+    """Find global variables which are used by a function.
+
+    Modules, classes and functions of other modules are skipped: they
+    are (mostly) library code and hashing them would mean to hash
+    the complete interpreter state.
+    """
+
+    global_data_dict = {}
+    code_list = [code]
+    while code_list:
+        local_code = code_list.pop()
+        code_list.extend(
+            constant
+            for constant in local_code.co_consts
+            if isinstance(constant, types.CodeType)
+        )
+        for name in local_code.co_names:
+            try:
+                value = global_dict[name]
+            except KeyError:
+                continue
+            if isinstance(value, (types.ModuleType, type)) or (
+                callable(value)
+                and getattr(value, "__module__", None) != module_name
+            ):
+                continue
+            global_data_dict[name] = value
+    return global_data_dict
+
+
+def _update_code(hash_object, code: types.CodeType, id_to_index):
+    _update_tag(hash_object, "code", code.co_name)
+    hash_object.update(code.co_code)
+    _update(hash_object, code.co_consts, id_to_index)
+    _update(hash_object, code.co_names, id_to_index)
+
+
+def _update_object(hash_object, object_to_hash, id_to_index):
+    _update_tag(hash_object, "object", _get_type_name(type(object_to_hash)))
+    try:
+        reduce_value = object_to_hash.__reduce_ex__(2)
+    except TypeError as error:
+        # The repr of such objects usually contains their address and
+        # would therefore change in each process.
+        raise TypeError(
+            f"Can't get stable hash of '{object_to_hash!r}': it doesn't support "
+            "the pickle protocol. Define 'get_stable_hash_content' to hash it."
+        ) from error
+    # The object is a global constant which is pickled by its name.
+    if isinstance(reduce_value, str):
+        _update_tag(hash_object, "global", reduce_value)
+        return
+
+    # See https://docs.python.org/3/library/pickle.html#object.__reduce__
+    callable_, argument_tuple, *rest = reduce_value + (None,) * (5 - len(reduce_value))
+    state, list_item_iterator, dict_item_iterator = rest[:3]
+    _update(hash_object, callable_, id_to_index)
+    _update(hash_object, argument_tuple, id_to_index)
+    if isinstance(state, dict):
+        _update_mapping(
+            hash_object,
+            _remove_cached_property_values(type(object_to_hash), state),
+            id_to_index,
+        )
+    else:
+        _update(hash_object, state, id_to_index)
+    if list_item_iterator is not None:
+        _update(hash_object, list(list_item_iterator), id_to_index)
+    if dict_item_iterator is not None:
+        _update_mapping(hash_object, dict(dict_item_iterator), id_to_index)
+
+
+def _remove_cached_property_values(
+    type_: type, state: dict[str, typing.Any]
+) -> dict[str, typing.Any]:
+    cached_property_name_set = {
+        name
+        for class_ in type_.__mro__
+        for name, value in vars(class_).items()
+        if isinstance(value, functools.cached_property)
+    }
+    if cached_property_name_set:
+        return {
+            name: value
+            for name, value in state.items()
+            if name not in cached_property_name_set
+        }
+    return state
@@ -0,0 +1,117 @@
+import concurrent.futures
+import dataclasses
+import functools
+import os
+import signal
+import subprocess
+import threading
+import time
+import typing
+
+from mutwo import cdd_utilities
+
+__all__ = ("ProcessResult", "ProcessPool", "get_process_pool")
+
+
+@dataclasses.dataclass(frozen=True)
+class ProcessResult(object):
+    command: tuple[str, ...]
+    # Negative if the process has been killed by a signal
+    exit_status: int
+    stderr: str
+    duration_in_seconds: float
+    is_timed_out: bool = False
+    # CPU time (user + system) of the process
+    cpu_time_in_seconds: typing.Optional[float] = None
+    maxima_resident_set_size_in_bytes: typing.Optional[int] = None
+
+    @property
+    def is_successful(self) -> bool:
+        return self.exit_status == 0
+
+
+class ProcessPool(object):
+    """Run external programs (e.g. csound) without blocking.
+
+    :param job_count: How many programs run at the same time.
+    :param timeout_in_seconds: Programs which run longer are killed.
+        Set to ``None`` to never kill programs.
+
+    Each submitted command returns a :class:`concurrent.futures.Future`
+    which resolves to a :class:`ProcessResult`. The standard output of
+    the programs is passed through, the standard error is captured
+    (and returned in the result).
+
+    **Example:**
+
+    >>> from mutwo import cdd_utilities
+    >>> process_pool = cdd_utilities.ProcessPool(2)
+    >>> process_pool.submit(("echo", "hello")).result().exit_status
+    hello
+    0
+    """
+
+    def __init__(
+        self, job_count: int, timeout_in_seconds: typing.Optional[float] = None
+    ):
+        self._timeout_in_seconds = timeout_in_seconds
+        self._executor = concurrent.futures.ThreadPoolExecutor(job_count)
+
+    def _run(self, command: tuple[str, ...]) -> ProcessResult:
+        start_time = time.time()
+        process = subprocess.Popen(command, stderr=subprocess.PIPE)
+        timeout_event = threading.Event()
+
+        def kill():
+            timeout_event.set()
+            process.kill()
+
+        if self._timeout_in_seconds is not None:
+            timer = threading.Timer(self._timeout_in_seconds, kill)
+            timer.start()
+        else:
+            timer = None
+        try:
+            # The process closes stderr when it exits (or is killed).
+            stderr = process.stderr.read().decode(errors="replace")
+            # 'wait4' (instead of 'Popen.wait') to get the resource
+            # usage of this process only.
+            _, wait_status, resource_usage = os.wait4(process.pid, 0)
+        finally:
+            if timer:
+                timer.cancel()
+            process.stderr.close()
+        process.returncode = exit_status = os.waitstatus_to_exitcode(wait_status)
+        if timeout_event.is_set():
+            exit_status = -signal.SIGKILL
+        return ProcessResult(
+            command,
+            exit_status,
+            stderr,
+            time.time() - start_time,
+            is_timed_out=timeout_event.is_set(),
+            cpu_time_in_seconds=resource_usage.ru_utime + resource_usage.ru_stime,
+            # ru_maxrss is given in kilobytes on Linux
+            maxima_resident_set_size_in_bytes=resource_usage.ru_maxrss * 1024,
+        )
+
+    def submit(
+        self, command: typing.Sequence[str]
+    ) -> concurrent.futures.Future[ProcessResult]:
+        return self._executor.submit(self._run, tuple(command))
+
+
+@functools.lru_cache(maxsize=None)
+def _get_process_pool(
+    job_count: int, timeout_in_seconds: typing.Optional[float]
+) -> ProcessPool:
+    return ProcessPool(job_count, timeout_in_seconds)
+
+
+def get_process_pool() -> ProcessPool:
+    """Get the process pool which is defined in :mod:`configurations`"""
+
+    return _get_process_pool(
+        cdd_utilities.configurations.PROCESS_POOL_JOB_COUNT,
+        cdd_utilities.configurations.PROCESS_TIMEOUT_IN_SECONDS,
+    )
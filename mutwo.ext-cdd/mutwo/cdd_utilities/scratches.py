@@ -0,0 +1,185 @@
+import errno
+import fcntl
+import multiprocessing.util
+import os
+import shutil
+import tempfile
+import time
+import typing
+import uuid
+
+from mutwo import cdd_utilities
+
+__all__ = ("ScratchSpace", "get_scratch_space")
+
+# tmpfs: files never touch the disk.
+_TMPFS_DIRECTORY_PATH = "/dev/shm"
+_SCRATCH_SPACE_PREFIX = "cdd-scratch-"
+# Scratch spaces are renamed to their final name after they are locked.
+_NEW_SCRATCH_SPACE_PREFIX = "cdd-new-scratch-"
+_LOCK_FILE_NAME = ".lock"
+
+
+class ScratchSpace(object):
+    """Directory for temporary files (e.g. scores and sound files).
+
+    :param parent_directory_path: In which directory the scratch space
+        is created.
+    :param maxima_size_in_bytes: If the files in the scratch space
+        need more space, no new paths are given out (the size is
+        checked at most every few seconds).
+
+    Each process has its own scratch space (see :func:`get_scratch_space`),
+    which is removed when the process exits. If a process crashes
+    before it can remove its scratch space, the scratch space is
+    removed by the next process which creates a scratch space in the
+    same parent directory. A scratch space is in use as long as its
+    lock file is locked (the lock is released by the operating system
+    when the process ends).
+    """
+
+    # Walking through the scratch space takes time: its size is only
+    # checked again after this interval.
+    _size_check_interval_in_seconds = 5
+
+    def __init__(self, parent_directory_path: str, maxima_size_in_bytes: int):
+        self._maxima_size_in_bytes = maxima_size_in_bytes
+        self._last_size_check_time = None
+        os.makedirs(parent_directory_path, exist_ok=True)
+        self._remove_orphaned_scratch_spaces(parent_directory_path)
+        new_path = tempfile.mkdtemp(
+            prefix=_NEW_SCRATCH_SPACE_PREFIX, dir=parent_directory_path
+        )
+        self._lock_file_descriptor = os.open(
+            f"{new_path}/{_LOCK_FILE_NAME}", os.O_RDWR | os.O_CREAT
+        )
+        fcntl.flock(self._lock_file_descriptor, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        # Other processes only see locked scratch spaces.
+        self.path = os.path.join(
+            parent_directory_path,
+            os.path.basename(new_path).replace(
+                _NEW_SCRATCH_SPACE_PREFIX, _SCRATCH_SPACE_PREFIX, 1
+            ),
+        )
+        os.rename(new_path, self.path)
+
+    @staticmethod
+    def _remove_orphaned_scratch_spaces(parent_directory_path: str):
+        for directory_name in os.listdir(parent_directory_path):
+            if not directory_name.startswith(_SCRATCH_SPACE_PREFIX):
+                continue
+            directory_path = f"{parent_directory_path}/{directory_name}"
+            try:
+                lock_file_descriptor = os.open(
+                    f"{directory_path}/{_LOCK_FILE_NAME}", os.O_RDWR
+                )
+            # Created by another user.
+            except PermissionError:
+                continue
+            # Scratch spaces are always locked before they get their
+            # name, so this one is removed in the meantime (or
+            # it has been created before scratch spaces were locked).
+            except FileNotFoundError:
+                shutil.rmtree(directory_path, ignore_errors=True)
+                continue
+            try:
+                fcntl.flock(lock_file_descriptor, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            # The scratch space is still in use.
+            except BlockingIOError:
+                continue
+            else:
+                shutil.rmtree(directory_path, ignore_errors=True)
+            finally:
+                os.close(lock_file_descriptor)
+
+    def get_size(self) -> int:
+        """Size of all files in the scratch space in bytes"""
+
+        size = 0
+        for directory_path, _, file_name_list in os.walk(self.path):
+            for file_name in file_name_list:
+                try:
+                    size += os.path.getsize(f"{directory_path}/{file_name}")
+                except FileNotFoundError:  # Removed in the meantime
+                    pass
+        return size
+
+    def get_path(self, suffix: str = "", prefix: str = "") -> str:
+        """Get new unique path for a temporary file.
+
+        :param suffix: End of the file name, e.g. '.wav'.
+        :param prefix: Start of the file name.
+
+        The file isn't created.
+        """
+
+        now = time.monotonic()
+        if (
+            self._last_size_check_time is None
+            or now - self._last_size_check_time
+            >= self._size_check_interval_in_seconds
+        ):
+            self._last_size_check_time = now
+            if (size := self.get_size()) > self._maxima_size_in_bytes:
+                # Check again with the next path.
+                self._last_size_check_time = None
+                raise OSError(
+                    errno.EDQUOT,
+                    f"Scratch space '{self.path}' already uses {size} bytes "
+                    f"(maximum: {self._maxima_size_in_bytes} bytes). Maybe "
+                    "temporary files are never removed?",
+                )
+        return f"{self.path}/{prefix}{uuid.uuid4().hex}{suffix}"
+
+    def cleanup(self):
+        shutil.rmtree(self.path, ignore_errors=True)
+        os.close(self._lock_file_descriptor)
+
+
+def _get_parent_directory_path(maxima_size_in_bytes: int) -> str:
+    if (
+        parent_directory_path := cdd_utilities.configurations.SCRATCH_SPACE_DIRECTORY_PATH
+    ) is not None:
+        return parent_directory_path
+    try:
+        file_system_statistic = os.statvfs(_TMPFS_DIRECTORY_PATH)
+    except OSError:
+        pass
+    else:
+        if os.access(_TMPFS_DIRECTORY_PATH, os.W_OK) and (
+            file_system_statistic.f_bavail * file_system_statistic.f_frsize
+            >= maxima_size_in_bytes
+        ):
+            return _TMPFS_DIRECTORY_PATH
+    return tempfile.gettempdir()
+
+
+_process_id_and_scratch_space: typing.Optional[tuple[int, ScratchSpace]] = None
+
+
+def get_scratch_space() -> ScratchSpace:
+    """Get the scratch space of the current process.
+
+    It is created on first use, in ``SCRATCH_SPACE_DIRECTORY_PATH``
+    or (if this isn't set) in tmpfs if it has enough free space or
+    in the systems temporary directory.
+    """
+
+    global _process_id_and_scratch_space
+
+    process_id = os.getpid()
+    if (
+        _process_id_and_scratch_space is None
+        or _process_id_and_scratch_space[0] != process_id
+    ):
+        maxima_size_in_bytes = (
+            cdd_utilities.configurations.SCRATCH_SPACE_MAXIMA_SIZE_IN_BYTES
+        )
+        scratch_space = ScratchSpace(
+            _get_parent_directory_path(maxima_size_in_bytes), maxima_size_in_bytes
+        )
+        # Unlike 'atexit' this also runs when processes of
+        # 'multiprocessing' exit.
+        multiprocessing.util.Finalize(None, scratch_space.cleanup, exitpriority=0)
+        _process_id_and_scratch_space = (process_id, scratch_space)
+    return _process_id_and_scratch_space[1]
@@ -4,7 +4,11 @@ import setuptools  # type: ignore
 with open("README.md", "r", encoding="utf-8") as fh:
     long_description = fh.read()
 
-extras_require = {"testing": ["nose", "coveralls"]}
+extras_require = {
+    "testing": ["nose", "coveralls"],
+    # in-process csound rendering (mutwo.cdd_converters.csound_engines)
+    "ctcsound": ["ctcsound"],
+}
 
 setuptools.setup(
     name="mutwo.ext-cdd",
@@ -0,0 +1,169 @@
+import io
+import threading
+import unittest
+
+import numpy as np
+
+from mutwo import cdd_converters
+from mutwo import core_events
+
+
+def _get_value_tuple(function_table_argument_str: str) -> tuple[float, ...]:
+    # '0 size gen value duration value ... value'
+    return tuple(map(float, function_table_argument_str.split()[3::2]))
+
+
+class EnvelopeToFunctionTableTest(unittest.TestCase):
+    def setUp(self):
+        self.converter = cdd_converters.EnvelopeToFunctionTable()
+
+    def test_constant_envelope(self):
+        self.assertEqual(
+            self.converter.convert_to_argument_str(core_events.Envelope([[0, 0.3]])),
+            "0 10 7 0.3 10 0.3",
+        )
+
+    def test_linear_envelope(self):
+        envelope = core_events.Envelope(
+            [[index / 10, index / 10] for index in range(11)]
+        )
+        self.assertEqual(
+            self.converter.convert_to_argument_str(envelope),
+            "0 100000 7 0.0 100000 1.0",
+        )
+
+    def test_peak_is_kept(self):
+        envelope = core_events.Envelope([[0, 0], [0.5, 1], [1, 0]])
+        self.assertEqual(
+            self.converter.convert_to_argument_str(envelope),
+            "0 100000 7 0.0 50000 1.0 50000 0.0",
+        )
+
+    def test_maxima_error(self):
+        random = np.random.default_rng(10)
+        envelope = core_events.Envelope(
+            [[index, value] for index, value in enumerate(random.random(300))]
+        )
+        converter = cdd_converters.EnvelopeToFunctionTable(
+            maxima_segment_count=1000, maxima_error=0.1
+        )
+        position_array, value_array = converter._get_point_array_tuple(envelope)
+        kept_index_array = converter._simplify(position_array, value_array)
+        self.assertLess(len(kept_index_array), len(position_array))
+        error_array = np.abs(
+            np.interp(
+                position_array,
+                position_array[kept_index_array],
+                value_array[kept_index_array],
+            )
+            - value_array
+        )
+        self.assertLessEqual(error_array.max(), 0.1)
+
+    def test_maxima_segment_count(self):
+        random = np.random.default_rng(100)
+        envelope = core_events.Envelope(
+            [[index, value] for index, value in enumerate(random.random(1000))]
+        )
+        converter = cdd_converters.EnvelopeToFunctionTable(maxima_segment_count=10)
+        self.assertEqual(
+            len(_get_value_tuple(converter.convert_to_argument_str(envelope))), 11
+        )
+
+    def test_convert(self):
+        self.assertEqual(
+            self.converter.convert(core_events.Envelope([[0, 0.3]]), 3),
+            "f 3 0 10 7 0.3 10 0.3",
+        )
+
+
+class EventToCsoundScoreWithFunctionTablesTest(unittest.TestCase):
+    @staticmethod
+    def _get_simple_event(*value_tuple) -> core_events.SimpleEvent:
+        simple_event = core_events.SimpleEvent(1)
+        simple_event.spectral_centroid_envelope_tuple = (
+            core_events.Envelope([[0, value_tuple[0]], [1, value_tuple[1]]]),
+        )
+        return simple_event
+
+    def _get_converter(self, p5=lambda _: 0):
+        converter = cdd_converters.EventToCsoundScoreWithFunctionTables(
+            p1=lambda _: 1,
+            p3=lambda event: float(event.duration),
+            p4=lambda _: converter.get_function_table_index(
+                "spectral_centroid_envelope_tuple", 0
+            ),
+            p5=p5,
+        )
+        return converter
+
+    @staticmethod
+    def _split_score(score: str) -> tuple[list[str], list[str]]:
+        line_list = score.splitlines()
+        return (
+            [line for line in line_list if line.startswith("f ")],
+            [line for line in line_list if line.startswith("i ")],
+        )
+
+    def test_equal_function_tables_are_shared(self):
+        score_file = io.StringIO()
+        self._get_converter().convert(
+            core_events.SequentialEvent(
+                [
+                    self._get_simple_event(0.25, 0.75),
+                    self._get_simple_event(0.25, 0.75),
+                    self._get_simple_event(0.5, 0.5),
+                ]
+            ),
+            score_file,
+        )
+        function_table_line_list, event_line_list = self._split_score(
+            score_file.getvalue()
+        )
+        self.assertEqual(len(function_table_line_list), 2)
+        self.assertTrue(function_table_line_list[0].startswith("f 1 "))
+        self.assertTrue(function_table_line_list[1].startswith("f 2 "))
+        self.assertEqual(
+            [event_line.split()[4] for event_line in event_line_list], ["1", "1", "2"]
+        )
+
+    def test_conversions_are_independent(self):
+        converter = self._get_converter()
+        for _ in range(2):
+            score_file = io.StringIO()
+            converter.convert(self._get_simple_event(0.25, 0.75), score_file)
+            function_table_line_list, _ = self._split_score(score_file.getvalue())
+            self.assertEqual(len(function_table_line_list), 1)
+
+    def test_parallel_conversions(self):
+        # Both conversions are paused while converting their event, so
+        # that they run at the same time.
+        barrier = threading.Barrier(2, timeout=10)
+        converter = self._get_converter(p5=lambda _: (barrier.wait(), 0)[1])
+        value_tuple_tuple = ((0.25, 0.75), (0.5, 0.5))
+        score_file_tuple = (io.StringIO(), io.StringIO())
+        thread_tuple = tuple(
+            threading.Thread(
+                target=converter.convert,
+                args=(self._get_simple_event(*value_tuple), score_file),
+            )
+            for value_tuple, score_file in zip(value_tuple_tuple, score_file_tuple)
+        )
+        for thread in thread_tuple:
+            thread.start()
+        for thread in thread_tuple:
+            thread.join()
+        for value_tuple, score_file in zip(value_tuple_tuple, score_file_tuple):
+            function_table_line_list, event_line_list = self._split_score(
+                score_file.getvalue()
+            )
+            self.assertEqual(len(function_table_line_list), 1)
+            self.assertEqual(
+                _get_value_tuple(function_table_line_list[0][len("f 1 ") :])[0],
+                value_tuple[0],
+            )
+            self.assertEqual(event_line_list[0].split()[4], "1")
+
+
+if __name__ == "__main__":
+    unittest.main()
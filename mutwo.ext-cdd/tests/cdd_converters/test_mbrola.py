@@ -0,0 +1,126 @@
+import types
+import unittest
+
+import numpy as np
+
+from mutwo import cdd_converters
+from mutwo import cdd_utilities
+from mutwo import core_events
+from mutwo import music_parameters
+
+
+def _get_simple_event(duration, phonetic_representation=None, frequency=None):
+    simple_event = core_events.SimpleEvent(duration)
+    if phonetic_representation is not None:
+        simple_event.lyric = types.SimpleNamespace(
+            phonetic_representation=phonetic_representation
+        )
+    if frequency is not None:
+        simple_event.pitch = music_parameters.DirectPitch(frequency)
+    return simple_event
+
+
+def _simple_event_to_pitch(simple_event):
+    return getattr(simple_event, "pitch", None)
+
+
+class PhonemeStreamTest(unittest.TestCase):
+    def setUp(self):
+        self.sequential_event = core_events.SequentialEvent(
+            [
+                _get_simple_event(1, ("a", "b"), 220),
+                _get_simple_event(0.5),
+                _get_simple_event(0.25, ("o",), 330),
+            ]
+        )
+        self.phoneme_stream = cdd_converters.PhonemeStream.from_sequential_event(
+            self.sequential_event, _simple_event_to_pitch
+        )
+
+    def test_from_sequential_event(self):
+        self.assertEqual(len(self.phoneme_stream), 4)
+        self.assertEqual(
+            self.phoneme_stream.phoneme_array.tolist(), ["a", "b", "_", "o"]
+        )
+        np.testing.assert_array_equal(
+            self.phoneme_stream.duration_array, [0.5, 0.5, 0.5, 0.25]
+        )
+        np.testing.assert_array_equal(
+            self.phoneme_stream.frequency_array, [220, 220, np.nan, 330]
+        )
+        np.testing.assert_array_equal(
+            self.phoneme_stream.simple_event_index_array, [0, 0, 1, 2]
+        )
+        self.assertEqual(self.phoneme_stream.duration, 1.75)
+
+    def test_absolute_time_array(self):
+        np.testing.assert_array_equal(
+            self.phoneme_stream.absolute_time_array, [0, 0.5, 1, 1.5]
+        )
+
+    def test_is_rest_array(self):
+        np.testing.assert_array_equal(
+            self.phoneme_stream.is_rest_array, [False, False, True, False]
+        )
+
+    def test_slice(self):
+        phoneme_stream = self.phoneme_stream[1:3]
+        self.assertEqual(phoneme_stream.phoneme_array.tolist(), ["b", "_"])
+        self.assertEqual(phoneme_stream.duration, 1)
+        self.assertTrue(
+            np.shares_memory(
+                phoneme_stream.duration_array, self.phoneme_stream.duration_array
+            )
+        )
+        self.assertIs(
+            phoneme_stream.simple_event_tuple, self.phoneme_stream.simple_event_tuple
+        )
+        with self.assertRaises(TypeError):
+            self.phoneme_stream[0]
+
+    def test_copy(self):
+        phoneme_stream = self.phoneme_stream.copy()
+        phoneme_stream.duration_array[0] = 10
+        self.assertEqual(self.phoneme_stream.duration_array[0], 0.5)
+
+    def test_stable_hash(self):
+        self.assertEqual(
+            cdd_utilities.get_stable_hash(self.phoneme_stream),
+            cdd_utilities.get_stable_hash(
+                cdd_converters.PhonemeStream.from_sequential_event(
+                    self.sequential_event.copy(), _simple_event_to_pitch
+                )
+            ),
+        )
+        phoneme_stream = self.phoneme_stream.copy()
+        phoneme_stream.phoneme_array[0] = "e"
+        self.assertNotEqual(
+            cdd_utilities.get_stable_hash(self.phoneme_stream),
+            cdd_utilities.get_stable_hash(phoneme_stream),
+        )
+
+    def test_to_phoneme_list(self):
+        phoneme_stream = self.phoneme_stream.copy()
+        # Durations are truncated to milliseconds.
+        phoneme_stream.duration_array[:] = 0.0019
+        phoneme_list = phoneme_stream.to_phoneme_list()
+        self.assertEqual(
+            [phoneme.name for phoneme in phoneme_list], ["a", "b", "_", "o"]
+        )
+        self.assertEqual([phoneme.duration for phoneme in phoneme_list], [1] * 4)
+
+
+class SequentialEventToMbrolaFriendlyEventTest(unittest.TestCase):
+    def test_convert_to_phoneme_stream(self):
+        sequential_event = core_events.SequentialEvent(
+            [_get_simple_event(1, ("a",), 220)]
+        )
+        phoneme_stream = cdd_converters.SequentialEventToMbrolaFriendlyEvent().convert_to_phoneme_stream(
+            sequential_event, _simple_event_to_pitch
+        )
+        self.assertEqual(phoneme_stream.phoneme_array.tolist(), ["a"])
+        self.assertEqual(phoneme_stream.frequency_array.tolist(), [220])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,154 @@
+import concurrent.futures
+import os
+import tempfile
+import threading
+import unittest
+
+from mutwo import cdd_utilities
+
+
+class ArtifactStoreTest(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.artifact_store = cdd_utilities.ArtifactStore(
+            f"{self.directory.name}/artifacts.sqlite", 1024**2
+        )
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_get_and_set(self):
+        self.assertEqual(self.artifact_store.get("f", "c", "i"), (False, None))
+        self.artifact_store.set("f", "c", "i", [1, 2])
+        self.assertEqual(self.artifact_store.get("f", "c", "i"), (True, [1, 2]))
+
+    def test_outdated_code(self):
+        self.artifact_store.set("f", "c0", "i", 1)
+        self.artifact_store.set("f", "c1", "j", 2)
+        self.assertEqual(self.artifact_store.get("f", "c0", "i"), (False, None))
+        self.assertEqual(self.artifact_store.get("f", "c1", "j"), (True, 2))
+
+    def test_evict(self):
+        artifact_store = cdd_utilities.ArtifactStore(
+            f"{self.directory.name}/small.sqlite", 1500
+        )
+        artifact_store.set("f", "c", "0", bytes(1000))
+        artifact_store.set("f", "c", "1", bytes(1000))
+        self.assertFalse(artifact_store.get("f", "c", "0")[0])
+        self.assertTrue(artifact_store.get("f", "c", "1")[0])
+
+    def test_evict_to_eviction_ratio(self):
+        artifact_store = cdd_utilities.ArtifactStore(
+            f"{self.directory.name}/small.sqlite", 3500
+        )
+        for index in range(4):
+            artifact_store.set("f", "c", str(index), bytes(1000))
+        # Evicted until only 80% of the maxima size are used.
+        self.assertEqual(
+            [artifact_store.get("f", "c", str(index))[0] for index in range(4)],
+            [False, False, True, True],
+        )
+
+    def test_file_shrinks(self):
+        path = f"{self.directory.name}/shrink.sqlite"
+        artifact_store = cdd_utilities.ArtifactStore(path, 100000)
+        for index in range(3):
+            artifact_store.set("f", "c", str(index), os.urandom(40000))
+        size = os.path.getsize(path)
+        artifact_store.clear()
+        self.assertLess(os.path.getsize(path), size / 2)
+
+    def test_threads(self):
+        # Regression test: the connection of the main thread mustn't
+        # be used by other threads.
+        self.artifact_store.set("f", "c", "main", 0)
+
+        def use_artifact_store(index):
+            self.artifact_store.set("f", "c", str(index), index)
+            return self.artifact_store.get("f", "c", "main")
+
+        with concurrent.futures.ThreadPoolExecutor(4) as executor:
+            result_list = list(executor.map(use_artifact_store, range(8)))
+        self.assertEqual(result_list, [(True, 0)] * 8)
+        for index in range(8):
+            self.assertEqual(
+                self.artifact_store.get("f", "c", str(index)), (True, index)
+            )
+
+    def test_thread_after_main_thread(self):
+        self.artifact_store.get("f", "c", "i")
+        result_list = []
+        thread = threading.Thread(
+            target=lambda: result_list.append(self.artifact_store.get("f", "c", "i"))
+        )
+        thread.start()
+        thread.join()
+        self.assertEqual(result_list, [(False, None)])
+
+
+class ComputeLazyTest(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.artifact_store_path = cdd_utilities.configurations.ARTIFACT_STORE_PATH
+        cdd_utilities.configurations.ARTIFACT_STORE_PATH = (
+            f"{self.directory.name}/artifacts.sqlite"
+        )
+
+    def tearDown(self):
+        cdd_utilities.configurations.ARTIFACT_STORE_PATH = self.artifact_store_path
+        self.directory.cleanup()
+
+    def test_result_is_stored(self):
+        # Closure variables are part of the input, therefore the calls
+        # are logged in a file and not in a list.
+        log_file_path = f"{self.directory.name}/log"
+
+        @cdd_utilities.compute_lazy()
+        def add(a, b):
+            with open(log_file_path, "a") as f:
+                f.write(f"{a}+{b} ")
+            return a + b
+
+        self.assertEqual(add(1, 2), 3)
+        self.assertEqual(add(1, 2), 3)
+        self.assertEqual(add(2, 2), 4)
+        with open(log_file_path, "r") as f:
+            self.assertEqual(f.read(), "1+2 2+2 ")
+
+    def test_file_dependency(self):
+        file_path = f"{self.directory.name}/input"
+        with open(file_path, "w") as f:
+            f.write("a")
+
+        @cdd_utilities.compute_lazy(file_path_tuple=(file_path,))
+        def read():
+            with open(file_path, "r") as f:
+                return f.read()
+
+        self.assertEqual(read(), "a")
+        with open(file_path, "w") as f:
+            f.write("b")
+        self.assertEqual(read(), "b")
+
+    def test_lambda_requires_name(self):
+        with self.assertRaises(ValueError):
+            cdd_utilities.compute_lazy()(lambda: 1)
+        self.assertEqual(cdd_utilities.compute_lazy(name="one")(lambda: 1)(), 1)
+
+
+class GetReferencedFilePathTupleTest(unittest.TestCase):
+    def test_quoted_paths(self):
+        with tempfile.TemporaryDirectory() as directory_path:
+            file_path = f"{directory_path}/sample.wav"
+            open(file_path, "w").close()
+            self.assertEqual(
+                cdd_utilities.get_referenced_file_path_tuple(
+                    f'a "{file_path}" b "{directory_path}/missing.wav"'
+                ),
+                (file_path,),
+            )
+            self.assertTrue(os.path.isfile(file_path))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,157 @@
+import fractions
+import os
+import subprocess
+import sys
+import tempfile
+import threading
+import unittest
+
+import numpy as np
+
+from mutwo import cdd_utilities
+
+
+class _Point(object):
+    def __init__(self, x, y):
+        self.x = x
+        self.y = y
+
+
+class GetStableHashTest(unittest.TestCase):
+    def test_equal_content(self):
+        self.assertEqual(
+            cdd_utilities.get_stable_hash(_Point(1, [2, 3])),
+            cdd_utilities.get_stable_hash(_Point(1, [2, 3])),
+        )
+        self.assertNotEqual(
+            cdd_utilities.get_stable_hash(_Point(1, [2, 3])),
+            cdd_utilities.get_stable_hash(_Point(1, [2, 4])),
+        )
+
+    def test_type_is_hashed(self):
+        self.assertNotEqual(
+            cdd_utilities.get_stable_hash((1, 2)), cdd_utilities.get_stable_hash([1, 2])
+        )
+        self.assertNotEqual(
+            cdd_utilities.get_stable_hash(1), cdd_utilities.get_stable_hash(1.0)
+        )
+
+    def test_dict_order(self):
+        self.assertEqual(
+            cdd_utilities.get_stable_hash({"a": 1, "b": 2}),
+            cdd_utilities.get_stable_hash({"b": 2, "a": 1}),
+        )
+
+    def test_fraction(self):
+        self.assertEqual(
+            cdd_utilities.get_stable_hash(fractions.Fraction(2, 4)),
+            cdd_utilities.get_stable_hash(fractions.Fraction(1, 2)),
+        )
+
+    def test_numeric_array(self):
+        self.assertEqual(
+            cdd_utilities.get_stable_hash(np.arange(4.0)),
+            cdd_utilities.get_stable_hash(np.arange(4.0)),
+        )
+        self.assertNotEqual(
+            cdd_utilities.get_stable_hash(np.arange(4.0)),
+            cdd_utilities.get_stable_hash(np.arange(4)),
+        )
+        self.assertNotEqual(
+            cdd_utilities.get_stable_hash(np.zeros((2, 2))),
+            cdd_utilities.get_stable_hash(np.zeros(4)),
+        )
+
+    def test_object_array(self):
+        # Object arrays are hashed by their items and not by the
+        # addresses of their items.
+        self.assertEqual(
+            cdd_utilities.get_stable_hash(np.array(["a", "bc"], dtype=object)),
+            cdd_utilities.get_stable_hash(np.array(["a", "b" + "c"], dtype=object)),
+        )
+        self.assertNotEqual(
+            cdd_utilities.get_stable_hash(np.array(["a", "bc"], dtype=object)),
+            cdd_utilities.get_stable_hash(np.array(["a", "bd"], dtype=object)),
+        )
+
+    def test_lambda(self):
+        self.assertEqual(
+            cdd_utilities.get_stable_hash(lambda x: x + 1),
+            cdd_utilities.get_stable_hash(lambda x: x + 1),
+        )
+        self.assertNotEqual(
+            cdd_utilities.get_stable_hash(lambda x: x + 1),
+            cdd_utilities.get_stable_hash(lambda x: x + 2),
+        )
+
+    def test_closure(self):
+        def make_function(value):
+            return lambda: value
+
+        self.assertNotEqual(
+            cdd_utilities.get_stable_hash(make_function(1)),
+            cdd_utilities.get_stable_hash(make_function(2)),
+        )
+
+    def test_recursive_object(self):
+        recursive_list = [1]
+        recursive_list.append(recursive_list)
+        cdd_utilities.get_stable_hash(recursive_list)
+
+    def test_unpicklable_object(self):
+        with self.assertRaises(TypeError):
+            cdd_utilities.get_stable_hash(_Point(threading.Lock(), 1))
+
+    def test_stable_hash_content(self):
+        class File(object):
+            def __init__(self, path, content):
+                self.path = path
+                self.content = content
+
+            def get_stable_hash_content(self):
+                return self.content
+
+        self.assertEqual(
+            cdd_utilities.get_stable_hash(File("a", "x")),
+            cdd_utilities.get_stable_hash(File("b", "x")),
+        )
+
+    def test_stable_between_processes(self):
+        code = (
+            "import numpy as np\n"
+            "from mutwo import cdd_utilities\n"
+            "print(cdd_utilities.get_stable_hash("
+            "{'a': np.array(['x', None], dtype=object), 'b': (1.5, 'c')}))"
+        )
+        hash_set = {
+            subprocess.run(
+                (sys.executable, "-c", code),
+                capture_output=True,
+                text=True,
+                check=True,
+                env=dict(os.environ, PYTHONHASHSEED=str(seed)),
+            ).stdout
+            for seed in (1, 2)
+        }
+        self.assertEqual(len(hash_set), 1)
+
+
+class GetFileHashTest(unittest.TestCase):
+    def test_content(self):
+        with tempfile.TemporaryDirectory() as directory_path:
+            path0, path1 = f"{directory_path}/0", f"{directory_path}/1"
+            for path in (path0, path1):
+                with open(path, "w") as f:
+                    f.write("content")
+            self.assertEqual(
+                cdd_utilities.get_file_hash(path0), cdd_utilities.get_file_hash(path1)
+            )
+            with open(path1, "w") as f:
+                f.write("other content")
+            self.assertNotEqual(
+                cdd_utilities.get_file_hash(path0), cdd_utilities.get_file_hash(path1)
+            )
+
+
+if __name__ == "__main__":
+    unittest.main()
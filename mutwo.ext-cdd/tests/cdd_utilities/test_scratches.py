@@ -0,0 +1,83 @@
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+
+from mutwo import cdd_utilities
+
+
+class ScratchSpaceTest(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.scratch_space = cdd_utilities.ScratchSpace(self.directory.name, 1000)
+
+    def tearDown(self):
+        self.scratch_space.cleanup()
+        self.directory.cleanup()
+
+    def test_get_path(self):
+        path0 = self.scratch_space.get_path(suffix=".wav", prefix="a_")
+        path1 = self.scratch_space.get_path(suffix=".wav", prefix="a_")
+        self.assertNotEqual(path0, path1)
+        self.assertEqual(os.path.dirname(path0), self.scratch_space.path)
+        self.assertTrue(os.path.basename(path0).startswith("a_"))
+        self.assertTrue(path0.endswith(".wav"))
+        self.assertFalse(os.path.exists(path0))
+
+    def test_maxima_size(self):
+        with open(self.scratch_space.get_path(), "wb") as f:
+            f.write(bytes(2000))
+        self.scratch_space._size_check_interval_in_seconds = 0
+        with self.assertRaises(OSError):
+            self.scratch_space.get_path()
+
+    def test_size_check_interval(self):
+        self.scratch_space.get_path()
+        with open(self.scratch_space.get_path(), "wb") as f:
+            f.write(bytes(2000))
+        # The size isn't checked again yet.
+        self.scratch_space._size_check_interval_in_seconds = 60
+        self.scratch_space.get_path()
+
+    def test_cleanup(self):
+        with open(self.scratch_space.get_path(), "w") as f:
+            f.write("content")
+        self.scratch_space.cleanup()
+        self.assertFalse(os.path.exists(self.scratch_space.path))
+        self.scratch_space = cdd_utilities.ScratchSpace(self.directory.name, 1000)
+
+    def test_scratch_space_in_use_is_kept(self):
+        scratch_space = cdd_utilities.ScratchSpace(self.directory.name, 1000)
+        try:
+            self.assertTrue(os.path.exists(self.scratch_space.path))
+        finally:
+            scratch_space.cleanup()
+
+    def test_orphaned_scratch_space_is_removed(self):
+        # The process ends without removing its scratch space.
+        code = (
+            "import os\n"
+            "from mutwo import cdd_utilities\n"
+            "scratch_space = cdd_utilities.ScratchSpace(os.environ['DIRECTORY'], 1)\n"
+            "print(scratch_space.path)\n"
+            "os._exit(0)"
+        )
+        orphaned_path = subprocess.run(
+            (sys.executable, "-c", code),
+            capture_output=True,
+            text=True,
+            check=True,
+            env=dict(os.environ, DIRECTORY=self.directory.name),
+        ).stdout.strip()
+        self.assertTrue(os.path.exists(orphaned_path))
+        scratch_space = cdd_utilities.ScratchSpace(self.directory.name, 1000)
+        try:
+            self.assertFalse(os.path.exists(orphaned_path))
+            self.assertTrue(os.path.exists(self.scratch_space.path))
+        finally:
+            scratch_space.cleanup()
+
+
+if __name__ == "__main__":
+    unittest.main()